@@ -0,0 +1,67 @@
+"""
+Measures how long a fresh python process takes to import clearskies and serve its first request.
+
+Each run happens in a new interpreter (so nothing is already imported), and reports three numbers:
+
+ 1. import: the time to `import clearskies`
+ 2. build: the time to build a WSGI context for a simple callable
+ 3. first request: the time to handle the first request with that context
+
+Usage:
+
+```
+python benchmarks/cold_start.py [number_of_runs]
+```
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+single_run = """
+import io
+import json
+import time
+
+start = time.perf_counter()
+import clearskies
+
+imported = time.perf_counter()
+wsgi = clearskies.contexts.wsgi(
+    {
+        "handler_class": clearskies.handlers.Callable,
+        "handler_config": {
+            "callable": lambda: {"hello": "world"},
+            "authentication": clearskies.authentication.public(),
+        },
+    }
+)
+built = time.perf_counter()
+environment = {"REQUEST_METHOD": "GET", "PATH_INFO": "/", "wsgi.input": io.BytesIO(b"")}
+b"".join(wsgi(environment, lambda status, headers: None))
+responded = time.perf_counter()
+print(json.dumps({"import": imported - start, "build": built - imported, "first request": responded - built}))
+"""
+
+
+def main():
+    number_of_runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    source_directory = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    environment = {**os.environ, "PYTHONPATH": source_directory}
+    results = []
+    for run in range(number_of_runs):
+        output = subprocess.run(
+            [sys.executable, "-c", single_run], env=environment, capture_output=True, check=True, text=True
+        )
+        results.append(json.loads(output.stdout))
+
+    for name in ["import", "build", "first request"]:
+        times = [result[name] * 1000 for result in results]
+        print(f"{name:>14}: median {statistics.median(times):7.1f}ms, max {max(times):7.1f}ms")
+    totals = [sum(result.values()) * 1000 for result in results]
+    print(f"{'total':>14}: median {statistics.median(totals):7.1f}ms, max {max(totals):7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Measures how long it takes to save and load the MemoryBackend with `snapshot()` and `restore()`.
+
+A table is filled with fake users (with a hash index and a range index), and then each run reports:
+
+ 1. create: the time to create the records one at a time, which is what a restore replaces
+ 2. snapshot: the time to write the snapshot
+ 3. restore: the time to load the snapshot into a fresh MemoryBackend
+ 4. first query: the time for the first query after the restore (which checks the table against its model)
+
+The restore unpickles every row and index, so its time grows with the size of the snapshot.  Compare runs with
+different numbers of records to see how much.
+
+Usage:
+
+```
+python benchmarks/snapshot_restore.py [number_of_records] [number_of_runs]
+```
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import clearskies
+
+
+class User(clearskies.Model):
+    def __init__(self, memory_backend, columns):
+        super().__init__(memory_backend, columns)
+
+    def columns_configuration(self):
+        return OrderedDict(
+            [
+                ("name", {"class": clearskies.column_types.String}),
+                ("email", {"class": clearskies.column_types.String}),
+                ("age", {"class": clearskies.column_types.Integer}),
+            ]
+        )
+
+
+def single_run(number_of_records, path):
+    users = clearskies.di.StandardDependencies().build(User)
+    memory_backend = users._backend
+    memory_backend.create_index(users, "email")
+    memory_backend.create_range_index(users, "age")
+
+    start = time.perf_counter()
+    for id in range(number_of_records):
+        memory_backend.create({"name": f"user {id}", "email": f"{id}@example.com", "age": id % 100}, users)
+    created = time.perf_counter()
+    memory_backend.snapshot(path)
+    saved = time.perf_counter()
+    restored = clearskies.backends.MemoryBackend()
+    restored.restore(path)
+    loaded = time.perf_counter()
+    configuration = {
+        "table_name": "users",
+        "wheres": [{"column": "email", "operator": "=", "values": ["5@example.com"]}],
+    }
+    restored.records(configuration, users)
+    queried = time.perf_counter()
+
+    return {
+        "create": created - start,
+        "snapshot": saved - created,
+        "restore": loaded - saved,
+        "first query": queried - loaded,
+    }
+
+
+def main():
+    number_of_records = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    number_of_runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "snapshot")
+        for run in range(number_of_runs):
+            results.append(single_run(number_of_records, path))
+        size = os.path.getsize(path)
+
+    print(f"{number_of_records} records, snapshot size {size / 1024 / 1024:.1f}MB")
+    for name in ["create", "snapshot", "restore", "first query"]:
+        times = [result[name] * 1000 for result in results]
+        print(f"{name:>14}: median {statistics.median(times):7.1f}ms, max {max(times):7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
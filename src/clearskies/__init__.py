@@ -1,25 +1,72 @@
-from .columns import Columns
-from . import (
-    authentication,
-    autodoc,
-    backends,
-    column_types,
-    contexts,
-    decorators,
-    di,
-    functional,
-    handlers,
-    input_requirements,
-    mocks,
-    secrets,
-    security_headers,
-)
-from .condition_parser import ConditionParser
-from .environment import Environment
-from .models import Models
-from .model import Model
-from .binding_config import BindingConfig
-from .application import Application
+import importlib
+from typing import TYPE_CHECKING
+
+# The subpackages (and the heavier dependencies that they pull in) are only imported when they are first used,
+# so that simple applications don't pay for everything at start up.
+_submodules = [
+    "authentication",
+    "autodoc",
+    "backends",
+    "column_types",
+    "contexts",
+    "decorators",
+    "di",
+    "functional",
+    "handlers",
+    "input_requirements",
+    "mocks",
+    "secrets",
+    "security_headers",
+]
+_attributes = {
+    "Columns": ".columns",
+    "ConditionParser": ".condition_parser",
+    "Environment": ".environment",
+    "Models": ".models",
+    "Model": ".model",
+    "BindingConfig": ".binding_config",
+    "Application": ".application",
+}
+
+if TYPE_CHECKING:
+    from .columns import Columns
+    from . import (
+        authentication,
+        autodoc,
+        backends,
+        column_types,
+        contexts,
+        decorators,
+        di,
+        functional,
+        handlers,
+        input_requirements,
+        mocks,
+        secrets,
+        security_headers,
+    )
+    from .condition_parser import ConditionParser
+    from .environment import Environment
+    from .models import Models
+    from .model import Model
+    from .binding_config import BindingConfig
+    from .application import Application
+
+
+def __getattr__(name):
+    if name in _submodules:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _attributes:
+        value = getattr(importlib.import_module(_attributes[name], __name__), name)
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set([*globals().keys(), *__all__]))
+
 
 __all__ = [
     "Columns",
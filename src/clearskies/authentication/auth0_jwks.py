@@ -44,8 +44,9 @@ class Auth0JWKS:
             raise ClientError("Missing 'Authorization' header in request")
         if auth_header[:7].lower() != "bearer ":
             raise ClientError("Missing 'Bearer ' prefix in authorization header")
-        self.validate_jwt(auth_header[7:])
-        input_output.set_authorization_data(self.jwt_claims)
+        # the claims stay local: this authenticator is shared by every request, including concurrent ones
+        jwt_claims = self.validate_jwt(auth_header[7:])
+        input_output.set_authorization_data(jwt_claims)
         return True
 
     def set_headers_for_cors(self, cors):
@@ -63,7 +64,7 @@ class Auth0JWKS:
             raise ClientError("No matching keys found")
 
         try:
-            self.jwt_claims = self._jose_jwt.decode(
+            jwt_claims = self._jose_jwt.decode(
                 raw_jwt,
                 rsa_key,
                 algorithms=self._algorithms,
@@ -76,7 +77,7 @@ class Auth0JWKS:
             raise ClientError("JWT has incorrect claims: double check the audience and issuer")
         except Exception:
             raise ClientError("Unable to parse JWT")
-        return True
+        return jwt_claims
 
     def _get_jwks(self):
         now = datetime.datetime.now()
@@ -86,16 +87,23 @@ class Auth0JWKS:
 
         return self._jwks
 
-    def authorize(self, authorization):
-        # we're either passed in a callable, which we pass our claims to, or a dictionary with key/value pairs
-        # that we check against our claims
+    def authorize(self, authorization, authorization_data=None):
+        """
+        Checks the JWT claims (i.e. the authorization data from input_output.get_authorization_data()) against the
+        authorization, which can be either a callable that is passed the claims, or a dictionary of key/value pairs
+        that must all be present in the claims.
+        """
+        if authorization_data is None:
+            raise ValueError(
+                f"{self.__class__.__name__}.authorize requires the authorization data (the JWT claims) for the request"
+            )
         if callable(authorization):
-            return authorization(self.jwt_claims)
+            return authorization(authorization_data)
 
         for key, value in authorization.items():
-            if key not in self.jwt_claims:
+            if key not in authorization_data:
                 return False
-            if value != self.jwt_claims[key]:
+            if value != authorization_data[key]:
                 return False
         return True
 
@@ -1,5 +1,6 @@
 from ..handlers.exceptions import ClientError
 from .auth0_jwks import Auth0JWKS
+import threading
 import unittest
 from unittest.mock import MagicMock
 from types import SimpleNamespace
@@ -33,6 +34,44 @@ class Auth0JWKSTest(unittest.TestCase):
         )
         input_output.set_authorization_data.assert_called_with({"id": 5})
 
+    def test_concurrent_requests(self):
+        # both threads decode their JWT at the same time, so they overlap for the rest of authentication
+        barrier = threading.Barrier(2)
+
+        def decode(raw_jwt, *args, **kwargs):
+            barrier.wait(timeout=5)
+            return {"sub": raw_jwt}
+
+        self.jose_jwt.decode = decode
+        auth0_jwks = Auth0JWKS("environment", self.requests, self.jose_jwt)
+        auth0_jwks.configure(auth0_domain="example.com", audience="sup")
+        authorization_data = {}
+
+        def authenticate(user):
+            for i in range(50):
+                input_output = SimpleNamespace(
+                    get_request_header=lambda *args: f"Bearer {user}",
+                    set_authorization_data=lambda data: authorization_data.setdefault(user, []).append(data["sub"]),
+                )
+                auth0_jwks.authenticate(input_output)
+
+        threads = [threading.Thread(target=authenticate, args=(user,)) for user in ["alice", "bob"]]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual({"alice": ["alice"] * 50, "bob": ["bob"] * 50}, authorization_data)
+        self.assertFalse(hasattr(auth0_jwks, "jwt_claims"))
+
+    def test_authorize(self):
+        auth0_jwks = Auth0JWKS("environment", self.requests, self.jose_jwt)
+        auth0_jwks.configure(auth0_domain="example.com", audience="sup")
+        self.assertTrue(auth0_jwks.authorize({"id": 5}, {"id": 5, "name": "bob"}))
+        self.assertFalse(auth0_jwks.authorize({"id": 6}, {"id": 5}))
+        self.assertTrue(auth0_jwks.authorize(lambda claims: claims["id"] == 5, {"id": 5}))
+        with self.assertRaises(ValueError):
+            auth0_jwks.authorize({"id": 5})
+
     def test_key_mismatch(self):
         self.jose_jwt.get_unverified_header = lambda jwt: {"kid": 5}
         auth0_jwks = Auth0JWKS("environment", self.requests, self.jose_jwt)
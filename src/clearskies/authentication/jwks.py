@@ -38,8 +38,9 @@ class JWKS(Auth0JWKS):
             raise ClientError("Missing 'Authorization' header in request")
         if auth_header[:7].lower() != "bearer ":
             raise ClientError("Missing 'Bearer ' prefix in authorization header")
-        self.validate_jwt(auth_header[7:])
-        input_output.set_authorization_data(self.jwt_claims)
+        # the claims stay local: this authenticator is shared by every request, including concurrent ones
+        jwt_claims = self.validate_jwt(auth_header[7:])
+        input_output.set_authorization_data(jwt_claims)
         return True
 
     def validate_jwt(self, raw_jwt):
@@ -54,7 +55,7 @@ class JWKS(Auth0JWKS):
             raise ClientError("No matching keys found")
 
         try:
-            self.jwt_claims = self._jose_jwt.decode(
+            jwt_claims = self._jose_jwt.decode(
                 raw_jwt,
                 rsa_key,
                 audience=self._audience,
@@ -67,7 +68,7 @@ class JWKS(Auth0JWKS):
             raise ClientError("JWT has incorrect claims: double check the audience and issuer")
         except Exception:
             raise ClientError("Unable to parse JWT")
-        return True
+        return jwt_claims
 
     def _get_jwks(self):
         now = datetime.datetime.now()
@@ -26,15 +26,15 @@ class JWKSJwCrypto(jwks.JWKS):
 
         try:
             client_jwt.validate(keys)
-            self.jwt_claims = json.loads(client_jwt.claims)
+            jwt_claims = json.loads(client_jwt.claims)
         except JWException as e:
             raise ClientError(str(e))
 
-        if self._issuer and self.jwt_claims.get("iss") != self._issuer:
+        if self._issuer and jwt_claims.get("iss") != self._issuer:
             raise ClientError("Issuer does not match")
 
         if self._audience:
-            jwt_audience = self.jwt_claims.get("aud")
+            jwt_audience = jwt_claims.get("aud")
             if not jwt_audience:
                 raise ClientError("Audience does not match")
             if isinstance(jwt_audience, str):
@@ -48,4 +48,4 @@ class JWKSJwCrypto(jwks.JWKS):
             if not has_match:
                 raise ClientError("Audience does not match")
 
-        return True
+        return jwt_claims
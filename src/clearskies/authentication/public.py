@@ -16,7 +16,7 @@ class Public:
     def authenticate(self, input_output):
         return True
 
-    def authorize(self, authorization):
+    def authorize(self, authorization, authorization_data=None):
         raise ValueError("Public endpoints do not support authorization")
 
     def set_headers_for_cors(self, cors):
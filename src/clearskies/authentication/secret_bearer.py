@@ -59,7 +59,7 @@ class SecretBearer:
         self._logging.debug("Authentication failure due to secret mismatch")
         return False
 
-    def authorize(self, authorization):
+    def authorize(self, authorization, authorization_data=None):
         raise ValueError("SecretBearer does not support authorization")
 
     def set_headers_for_cors(self, cors):
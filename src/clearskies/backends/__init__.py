@@ -2,6 +2,7 @@ from .. import binding_config
 from .api_backend import ApiBackend
 from .api_get_only_backend import ApiGetOnlyBackend
 from .backend import Backend
+from .connection_pool import ConnectionPool, PooledCursor
 from .cursor_backend import CursorBackend
 from .example_backend import ExampleBackend
 from .file_backend import FileBackend
@@ -19,12 +20,14 @@ __all__ = [
     "ApiBackend",
     "ApiGetOnlyBackend",
     "Backend",
+    "ConnectionPool",
     "CursorBackend",
     "ExampleBackend",
     "example_backend",
     "FileBackend",
     "JsonBackend",
     "MemoryBackend",
+    "PooledCursor",
     "RestfulApiAdvancedSearchBackend",
     "SecretsBackend",
 ]
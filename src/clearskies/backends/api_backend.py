@@ -260,6 +260,11 @@ class ApiBackend(Backend):
             return value
         return super().column_from_backend(column, value)
 
+    def columns_from_backend(self, column, values):
+        if isinstance(column, JSON):
+            return values
+        return super().columns_from_backend(column, values)
+
     def column_to_backend(self, column, backend_data):
         """
         We have a couple columns we want to override transformations for
@@ -1,11 +1,15 @@
 from abc import ABC, abstractmethod
+import base64
 import inspect
+import json
 from .. import model
-from typing import Any, Callable, Dict, List, Tuple, Type, Union
+from ..autodoc.schema import String as AutoDocString
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Type, Union
 
 
 class Backend(ABC):
     supports_n_plus_one = False
+    keyset_pagination = False
 
     @abstractmethod
     def update(self, id: str, data: Dict[str, Any], model: model.Model) -> Dict[str, Any]:
@@ -28,6 +32,33 @@ class Backend(ABC):
         """
         pass
 
+    def bulk_create(self, rows: List[Dict[str, Any]], model: model.Model) -> List[Dict[str, Any]]:
+        """
+        Creates a record for each data dictionary and returns the new records, in the same order
+
+        By default this just calls self.create for each row, but backends that can write many records at once
+        should override it.
+        """
+        return [self.create(data, model) for data in rows]
+
+    def bulk_update(self, updates: List[Tuple[str, Dict[str, Any]]], model: model.Model) -> List[Dict[str, Any]]:
+        """
+        Updates many records at once and returns the updated records, in the same order
+
+        updates should be a list of (id, data) tuples.  By default this just calls self.update for each one.
+        """
+        return [self.update(id, data, model) for (id, data) in updates]
+
+    def bulk_delete(self, ids: List[str], model: model.Model) -> bool:
+        """
+        Deletes the records with the given ids
+
+        By default this just calls self.delete for each id.
+        """
+        for id in ids:
+            self.delete(id, model)
+        return True
+
     @abstractmethod
     def count(self, configuration: Dict[str, Any], model: model.Model) -> int:
         """
@@ -48,6 +79,22 @@ class Backend(ABC):
         """
         pass
 
+    def records_iterator(
+        self,
+        configuration: Dict[str, Any],
+        model: model.Model,
+        next_page_data: Dict[str, str] = None,
+        batch_size: int = 100,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Returns an iterator over the records that match the given query configuration
+
+        This is used when streaming results.  By default it just wraps self.records, but backends that can pull
+        records from the underlying store a batch at a time (rather than loading everything into memory up front)
+        should override it.  Note that next_page_data won't be populated until the iterator is exhausted.
+        """
+        return iter(self.records(configuration, model, next_page_data=next_page_data))
+
     @abstractmethod
     def validate_pagination_kwargs(self, kwargs: Dict[str, Any]) -> str:
         """
@@ -152,6 +199,15 @@ class Backend(ABC):
         """
         return column.from_backend(value)
 
+    def columns_from_backend(self, column, values):
+        """
+        Manages transformations from the backend for many values of the same column at once
+
+        This is used to convert a column for a whole page of results in one go, and should transform each value the
+        same way as `column_from_backend`.
+        """
+        return column.from_backend_many(values)
+
     def column_to_backend(self, column, backend_data):
         """
         Manages transformations to the backend
@@ -165,3 +221,106 @@ class Backend(ABC):
         in case it needs to make changes.
         """
         return column.to_backend(backend_data)
+
+    def keyset_sorts(self, sorts: List[Dict[str, Any]], table_name: str, id_column_name: str) -> List[Dict[str, Any]]:
+        """
+        Returns the list of sorts to use with keyset pagination.
+
+        Keyset pagination needs a strict ordering, so the id column is added as a final tie-breaker (unless it is
+        already being sorted on).
+        """
+        sorts = [*sorts] if sorts else []
+        for sort in sorts:
+            if sort["column"] == id_column_name and sort.get("table") in [None, "", table_name]:
+                return sorts
+        return [*sorts, {"table": None, "column": id_column_name, "direction": "ASC"}]
+
+    def keyset_token(self, row: Dict[str, Any], sorts: List[Dict[str, Any]]) -> str:
+        """
+        Returns the opaque token that points to the records after the given row, for the given sorts.
+        """
+        values = []
+        for sort in sorts:
+            if sort["column"] not in row:
+                raise ValueError(
+                    f"Cannot build a keyset pagination token because the sort column '{sort['column']}' is missing "
+                    + "from the results.  Keyset pagination only supports sorting on columns from the main table."
+                )
+            values.append(row[sort["column"]])
+        token_data = {"columns": [sort["column"] for sort in sorts], "values": values}
+        return base64.urlsafe_b64encode(json.dumps(token_data, default=str).encode("utf-8")).decode("utf-8")
+
+    def keyset_values(self, token: str, sorts: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Unpacks a keyset pagination token and returns the values of the last row, in the same order as the sorts
+        """
+        token_data = self._decode_keyset_token(token)
+        if not self._keyset_token_matches(token_data, sorts):
+            raise ValueError(
+                "The keyset pagination token does not match the current sort.  Tokens can only be used with the "
+                + "same sort that they were created for."
+            )
+        return token_data["values"]
+
+    def _keyset_token_matches(self, token_data, sorts):
+        return token_data is not None and token_data["columns"] == [sort["column"] for sort in sorts]
+
+    def _decode_keyset_token(self, token):
+        try:
+            token_data = json.loads(base64.urlsafe_b64decode(str(token).encode("utf-8")))
+        except ValueError:
+            return None
+        if type(token_data) != dict or type(token_data.get("columns")) != list:
+            return None
+        if type(token_data.get("values")) != list or len(token_data["columns"]) != len(token_data["values"]):
+            return None
+        return token_data
+
+    def validate_keyset_pagination_kwargs(self, kwargs: Dict[str, Any], case_mapping: Callable) -> str:
+        key_name = case_mapping("after")
+        extra_keys = set(kwargs.keys()) - set(["after"])
+        if len(extra_keys):
+            return "Invalid pagination key(s): '" + "','".join(extra_keys) + f"'.  Only '{key_name}' is allowed"
+        if "after" not in kwargs:
+            return f"You must specify '{key_name}' when setting pagination"
+        if self._decode_keyset_token(kwargs["after"]) is None:
+            return f"Invalid pagination data: '{key_name}' is not a valid pagination token"
+        return ""
+
+    def validate_pagination_sorts(
+        self,
+        kwargs: Dict[str, Any],
+        sorts: List[Dict[str, Any]],
+        table_name: str,
+        id_column_name: str,
+        case_mapping: Callable,
+    ) -> str:
+        """
+        Checks that the pagination data can be used with the given sorts.
+
+        This only matters for keyset pagination, where the token has to come from a query with the same sort.
+        Returns a string with an error message, or an empty string if the data can be used.
+        """
+        if not self.keyset_pagination or "after" not in kwargs:
+            return ""
+        token_data = self._decode_keyset_token(kwargs["after"])
+        if self._keyset_token_matches(token_data, self.keyset_sorts(sorts, table_name, id_column_name)):
+            return ""
+        return (
+            f"Invalid pagination data: '{case_mapping('after')}' does not match the current sort.  Pagination tokens "
+            + "can only be used with the same sort that they were created for."
+        )
+
+    def documentation_keyset_pagination_next_page_response(self, case_mapping: Callable) -> List[Any]:
+        return [AutoDocString(case_mapping("after"), example="eyJjb2x1bW5zIjogWyJpZCJdLCAidmFsdWVzIjogWzVdfQ==")]
+
+    def documentation_keyset_pagination_next_page_example(self, case_mapping: Callable) -> Dict[str, Any]:
+        return {case_mapping("after"): "eyJjb2x1bW5zIjogWyJpZCJdLCAidmFsdWVzIjogWzVdfQ=="}
+
+    def documentation_keyset_pagination_parameters(self, case_mapping: Callable) -> List[Tuple[Any]]:
+        return [
+            (
+                AutoDocString(case_mapping("after"), example="eyJjb2x1bW5zIjogWyJpZCJdLCAidmFsdWVzIjogWzVdfQ=="),
+                "The pagination token from the previous page of results, to fetch the records that come after it",
+            )
+        ]
@@ -0,0 +1,238 @@
+import threading
+import time
+import weakref
+
+
+class ConnectionPool:
+    """
+    A thread-safe pool of database connections.
+
+    Each thread checks out (at most) one connection at a time with `connection()` and hands it back with `release()`.
+    Connections are health-checked (via `ping()`) when they are checked out, closed once they have been open for
+    longer than `max_lifetime` seconds, and idle connections are closed after `max_idle_time` seconds, although
+    `min_size` connections are always kept around.  If `max_size` connections are already checked out, then
+    checking out another one waits up to `checkout_timeout` seconds before giving up.
+
+    `connect` should be a function that returns a new connection.
+    """
+
+    _pools = weakref.WeakSet()
+
+    def __init__(
+        self, connect, min_size=0, max_size=10, max_lifetime=3600, max_idle_time=300, checkout_timeout=10, clock=None
+    ):
+        if max_size < 1:
+            raise ValueError("max_size for a ConnectionPool must be at least 1")
+        if min_size < 0 or min_size > max_size:
+            raise ValueError("min_size for a ConnectionPool must be between 0 and max_size")
+
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.max_idle_time = max_idle_time
+        self.checkout_timeout = checkout_timeout
+        self._clock = clock if clock is not None else time.monotonic
+        self._condition = threading.Condition()
+        self._idle = []
+        self._in_use = {}
+        self._size = 0
+        self._local = threading.local()
+        ConnectionPool._pools.add(self)
+
+    @property
+    def size(self):
+        """The total number of open connections, both idle and checked out."""
+        return self._size
+
+    @property
+    def idle_size(self):
+        return len(self._idle)
+
+    def connection(self):
+        """
+        Returns the connection checked out by the current thread, checking one out if necessary.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self.checkout()
+            self._local.connection = connection
+        return connection
+
+    def release(self):
+        """
+        Returns the connection checked out by the current thread (if any) to the pool.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            return
+        self._local.connection = None
+        self.checkin(connection)
+
+    @classmethod
+    def release_all(cls):
+        """
+        Returns the connections checked out by the current thread to every pool.
+
+        This is called by the WSGI context when it finishes a request.
+        """
+        for pool in list(cls._pools):
+            pool.release()
+
+    def checkout(self):
+        deadline = self._clock() + self.checkout_timeout
+        while True:
+            with self._condition:
+                idle = self._reserve(deadline)
+            if idle is None:
+                return self._open()
+
+            [connection, created_at] = idle
+            if self._is_healthy(connection):
+                with self._condition:
+                    self._in_use[id(connection)] = created_at
+                return connection
+            with self._condition:
+                self._discard(connection)
+
+    def checkin(self, connection):
+        with self._condition:
+            created_at = self._in_use.pop(id(connection), None)
+            if created_at is None:
+                raise ValueError("Cannot check in a connection that was not checked out from this pool")
+            if self._is_expired(created_at):
+                self._discard(connection)
+            else:
+                self._idle.append([connection, created_at, self._clock()])
+            self._evict_idle()
+            self._condition.notify()
+
+    def close(self):
+        """
+        Closes all idle connections.  Connections that are checked out are closed when they are checked back in.
+        """
+        with self._condition:
+            for [connection, created_at, last_used_at] in self._idle:
+                self._discard(connection)
+            self._idle = []
+            # this way any connections that are still checked out get closed when they are checked back in
+            self.max_lifetime = 0
+
+    def _reserve(self, deadline):
+        """
+        Returns an idle connection (and when it was created) or None after reserving room for a new connection.
+
+        Must be called while holding the lock.
+        """
+        while True:
+            self._evict_idle()
+            while self._idle:
+                [connection, created_at, last_used_at] = self._idle.pop()
+                if self._is_expired(created_at):
+                    self._discard(connection)
+                    continue
+                return [connection, created_at]
+
+            if self._size < self.max_size:
+                self._size += 1
+                return None
+
+            remaining = deadline - self._clock()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"Timed out waiting for a database connection: all {self.max_size} connections are in use"
+                )
+            self._condition.wait(remaining)
+
+    def _open(self):
+        # connecting can be slow (especially with TLS), so this happens outside of the lock
+        try:
+            connection = self._connect()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._in_use[id(connection)] = self._clock()
+        return connection
+
+    def _is_healthy(self, connection):
+        if not hasattr(connection, "ping"):
+            return True
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    def _is_expired(self, created_at):
+        return self._clock() - created_at >= self.max_lifetime
+
+    def _evict_idle(self):
+        now = self._clock()
+        keep = []
+        # the idle list goes from least to most recently used, so the connections idle the longest go first
+        for idle in self._idle:
+            if self._size > self.min_size and now - idle[2] >= self.max_idle_time:
+                self._discard(idle[0])
+                continue
+            keep.append(idle)
+        self._idle = keep
+
+    def _discard(self, connection):
+        self._size -= 1
+        self._condition.notify()
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+class PooledCursor:
+    """
+    A cursor that runs each query on the connection that the current thread has checked out of a ConnectionPool.
+
+    This can stand in for the cursor that CursorBackend uses, so that concurrent requests never share a connection:
+
+    ```
+    clearskies.contexts.wsgi(application, bindings={"cursor": clearskies.backends.PooledCursor})
+    ```
+    """
+
+    def __init__(self, connection_pool):
+        self._connection_pool = connection_pool
+        self._local = threading.local()
+
+    def _cursor(self):
+        connection = self._connection_pool.connection()
+        if getattr(self._local, "connection", None) is not connection:
+            self._local.connection = connection
+            self._local.cursor = connection.cursor()
+        return self._local.cursor
+
+    def execute(self, *args, **kwargs):
+        return self._cursor().execute(*args, **kwargs)
+
+    def executemany(self, *args, **kwargs):
+        return self._cursor().executemany(*args, **kwargs)
+
+    def fetchone(self):
+        return self._cursor().fetchone()
+
+    def fetchmany(self, *args, **kwargs):
+        return self._cursor().fetchmany(*args, **kwargs)
+
+    def fetchall(self):
+        return self._cursor().fetchall()
+
+    @property
+    def lastrowid(self):
+        return self._cursor().lastrowid
+
+    @property
+    def rowcount(self):
+        return self._cursor().rowcount
+
+    def __iter__(self):
+        return iter(self._cursor())
@@ -0,0 +1,82 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+from .connection_pool import ConnectionPool, PooledCursor
+
+
+class ConnectionPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.now = 0
+        self.connections = []
+
+        def connect():
+            connection = MagicMock()
+            self.connections.append(connection)
+            return connection
+
+        self.connect = connect
+
+    def build_pool(self, **kwargs):
+        return ConnectionPool(self.connect, clock=lambda: self.now, **kwargs)
+
+    def test_reuse(self):
+        pool = self.build_pool()
+        connection = pool.connection()
+        self.assertIs(connection, pool.connection())
+        pool.release()
+        self.assertEqual(1, pool.idle_size)
+        self.assertIs(connection, pool.connection())
+        connection.ping.assert_called_with(reconnect=False)
+        self.assertEqual(1, len(self.connections))
+
+    def test_health_check(self):
+        pool = self.build_pool()
+        connection = pool.checkout()
+        pool.checkin(connection)
+        connection.ping.side_effect = Exception("gone away")
+        new_connection = pool.checkout()
+        self.assertIsNot(connection, new_connection)
+        connection.close.assert_called()
+        self.assertEqual(1, pool.size)
+
+    def test_max_lifetime_and_idle_eviction(self):
+        pool = self.build_pool(min_size=1, max_lifetime=100, max_idle_time=10)
+        first = pool.checkout()
+        second = pool.checkout()
+        pool.checkin(first)
+        pool.checkin(second)
+        self.assertEqual(2, pool.idle_size)
+
+        # both are idle, but we keep min_size around
+        self.now = 20
+        self.assertIs(second, pool.checkout())
+        first.close.assert_called()
+        self.assertEqual(1, pool.size)
+
+        # and the remaining one is closed when it is too old
+        self.now = 100
+        pool.checkin(second)
+        second.close.assert_called()
+        self.assertEqual(0, pool.size)
+
+    def test_max_size(self):
+        pool = self.build_pool(max_size=1, checkout_timeout=0)
+        connection = pool.checkout()
+        with self.assertRaises(TimeoutError):
+            pool.checkout()
+        pool.checkin(connection)
+        self.assertIs(connection, pool.checkout())
+
+    def test_one_connection_per_thread(self):
+        pool = ConnectionPool(self.connect)
+        cursor = PooledCursor(pool)
+        cursor.execute("SELECT 1")
+        thread = threading.Thread(target=lambda: cursor.execute("SELECT 2"))
+        thread.start()
+        thread.join()
+        self.assertEqual(2, len(self.connections))
+        self.connections[0].cursor.return_value.execute.assert_called_with("SELECT 1")
+        self.connections[1].cursor.return_value.execute.assert_called_with("SELECT 2")
+
+        ConnectionPool.release_all()
+        self.assertEqual(1, pool.idle_size)
@@ -1,12 +1,21 @@
 from .backend import Backend
-from typing import Any, Callable, Dict, List, Tuple
+from collections import OrderedDict
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Tuple
 from ..autodoc.schema import Integer as AutoDocInteger
 from .. import model
 
 
 class CursorBackend(Backend):
     supports_n_plus_one = True
+    bulk_batch_size = 1000
+    sql_cache_size = 256
+    sql_cache_hits = 0
+    sql_cache_misses = 0
+    _sql_cache = None
+    _sql_cache_lock = None
     _cursor = None
+    _streaming_connection_pool = None
 
     _allowed_configs = [
         "table_name",
@@ -25,8 +34,13 @@ class CursorBackend(Backend):
         "table_name",
     ]
 
-    def __init__(self, cursor):
+    def __init__(self, cursor, streaming_connection_pool=None):
         self._cursor = cursor
+        self._streaming_connection_pool = streaming_connection_pool
+        self._sql_cache = OrderedDict()
+        self._sql_cache_lock = threading.Lock()
+        self.sql_cache_hits = 0
+        self.sql_cache_misses = 0
         from .. import ConditionParser
 
         self.condition_parser = ConditionParser()
@@ -61,6 +75,8 @@ class CursorBackend(Backend):
         self._cursor.execute(
             f"UPDATE {table_name} SET {updates} WHERE {model.id_column_name}=%s", tuple([*parameters, id])
         )
+        if not self._should_read_after_write(model):
+            return {**model.data, **data}
 
         results = self.records(
             {
@@ -91,6 +107,8 @@ class CursorBackend(Backend):
             new_id = self._cursor.lastrowid
         if not new_id:
             raise ValueError("I can't figure out what the id is for a newly created record :(")
+        if not self._should_read_after_write(model):
+            return {**data, model.id_column_name: new_id}
 
         results = self.records(
             {
@@ -114,6 +132,91 @@ class CursorBackend(Backend):
         self._cursor.execute(f"DELETE FROM {table_name} WHERE {model.id_column_name}=%s", (id,))
         return True
 
+    def bulk_create(self, rows, model):
+        results = [None] * len(rows)
+        batches = {}
+        for index, data in enumerate(rows):
+            # we need the id up front to find the new records again, so auto-incrementing ids are inserted one at a time
+            if not data.get(model.id_column_name):
+                results[index] = self.create(data, model)
+                continue
+            batches.setdefault(tuple(data.keys()), []).append(index)
+
+        escape = self._column_escape_character()
+        table_name = self._finalize_table_name(model.table_name())
+        for column_names, indexes in batches.items():
+            columns = escape + f"{escape}, {escape}".join(column_names) + escape
+            placeholders = "(" + ", ".join(["%s" for i in range(len(column_names))]) + ")"
+            for start in range(0, len(indexes), self.bulk_batch_size):
+                batch = indexes[start : start + self.bulk_batch_size]
+                parameters = [value for index in batch for value in rows[index].values()]
+                values = ", ".join([placeholders for index in batch])
+                self._cursor.execute(f"INSERT INTO {table_name} ({columns}) VALUES {values}", tuple(parameters))
+                if not self._should_read_after_write(model):
+                    new_records = [{**rows[index]} for index in batch]
+                else:
+                    new_records = self._records_by_id([rows[index][model.id_column_name] for index in batch], model)
+                for index, record in zip(batch, new_records):
+                    results[index] = record
+        return results
+
+    def bulk_update(self, updates, model):
+        results = [None] * len(updates)
+        batches = {}
+        for index, (id, data) in enumerate(updates):
+            batches.setdefault(tuple(data.keys()), []).append(index)
+
+        escape = self._column_escape_character()
+        table_name = self._finalize_table_name(model.table_name())
+        for column_names, indexes in batches.items():
+            updates_sql = ", ".join([f"{escape}{column_name}{escape}=%s" for column_name in column_names])
+            for start in range(0, len(indexes), self.bulk_batch_size):
+                batch = indexes[start : start + self.bulk_batch_size]
+                self._cursor.executemany(
+                    f"UPDATE {table_name} SET {updates_sql} WHERE {model.id_column_name}=%s",
+                    [tuple([*updates[index][1].values(), updates[index][0]]) for index in batch],
+                )
+                new_records = self._records_by_id([updates[index][0] for index in batch], model)
+                for index, record in zip(batch, new_records):
+                    results[index] = record
+        return results
+
+    def bulk_delete(self, ids, model):
+        table_name = self._finalize_table_name(model.table_name())
+        for start in range(0, len(ids), self.bulk_batch_size):
+            batch = ids[start : start + self.bulk_batch_size]
+            placeholders = ", ".join(["%s" for id in batch])
+            self._cursor.execute(
+                f"DELETE FROM {table_name} WHERE {model.id_column_name} IN ({placeholders})", tuple(batch)
+            )
+        return True
+
+    def _should_read_after_write(self, model):
+        return getattr(model, "read_after_write", True)
+
+    def _records_by_id(self, ids, model):
+        """
+        Fetches the records with the given ids with one query, and returns them in the same order as the ids
+        """
+        placeholders = ", ".join(["%s" for id in ids])
+        records = self.records(
+            {
+                "table_name": model.table_name(),
+                "select_all": True,
+                "wheres": [
+                    {
+                        "column": model.id_column_name,
+                        "operator": "IN",
+                        "parsed": f"{model.id_column_name} IN ({placeholders})",
+                        "values": ids,
+                    }
+                ],
+            },
+            model,
+        )
+        records_by_id = {str(record[model.id_column_name]): record for record in records}
+        return [records_by_id[str(id)] for id in ids]
+
     def count(self, configuration, model):
         configuration = self._check_query_configuration(configuration)
         [query, parameters] = self.as_count_sql(configuration)
@@ -128,16 +231,131 @@ class CursorBackend(Backend):
         # I was going to get fancy and have this return an iterator, but since I'm going to load up
         # everything into a list anyway, I may as well just return the list, right?
         configuration = self._check_query_configuration(configuration)
+        if self.keyset_pagination:
+            configuration = self._configure_keyset_pagination(configuration, model)
         [query, parameters] = self.as_sql(configuration)
         self._cursor.execute(query, tuple(parameters))
         records = [row for row in self._cursor]
-        if type(next_page_data) == dict:
-            limit = configuration.get("limit", None)
-            start = configuration.get("pagination", {}).get("start", 0)
-            if limit and len(records) == limit:
-                next_page_data["start"] = int(start) + int(limit)
+        self._set_next_page_data(configuration, len(records), records[-1] if records else None, next_page_data)
         return records
 
+    def records_iterator(
+        self,
+        configuration: Dict[str, Any],
+        model: model.Model,
+        next_page_data: Dict[str, str] = None,
+        batch_size: int = 100,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Returns an iterator over the records, pulling them from the database a batch at a time.
+
+        Streaming needs its own connection: an unbuffered cursor can't run any other queries until it has read all
+        of its results, and the models run queries of their own (e.g. to preload relationships) between batches.
+        Therefore, each stream checks a connection out of the streaming connection pool, and checks it back in
+        when the iterator is exhausted or closed.  Without a streaming connection pool, all the records are
+        fetched with the main cursor up front.
+        """
+        if self._streaming_connection_pool is None:
+            return super().records_iterator(configuration, model, next_page_data=next_page_data, batch_size=batch_size)
+        configuration = self._check_query_configuration(configuration)
+        if self.keyset_pagination:
+            configuration = self._configure_keyset_pagination(configuration, model)
+        [query, parameters] = self.as_sql(configuration)
+        return self._stream(query, tuple(parameters), configuration, batch_size, next_page_data)
+
+    def _stream(self, query, parameters, configuration, batch_size, next_page_data):
+        # this is a generator, so nothing is checked out until the records are actually requested
+        connection = self._streaming_connection_pool.checkout()
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query, parameters)
+                yield from self._fetch_in_batches(cursor, configuration, batch_size, next_page_data)
+            finally:
+                # for an unbuffered cursor this also discards any results we didn't read
+                cursor.close()
+        finally:
+            self._streaming_connection_pool.checkin(connection)
+
+    def _fetch_in_batches(self, cursor, configuration, batch_size, next_page_data):
+        number_records = 0
+        last_record = None
+        while True:
+            records = cursor.fetchmany(batch_size)
+            if not records:
+                break
+            number_records += len(records)
+            last_record = records[-1]
+            yield from records
+        self._set_next_page_data(configuration, number_records, last_record, next_page_data)
+
+    def _set_next_page_data(self, configuration, number_records, last_record, next_page_data):
+        if type(next_page_data) != dict:
+            return
+        limit = configuration.get("limit", None)
+        if not limit or number_records != limit:
+            return
+        if self.keyset_pagination:
+            next_page_data["after"] = self.keyset_token(last_record, configuration["sorts"])
+            return
+        start = configuration.get("pagination", {}).get("start", 0)
+        next_page_data["start"] = int(start) + int(limit)
+
+    def _configure_keyset_pagination(self, configuration, model):
+        return {
+            **configuration,
+            "sorts": self.keyset_sorts(configuration["sorts"], configuration["table_name"], model.id_column_name),
+        }
+
+    def _keyset_condition(self, sorts, values, table_name):
+        """
+        Returns the where clause that selects the records after the keyset pagination token.
+
+        For sorts of (a ASC, b DESC) this expands to `(a>%s) OR (a=%s AND (b<%s OR b IS NULL))`, with some extra
+        care for NULL values, which MySQL places first when sorting in ascending order.  The matching parameters
+        come from _keyset_parameters.
+        """
+        or_parts = []
+        for index, sort in enumerate(sorts):
+            column = self._keyset_column_name(sort, table_name)
+            value = values[index]
+            is_ascending = sort["direction"].upper() == "ASC"
+            # nothing comes after NULL when sorting in descending order
+            if value is None and not is_ascending:
+                continue
+
+            and_parts = []
+            for previous_sort, previous_value in zip(sorts[:index], values[:index]):
+                previous_column = self._keyset_column_name(previous_sort, table_name)
+                and_parts.append(f"{previous_column} IS NULL" if previous_value is None else f"{previous_column}=%s")
+
+            if value is None:
+                and_parts.append(f"{column} IS NOT NULL")
+            elif is_ascending:
+                and_parts.append(f"{column}>%s")
+            else:
+                and_parts.append(f"({column}<%s OR {column} IS NULL)")
+            or_parts.append("(" + " AND ".join(and_parts) + ")")
+
+        if not or_parts:
+            return "1=0"
+        return "(" + " OR ".join(or_parts) + ")"
+
+    def _keyset_parameters(self, sorts, values):
+        parameters = []
+        for index, sort in enumerate(sorts):
+            if values[index] is None and sort["direction"].upper() != "ASC":
+                continue
+            parameters.extend([value for value in values[:index] if value is not None])
+            if values[index] is not None:
+                parameters.append(values[index])
+        return parameters
+
+    def _keyset_column_name(self, sort, default_table_name):
+        escape = self._column_escape_character()
+        table_name = sort.get("table") if sort.get("table") else default_table_name
+        return self._finalize_table_name(table_name) + f".{escape}{sort['column']}{escape}"
+
     def group_by_clause(self, group_by):
         if not group_by:
             return ""
@@ -150,10 +368,34 @@ class CursorBackend(Backend):
         return f" GROUP BY {escape}{table}{escape}.{escape}{column}{escape}"
 
     def as_sql(self, configuration):
+        keyset_values = None
+        if configuration["pagination"].get("after"):
+            keyset_values = self.keyset_values(configuration["pagination"]["after"], configuration["sorts"])
+
+        # the SQL only depends on the shape of the query, so we compile it once per shape and then just
+        # pull out the parameters for each query.
+        cache_key = (
+            "records",
+            self._sql_cache_key(configuration),
+            tuple([value is None for value in keyset_values]) if keyset_values is not None else None,
+        )
+        query = self._cached_sql(cache_key)
+        if query is None:
+            query = self._cache_sql(cache_key, self._compile_sql(configuration, keyset_values))
+
+        parameters = self._where_parameters(configuration["wheres"])
+        if keyset_values is not None:
+            parameters.extend(self._keyset_parameters(configuration["sorts"], keyset_values))
+        return [query, parameters]
+
+    def _compile_sql(self, configuration, keyset_values):
         escape = self._column_escape_character()
         [wheres, parameters] = self._conditions_as_wheres_and_parameters(
             configuration["wheres"], configuration["table_name"]
         )
+        if keyset_values is not None:
+            keyset_where = self._keyset_condition(configuration["sorts"], keyset_values, configuration["table_name"])
+            wheres = (f"{wheres} AND " if wheres else " WHERE ") + keyset_where
         select_parts = []
         if configuration["select_all"]:
             select_parts.append(self._finalize_table_name(configuration["table_name"]) + ".*")
@@ -177,20 +419,25 @@ class CursorBackend(Backend):
             order_by = ""
         group_by = self.group_by_clause(configuration["group_by_column"])
         limit = ""
-        if configuration["limit"]:
+        if configuration["limit"] and keyset_values is not None:
+            limit = f' LIMIT {configuration["limit"]}'
+        elif configuration["limit"]:
             start = 0
             if configuration["pagination"].get("start"):
                 start = int(configuration["pagination"]["start"])
             limit = f' LIMIT {start}, {configuration["limit"]}'
 
         table_name = self._finalize_table_name(configuration["table_name"])
-        return [
-            f"SELECT {select} FROM {table_name}{joins}{wheres}{group_by}{order_by}{limit}".strip(),
-            parameters,
-        ]
+        return f"SELECT {select} FROM {table_name}{joins}{wheres}{group_by}{order_by}{limit}".strip()
 
     def as_count_sql(self, configuration):
-        escape = self._column_escape_character()
+        cache_key = ("count", self._sql_cache_key(configuration))
+        query = self._cached_sql(cache_key)
+        if query is None:
+            query = self._cache_sql(cache_key, self._compile_count_sql(configuration))
+        return [query, self._where_parameters(configuration["wheres"])]
+
+    def _compile_count_sql(self, configuration):
         # note that this won't work if we start including a HAVING clause
         [wheres, parameters] = self._conditions_as_wheres_and_parameters(
             configuration["wheres"], configuration["table_name"]
@@ -210,7 +457,62 @@ class CursorBackend(Backend):
             query = (
                 f"SELECT COUNT(*) AS count FROM (SELECT 1 FROM {table_name}{joins}{wheres}{group_by}) AS count_inner"
             )
-        return [query, parameters]
+        return query
+
+    def _sql_cache_key(self, configuration):
+        """
+        Returns a fingerprint of everything in the query configuration that affects the SQL (but not the parameters)
+        """
+        selects = configuration["selects"]
+        return (
+            configuration["table_name"],
+            tuple(
+                [
+                    (
+                        condition.get("table"),
+                        condition["column"],
+                        condition["operator"].lower(),
+                        len(condition["values"]),
+                    )
+                    for condition in configuration["wheres"]
+                ]
+            ),
+            tuple([(sort.get("table"), sort["column"], sort["direction"]) for sort in configuration["sorts"]]),
+            configuration["group_by_column"],
+            tuple([(join.get("type"), join["raw"]) for join in configuration["joins"]]),
+            configuration["limit"],
+            configuration["pagination"].get("start"),
+            tuple(selects) if isinstance(selects, list) else selects,
+            configuration["select_all"],
+        )
+
+    def _cached_sql(self, cache_key):
+        # the backend is shared between threads, and checking + reordering the cache has to happen in one step
+        with self._sql_cache_lock:
+            query = self._sql_cache.get(cache_key)
+            if query is None:
+                self.sql_cache_misses += 1
+                return None
+            self.sql_cache_hits += 1
+            self._sql_cache.move_to_end(cache_key)
+            return query
+
+    def _cache_sql(self, cache_key, query):
+        if self.sql_cache_size:
+            with self._sql_cache_lock:
+                self._sql_cache[cache_key] = query
+                while len(self._sql_cache) > self.sql_cache_size:
+                    self._sql_cache.popitem(last=False)
+        return query
+
+    def sql_cache_info(self):
+        """
+        Returns the hit/miss counters and current size of the compiled SQL cache
+        """
+        return {"hits": self.sql_cache_hits, "misses": self.sql_cache_misses, "size": len(self._sql_cache)}
+
+    def _where_parameters(self, conditions):
+        return [value for condition in conditions for value in condition["values"]]
 
     def _conditions_as_wheres_and_parameters(self, conditions, default_table_name):
         if not conditions:
@@ -252,6 +554,8 @@ class CursorBackend(Backend):
         return configuration
 
     def validate_pagination_kwargs(self, kwargs: Dict[str, Any], case_mapping: Callable) -> str:
+        if self.keyset_pagination:
+            return self.validate_keyset_pagination_kwargs(kwargs, case_mapping)
         extra_keys = set(kwargs.keys()) - set(self.allowed_pagination_keys())
         if len(extra_keys):
             key_name = case_mapping("start")
@@ -268,15 +572,21 @@ class CursorBackend(Backend):
         return ""
 
     def allowed_pagination_keys(self) -> List[str]:
-        return ["start"]
+        return ["after"] if self.keyset_pagination else ["start"]
 
     def documentation_pagination_next_page_response(self, case_mapping: Callable) -> List[Any]:
+        if self.keyset_pagination:
+            return self.documentation_keyset_pagination_next_page_response(case_mapping)
         return [AutoDocInteger(case_mapping("start"), example=0)]
 
     def documentation_pagination_next_page_example(self, case_mapping: Callable) -> Dict[str, Any]:
+        if self.keyset_pagination:
+            return self.documentation_keyset_pagination_next_page_example(case_mapping)
         return {case_mapping("start"): 0}
 
     def documentation_pagination_parameters(self, case_mapping: Callable) -> List[Tuple[Any]]:
+        if self.keyset_pagination:
+            return self.documentation_keyset_pagination_parameters(case_mapping)
         return [
             (
                 AutoDocInteger(case_mapping("start"), example=0),
@@ -1,7 +1,10 @@
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock, call
 from .cursor_backend import CursorBackend
 from collections import OrderedDict, namedtuple
+from types import SimpleNamespace
 
 
 class CursorBackendTest(unittest.TestCase):
@@ -206,3 +209,238 @@ class CursorBackendTest(unittest.TestCase):
         )
         self.assertEqual([{"my": "data"}], results)
         self.assertEqual({"start": 6}, next_page_data)
+
+    def test_records_iterator(self):
+        streaming_cursor = type(
+            "",
+            (),
+            {
+                "execute": MagicMock(),
+                "fetchmany": MagicMock(side_effect=[[{"id": 1}, {"id": 2}], [{"id": 3}], []]),
+                "close": MagicMock(),
+            },
+        )()
+        connection = SimpleNamespace(cursor=lambda: streaming_cursor)
+        pool = SimpleNamespace(checkout=MagicMock(return_value=connection), checkin=MagicMock())
+        backend = CursorBackend(self.cursor, streaming_connection_pool=pool)
+        next_page_data = {}
+        records = backend.records_iterator(
+            {"table_name": "my_table", "select_all": True, "limit": 3, "pagination": {"start": 3}},
+            "model",
+            next_page_data=next_page_data,
+            batch_size=2,
+        )
+        # nothing is checked out until we start iterating
+        pool.checkout.assert_not_called()
+        self.assertEqual({}, next_page_data)
+        self.assertEqual([{"id": 1}, {"id": 2}, {"id": 3}], list(records))
+        streaming_cursor.execute.assert_called_with("SELECT `my_table`.* FROM `my_table` LIMIT 3, 3", ())
+        self.cursor.execute.assert_not_called()
+        streaming_cursor.fetchmany.assert_has_calls([call(2), call(2), call(2)])
+        self.assertEqual({"start": 6}, next_page_data)
+        streaming_cursor.close.assert_called_once()
+        pool.checkin.assert_called_once_with(connection)
+
+    def test_records_iterator_closed_early(self):
+        cursors = []
+
+        def make_cursor():
+            cursor = SimpleNamespace(
+                execute=MagicMock(), fetchmany=MagicMock(return_value=[{"id": 1}, {"id": 2}]), close=MagicMock()
+            )
+            cursors.append(cursor)
+            return cursor
+
+        connections = [SimpleNamespace(cursor=make_cursor), SimpleNamespace(cursor=make_cursor)]
+        pool = SimpleNamespace(checkout=MagicMock(side_effect=connections), checkin=MagicMock())
+        backend = CursorBackend(self.cursor, streaming_connection_pool=pool)
+        configuration = {"table_name": "my_table", "select_all": True}
+
+        # two streams at once each get their own connection
+        first = backend.records_iterator({**configuration}, "model", batch_size=2)
+        second = backend.records_iterator({**configuration}, "model", batch_size=2)
+        self.assertEqual({"id": 1}, next(first))
+        self.assertEqual({"id": 1}, next(second))
+        self.assertEqual(2, len(cursors))
+        first.close()
+        cursors[0].close.assert_called_once()
+        pool.checkin.assert_called_once_with(connections[0])
+        second.close()
+        pool.checkin.assert_called_with(connections[1])
+
+    def test_records_iterator_without_streaming_pool(self):
+        # without a streaming connection, everything is read from the main cursor before we return, so that
+        # other queries (like relationship preloads) can't interfere with the results
+        rows = iter([{"id": 1}, {"id": 2}])
+        self.cursor.__class__.__iter__ = lambda cursor: rows
+        records = self.backend.records_iterator({"table_name": "my_table", "select_all": True}, "model", batch_size=1)
+        self.cursor.execute("SELECT preload")
+        self.assertEqual([{"id": 1}, {"id": 2}], list(records))
+
+    def test_keyset_pagination(self):
+        self.cursor = type(
+            "",
+            (),
+            {
+                "execute": MagicMock(),
+                "__iter__": lambda x: iter([{"id": 10, "name": "bob", "age": 5}]),
+            },
+        )()
+        self.backend = CursorBackend(self.cursor)
+        self.backend.keyset_pagination = True
+        next_page_data = {}
+        results = self.backend.records(
+            {
+                "table_name": "my_table",
+                "limit": 1,
+                "sorts": [{"column": "name", "direction": "ASC"}, {"column": "age", "direction": "DESC"}],
+                "select_all": True,
+            },
+            self.model,
+            next_page_data=next_page_data,
+        )
+        self.cursor.execute.assert_called_with(
+            "SELECT `my_table`.* FROM `my_table` ORDER BY `name` ASC, `age` DESC, `id` ASC LIMIT 0, 1", ()
+        )
+        self.assertEqual(["after"], list(next_page_data.keys()))
+
+        self.backend.records(
+            {
+                "table_name": "my_table",
+                "pagination": next_page_data,
+                "limit": 10,
+                "sorts": [{"column": "name", "direction": "ASC"}, {"column": "age", "direction": "DESC"}],
+                "wheres": [{"values": [5], "column": "status", "operator": "=", "parsed": "status=%s"}],
+                "select_all": True,
+            },
+            self.model,
+        )
+        self.cursor.execute.assert_called_with(
+            "SELECT `my_table`.* FROM `my_table` WHERE my_table.status=%s AND ("
+            + "(`my_table`.`name`>%s) "
+            + "OR (`my_table`.`name`=%s AND (`my_table`.`age`<%s OR `my_table`.`age` IS NULL)) "
+            + "OR (`my_table`.`name`=%s AND `my_table`.`age`=%s AND `my_table`.`id`>%s)"
+            + ") ORDER BY `name` ASC, `age` DESC, `id` ASC LIMIT 10",
+            (5, "bob", "bob", 5, "bob", 5, 10),
+        )
+
+    def test_bulk_create(self):
+        self.cursor = type(
+            "",
+            (),
+            {
+                "execute": MagicMock(),
+                "lastrowid": 10,
+                "__iter__": lambda x: iter([{"id": "b", "name": "B"}, {"id": "a", "name": "A"}]),
+            },
+        )()
+        self.backend = CursorBackend(self.cursor)
+        new_records = self.backend.bulk_create([{"id": "a", "name": "A"}, {"id": "b", "name": "B"}], self.model)
+        self.cursor.execute.assert_has_calls(
+            [
+                call("INSERT INTO `my_table` (`id`, `name`) VALUES (%s, %s), (%s, %s)", ("a", "A", "b", "B")),
+                call("SELECT `my_table`.* FROM `my_table` WHERE my_table.id IN (%s, %s)", ("a", "b")),
+            ]
+        )
+        self.assertEqual([{"id": "a", "name": "A"}, {"id": "b", "name": "B"}], new_records)
+
+    def test_bulk_update(self):
+        self.cursor = type(
+            "",
+            (),
+            {
+                "execute": MagicMock(),
+                "executemany": MagicMock(),
+                "__iter__": lambda x: iter([{"id": 5, "name": "A"}, {"id": 6, "name": "B"}]),
+            },
+        )()
+        self.backend = CursorBackend(self.cursor)
+        new_records = self.backend.bulk_update([(5, {"name": "A"}), (6, {"name": "B"})], self.model)
+        self.cursor.executemany.assert_called_with("UPDATE `my_table` SET `name`=%s WHERE id=%s", [("A", 5), ("B", 6)])
+        self.cursor.execute.assert_called_with(
+            "SELECT `my_table`.* FROM `my_table` WHERE my_table.id IN (%s, %s)", (5, 6)
+        )
+        self.assertEqual([{"id": 5, "name": "A"}, {"id": 6, "name": "B"}], new_records)
+
+    def test_bulk_delete(self):
+        self.backend.bulk_delete([5, 6], self.model)
+        self.cursor.execute.assert_called_with("DELETE FROM `my_table` WHERE id IN (%s, %s)", (5, 6))
+
+    def test_sql_cache(self):
+        configuration = {
+            "table_name": "my_table",
+            "select_all": True,
+            "wheres": [{"values": [5], "column": "id", "operator": "=", "parsed": "id=%s"}],
+        }
+        self.backend.records({**configuration}, "model")
+        self.backend.records({**configuration, "wheres": [{**configuration["wheres"][0], "values": [6]}]}, "model")
+        self.cursor.execute.assert_called_with("SELECT `my_table`.* FROM `my_table` WHERE my_table.id=%s", (6,))
+        self.assertEqual({"hits": 1, "misses": 1, "size": 1}, self.backend.sql_cache_info())
+
+        # a different number of IN values is a different query
+        self.backend.records(
+            {**configuration, "wheres": [{"values": [1, 2], "column": "id", "operator": "IN", "parsed": ""}]}, "model"
+        )
+        self.cursor.execute.assert_called_with(
+            "SELECT `my_table`.* FROM `my_table` WHERE my_table.id IN (%s, %s)", (1, 2)
+        )
+        self.assertEqual({"hits": 1, "misses": 2, "size": 2}, self.backend.sql_cache_info())
+
+        self.backend.sql_cache_size = 1
+        self.backend.records({**configuration, "limit": 5}, "model")
+        self.assertEqual({"hits": 1, "misses": 3, "size": 1}, self.backend.sql_cache_info())
+
+    def test_sql_cache_threads(self):
+        class SlowCache(OrderedDict):
+            # give other threads plenty of time to evict the key while we're in the middle of using it
+            def move_to_end(self, *args, **kwargs):
+                time.sleep(0.0005)
+                return super().move_to_end(*args, **kwargs)
+
+        self.backend._sql_cache = SlowCache()
+        # a tiny cache means that keys are constantly evicted while other threads are using them
+        self.backend.sql_cache_size = 2
+        errors = []
+
+        def run_queries(thread_number):
+            try:
+                for i in range(100):
+                    configuration = self.backend._check_query_configuration(
+                        {"table_name": f"table_{(thread_number + i // 10) % 3}", "select_all": True}
+                    )
+                    self.backend.as_sql(configuration)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run_queries, args=(number,)) for number in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], errors)
+        cache_info = self.backend.sql_cache_info()
+        self.assertEqual(800, cache_info["hits"] + cache_info["misses"])
+        self.assertLessEqual(cache_info["size"], 2)
+
+    def test_skip_read_after_write(self):
+        model = type(
+            "",
+            (),
+            {
+                "table_name": lambda: "my_table",
+                "id_column_name": "id",
+                "read_after_write": False,
+                "data": {"id": 5, "hey": "there", "foo": "bar"},
+            },
+        )
+        new_data = self.backend.create({"hey": "people"}, model)
+        self.assertEqual({"id": 10, "hey": "people"}, new_data)
+        new_data = self.backend.update(5, {"hey": "sup"}, model)
+        self.assertEqual({"id": 5, "hey": "sup", "foo": "bar"}, new_data)
+        self.cursor.execute.assert_has_calls(
+            [
+                call("INSERT INTO `my_table` (`hey`) VALUES (%s)", ("people",)),
+                call("UPDATE `my_table` SET `hey`=%s WHERE id=%s", ("sup", 5)),
+            ]
+        )
+        self.assertEqual(2, self.cursor.execute.call_count)
@@ -38,6 +38,7 @@ class FileBackend(memory_backend.MemoryBackend):
 
         table._id_index = id_index
         table._rows = table_data
+        table._rebuild_indexes()
         self._tables[file_name] = table
 
     def transform_data_from_file(self, file_contents):
@@ -1,7 +1,17 @@
 from .backend import Backend
 from collections import OrderedDict
-from functools import cmp_to_key
+from collections.abc import Mapping
+import bisect
+import heapq
+import gc
 import inspect
+import math
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import zlib
 from typing import Any, Callable, Dict, List, Tuple
 from ..autodoc.schema import Integer as AutoDocInteger
 from .. import model
@@ -27,19 +37,84 @@ def gentle_float_conversion(value):
         return value
 
 
-def _sort(row_a, row_b, sorts):
-    for sort in sorts:
-        reverse = 1 if sort["direction"].lower() == "asc" else -1
-        value_a = row_a[sort["column"]] if sort["column"] in row_a else None
-        value_b = row_b[sort["column"]] if sort["column"] in row_b else None
-        if value_a == value_b:
-            continue
-        if value_a is None:
-            return -1 * reverse
-        if value_b is None:
-            return 1 * reverse
-        return reverse * (1 if value_a > value_b else -1)
-    return 0
+class _Descending:
+    """
+    Wraps a value so that it sorts in the opposite order
+    """
+
+    __slots__ = ["value"]
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __gt__(self, other):
+        return other.value > self.value
+
+
+def _sort_key(sorts, reverse=False):
+    """
+    Returns a key function to sort rows by.
+
+    NULLs come before everything else in ascending order (and so after everything else in descending order).  Set
+    reverse=True to get a key for `sorted(..., reverse=True)`, i.e. with the direction of every column flipped.
+    """
+    columns = [(sort["column"], (sort["direction"].lower() != "asc") != reverse) for sort in sorts]
+
+    def key(row):
+        parts = []
+        for column, descending in columns:
+            value = row.get(column)
+            if value is None:
+                parts.append((1,) if descending else (0,))
+            else:
+                parts.append((0, _Descending(value)) if descending else (1, value))
+        return tuple(parts)
+
+    return key
+
+
+def _sort_rows(rows, sorts, count=None):
+    """
+    Returns the rows sorted according to `sorts`.
+
+    If count is set then only the first `count` rows are returned.  When that is much less than the number of rows,
+    we pull them out with a heap instead of sorting everything.
+    """
+    # if every column goes in the same direction then we can let sorted() do the reversing, which is much cheaper
+    # than wrapping every value
+    reverse = all(sort["direction"].lower() != "asc" for sort in sorts)
+    key = _sort_key(sorts, reverse=reverse)
+    if count is not None and count * 4 < len(rows):
+        return heapq.nlargest(count, rows, key=key) if reverse else heapq.nsmallest(count, rows, key=key)
+    rows = sorted(rows, key=key, reverse=reverse)
+    return rows[:count] if count is not None else rows
+
+
+def range_check(compare):
+    # NULLs (and values that can't be compared with the search value) never match, just like in SQL.  Range indexes
+    # leave out the same values, so indexed and unindexed queries always return the same rows.
+    def builder(column, values, null):
+        search = gentle_float_conversion(values[0])
+
+        def matches(row):
+            value = row.get(column)
+            if value is None:
+                return False
+            try:
+                return compare(gentle_float_conversion(value), search)
+            except TypeError:
+                return False
+
+        return matches
+
+    return builder
+
 
 def like_check(column, values, null):
     def matches(row):
@@ -58,6 +133,46 @@ def like_check(column, values, null):
         return value == search
     return matches
 
+def in_check(column, values, null):
+    # compare as strings, just like the `=` operator
+    search = set(str(value) for value in values)
+
+    def matches(row):
+        return column in row and str(row[column]) in search
+
+    return matches
+
+
+class CompactRow(Mapping):
+    """
+    A read-only row that keeps its values in a tuple.
+
+    The column positions are shared by every row in the table, so this takes much less memory than a dictionary.
+    """
+
+    __slots__ = ["_positions", "_values"]
+
+    def __init__(self, positions, values):
+        self._positions = positions
+        self._values = values
+
+    def __getitem__(self, column_name):
+        return self._values[self._positions[column_name]]
+
+    def get(self, column_name, default=None):
+        position = self._positions.get(column_name)
+        return default if position is None else self._values[position]
+
+    def __contains__(self, column_name):
+        return column_name in self._positions
+
+    def __iter__(self):
+        return iter(self._positions)
+
+    def __len__(self):
+        return len(self._positions)
+
+
 class MemoryTable:
     _table_name = None
     _column_names = None
@@ -66,41 +181,311 @@ class MemoryTable:
     _id_index = None
     id_column_name = None
     _next_id = None
+    _indexes = None
+    _filter_counts = None
+    _sort_indexes = None
+    _sort_counts = None
+    _number_deleted = None
+    _range_indexes = None
+    _range_filter_counts = None
+    _compact_rows = False
+    _column_positions = None
+
+    # once a column has been filtered on (with `=` or `IN`) this many times, it gets a hash index automatically.
+    # Similarly, columns filtered with `<`, `>`, `<=`, or `>=` get a range index, and sorts get a sort index.
+    # Set to None to disable automatic indexes.
+    auto_index_threshold = 3
+
+    # deleted rows are left behind (as None) so that the indexes stay valid.  Once this fraction of the rows have
+    # been deleted, the table is compacted to clear them out.  Set to None to never compact automatically.
+    compaction_threshold = 0.5
 
     # here be dragons.  This is not a 100% drop-in replacement for the equivalent SQL operators
     # https://codereview.stackexchange.com/questions/259198/in-memory-table-filtering-in-python
     _operator_lambda_builders = {
         "<=>": lambda column, values, null: lambda row: row.get(column, null) == values[0],
         "!=": lambda column, values, null: lambda row: row.get(column, null) != values[0],
-        "<=": lambda column, values, null: lambda row: gentle_float_conversion(row.get(column, null))
-        <= gentle_float_conversion(values[0]),
-        ">=": lambda column, values, null: lambda row: gentle_float_conversion(row.get(column, null))
-        >= gentle_float_conversion(values[0]),
-        ">": lambda column, values, null: lambda row: gentle_float_conversion(row.get(column, null))
-        > gentle_float_conversion(values[0]),
-        "<": lambda column, values, null: lambda row: gentle_float_conversion(row.get(column, null))
-        < gentle_float_conversion(values[0]),
+        "<=": range_check(lambda value, search: value <= search),
+        ">=": range_check(lambda value, search: value >= search),
+        ">": range_check(lambda value, search: value > search),
+        "<": range_check(lambda value, search: value < search),
         "=": lambda column, values, null: lambda row: (str(row[column]) if column in row else null) == str(values[0]),
         "is not null": lambda column, values, null: lambda row: (column in row and row[column] is not None),
         "is null": lambda column, values, null: lambda row: (column not in row or row[column] is None),
         "is not": lambda column, values, null: lambda row: row.get(column, null) != values[0],
         "is": lambda column, values, null: lambda row: row.get(column, null) == str(values[0]),
         "like": like_check,
-        "in": lambda column, values, null: lambda row: row.get(column, null) in values,
+        "in": in_check,
     }
+    _range_operators = ["<", ">", "<=", ">="]
+
+    def __init__(self, model, compact_rows=False):
+        self._initialize(model.table_name(), self._model_column_names(model), model.id_column_name, compact_rows)
+        self.create_index(self.id_column_name)
 
-    def __init__(self, model):
+    def _initialize(self, table_name, column_names, id_column_name, compact_rows):
         self.null = Null()
-        self._column_names = []
+        self._table_name = table_name
+        self._column_names = column_names
+        self.id_column_name = id_column_name
+        self._compact_rows = compact_rows
+        self._column_positions = {column_name: index for (index, column_name) in enumerate(self._column_names)}
         self._rows = []
         self._id_index = {}
-        self.id_column_name = model.id_column_name
+        self._indexes = {}
+        self._filter_counts = {}
+        self._sort_indexes = {}
+        self._sort_counts = {}
+        self._number_deleted = 0
+        self._range_indexes = {}
+        self._range_filter_counts = {}
         self._next_id = 1
 
-        self._table_name = model.table_name()
-        self._column_names.extend(model.columns_configuration().keys())
-        if self.id_column_name not in self._column_names:
-            self._column_names.append(self.id_column_name)
+    @staticmethod
+    def _model_column_names(model):
+        column_names = list(model.columns_configuration().keys())
+        if model.id_column_name not in column_names:
+            column_names.append(model.id_column_name)
+        return column_names
+
+    def check_columns(self, model):
+        """
+        Raises a ValueError if the columns of the table don't match the columns of the given model
+        """
+        column_names = self._model_column_names(model)
+        if model.id_column_name == self.id_column_name and set(column_names) == set(self._column_names):
+            return
+        raise ValueError(
+            f"The columns of table '{self._table_name}' ({', '.join(sorted(self._column_names))}) do not match "
+            + f"the columns of its model ({', '.join(sorted(column_names))})"
+        )
+
+    def create_index(self, column_name):
+        """
+        Creates a hash index for the given column, which is used to answer `=` and `IN` conditions
+        """
+        if column_name not in self._column_names:
+            raise ValueError(
+                f"Cannot create index: column '{column_name}' does not exist in table '{self._table_name}'"
+            )
+        if column_name in self._indexes:
+            return
+        self._indexes[column_name] = self._build_index(column_name, self._rows)
+
+    def _build_index(self, column_name, rows):
+        index = {}
+        for row_index, row in enumerate(rows):
+            if row is not None:
+                index.setdefault(str(row.get(column_name)), set()).add(row_index)
+        return index
+
+    def create_range_index(self, column_name):
+        """
+        Creates a sorted index for the given column, which is used to answer `<`, `>`, `<=`, and `>=` conditions
+        """
+        if column_name not in self._column_names:
+            raise ValueError(
+                f"Cannot create range index: column '{column_name}' does not exist in table '{self._table_name}'"
+            )
+        if column_name in self._range_indexes:
+            return
+        self._range_indexes[column_name] = self._build_range_index(column_name, self._rows)
+
+    def _build_range_index(self, column_name, rows):
+        """
+        Builds a range index, which holds a sorted list of (key, row index) tuples for each type of key.
+
+        The keys are the values as they are compared by the range operators (i.e. numbers as floats), and are
+        split up by type since e.g. numbers and strings can't be compared to each other.  NULLs never match a range
+        condition, so they aren't included.  If some values can't be sorted at all then their rows are tracked
+        separately, and the index won't be used.
+        """
+        index = {"sorted": {}, "unsortable": set()}
+        for row_index, row in enumerate(rows):
+            if row is None:
+                continue
+            key = self._range_key(row.get(column_name))
+            if key is not None:
+                index["sorted"].setdefault(type(key), []).append((key, row_index))
+        for key_type, entries in index["sorted"].items():
+            try:
+                entries.sort()
+            except TypeError:
+                index["unsortable"].update(row_index for (key, row_index) in entries)
+        return index
+
+    def _range_key(self, value):
+        """
+        Returns the key for a value in a range index, or None for values that can never match a range condition
+        """
+        if value is None:
+            return None
+        key = gentle_float_conversion(value)
+        # NaN isn't greater than or less than anything
+        if key != key:
+            return None
+        return key
+
+    def _add_to_range_index(self, index, value, row_index):
+        key = self._range_key(value)
+        if key is None:
+            return
+        try:
+            bisect.insort(index["sorted"].setdefault(type(key), []), (key, row_index))
+        except TypeError:
+            index["unsortable"].add(row_index)
+
+    def _remove_from_range_index(self, index, value, row_index):
+        key = self._range_key(value)
+        if key is None:
+            return
+        index["unsortable"].discard(row_index)
+        entries = index["sorted"].get(type(key), [])
+        try:
+            position = bisect.bisect_left(entries, (key, row_index))
+        except TypeError:
+            return
+        if position < len(entries) and entries[position] == (key, row_index):
+            del entries[position]
+
+    def _rebuild_indexes(self):
+        """
+        Rebuilds all the indexes from scratch, for when the rows have been replaced wholesale
+        """
+        [self._indexes, self._sort_indexes, self._range_indexes] = self._build_indexes(self._rows)
+
+    def _build_indexes(self, rows):
+        indexes = {column_name: self._build_index(column_name, rows) for column_name in self._indexes}
+        sort_indexes = {}
+        for sort_spec, (key, index) in self._sort_indexes.items():
+            index = self._build_sort_index(key, rows)
+            if index is not None:
+                sort_indexes[sort_spec] = (key, index)
+        range_indexes = {
+            column_name: self._build_range_index(column_name, rows) for column_name in self._range_indexes
+        }
+        return [indexes, sort_indexes, range_indexes]
+
+    def compact(self):
+        """
+        Clears out deleted rows and rebuilds the indexes to match.
+
+        Everything is built on the side and then swapped in, so the table is never left with indexes that don't
+        match its rows.  This happens automatically as rows are deleted (see compaction_threshold).
+        """
+        rows = [row for row in self._rows if row is not None]
+        id_index = {row.get(self.id_column_name): row_index for (row_index, row) in enumerate(rows)}
+        [indexes, sort_indexes, range_indexes] = self._build_indexes(rows)
+        (self._rows, self._id_index, self._indexes, self._sort_indexes, self._range_indexes, self._number_deleted) = (
+            rows,
+            id_index,
+            indexes,
+            sort_indexes,
+            range_indexes,
+            0,
+        )
+
+    def snapshot(self):
+        """
+        Returns the state of the table (rows and indexes) as plain data, for MemoryBackend.snapshot()
+        """
+        return {
+            "table_name": self._table_name,
+            "column_names": self._column_names,
+            "id_column_name": self.id_column_name,
+            "next_id": self._next_id,
+            "compact_rows": self._compact_rows,
+            "rows": [row._values if row is not None else None for row in self._rows]
+            if self._compact_rows
+            else self._rows,
+            "number_deleted": self._number_deleted,
+            "id_index": self._id_index,
+            "indexes": self._indexes,
+            "sort_indexes": {sort_spec: index for (sort_spec, (key, index)) in self._sort_indexes.items()},
+            "range_indexes": self._range_indexes,
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """
+        Creates a table from the output of `snapshot()`, without having to rebuild any of the indexes
+        """
+        table = cls.__new__(cls)
+        table._initialize(
+            snapshot["table_name"], snapshot["column_names"], snapshot["id_column_name"], snapshot["compact_rows"]
+        )
+        table._next_id = snapshot["next_id"]
+        table._rows = snapshot["rows"]
+        if table._compact_rows:
+            positions = table._column_positions
+            table._rows = [CompactRow(positions, values) if values is not None else None for values in table._rows]
+        table._number_deleted = snapshot["number_deleted"]
+        table._id_index = snapshot["id_index"]
+        table._indexes = snapshot["indexes"]
+        # the sort keys are functions, which can't be saved, so rebuild them from the sort spec
+        for sort_spec, index in snapshot["sort_indexes"].items():
+            sorts = [{"column": column, "direction": "ASC" if ascending else "DESC"} for (column, ascending) in sort_spec]
+            table._sort_indexes[sort_spec] = (_sort_key(sorts), index)
+        table._range_indexes = snapshot["range_indexes"]
+        return table
+
+    def _store_row(self, data):
+        """
+        Returns the row to store for the given data: either a copy of it or, for compact tables, a CompactRow
+        """
+        if not self._compact_rows:
+            return {**data}
+        return CompactRow(self._column_positions, tuple(data.get(column_name) for column_name in self._column_names))
+
+    def output_rows(self, rows):
+        """
+        Converts rows from this table back into dictionaries (which they already are unless the table is compact)
+        """
+        if not self._compact_rows:
+            return rows
+        return [dict(row) if row is not None else None for row in rows]
+
+    def _add_to_indexes(self, row_index, row):
+        for column_name, index in self._indexes.items():
+            index.setdefault(str(row.get(column_name)), set()).add(row_index)
+        for sort_spec, (key, index) in list(self._sort_indexes.items()):
+            try:
+                bisect.insort(index, (key(row), row_index))
+            except TypeError:
+                self._drop_sort_index(sort_spec)
+        for column_name, index in self._range_indexes.items():
+            self._add_to_range_index(index, row.get(column_name), row_index)
+
+    def _drop_sort_index(self, sort_spec):
+        """
+        Drops a sort index that can't be kept in order, e.g. because a column now mixes strings and numbers.
+
+        Queries fall back on sorting the rows directly, and the index is built again (if it can be) once the sort
+        has been used often enough.
+        """
+        del self._sort_indexes[sort_spec]
+        self._sort_counts.pop(sort_spec, None)
+
+    def _remove_from_indexes(self, row_index, row):
+        for column_name, index in self._indexes.items():
+            key = str(row.get(column_name))
+            row_indexes = index.get(key)
+            if row_indexes is None:
+                continue
+            row_indexes.discard(row_index)
+            if not row_indexes:
+                del index[key]
+        for sort_spec, (key, index) in list(self._sort_indexes.items()):
+            entry = (key(row), row_index)
+            try:
+                position = bisect.bisect_left(index, entry)
+            except TypeError:
+                self._drop_sort_index(sort_spec)
+                continue
+            if position < len(index) and index[position] == entry:
+                del index[position]
+        for column_name, index in self._range_indexes.items():
+            self._remove_from_range_index(index, row.get(column_name), row_index)
 
     def update(self, id, data):
         if id not in self._id_index:
@@ -116,11 +501,10 @@ class MemoryTable:
                 raise ValueError(
                     f"Cannot update record: column '{column_name}' does not exist in table '{self._table_name}'"
                 )
-        self._rows[index] = {
-            **self._rows[index],
-            **data,
-        }
-        return self._rows[index]
+        self._remove_from_indexes(index, row)
+        self._rows[index] = self._store_row({**row, **data})
+        self._add_to_indexes(index, self._rows[index])
+        return self._rows[index] if not self._compact_rows else dict(self._rows[index])
 
     def create(self, data):
         for column_name in data.keys():
@@ -144,8 +528,9 @@ class MemoryTable:
         for column_name in self._column_names:
             if column_name not in data:
                 data[column_name] = None
-        self._rows.append({**data})
+        self._rows.append(self._store_row(data))
         self._id_index[data[self.id_column_name]] = len(self._rows) - 1
+        self._add_to_indexes(len(self._rows) - 1, self._rows[-1])
         return data
 
     def delete(self, id):
@@ -156,35 +541,197 @@ class MemoryTable:
             return True
         # we set the row to None because if we remove it we'll change the indexes of the rest
         # of the rows, and I like being able to calculate the index from the id
+        self._remove_from_indexes(index, self._rows[index])
         self._rows[index] = None
+        self._number_deleted += 1
+        if self.compaction_threshold is not None and self._number_deleted >= self.compaction_threshold * len(
+            self._rows
+        ):
+            self.compact()
         return True
 
     def count(self, configuration, wheres):
+        if not wheres:
+            return len(self._rows) - self._number_deleted
         return len(self.rows(configuration, wheres, filter_only=True))
 
     def rows(self, configuration, wheres, filter_only=False, next_page_data=None):
-        rows = list(filter(None, self._rows))
-        for where in wheres:
-            rows = filter(self._where_as_filter(where), rows)
-        rows = list(rows)
+        sorts = configuration.get("sorts") if not filter_only else None
+        [rows, is_sorted] = self._filtered_rows(wheres, sorts=sorts)
         if filter_only:
             return rows
-        if "sorts" in configuration and configuration["sorts"]:
-            rows = sorted(rows, key=cmp_to_key(lambda row_a, row_b: _sort(row_a, row_b, configuration["sorts"])))
-        if "limit" in configuration or ("pagination" in configuration and configuration["pagination"].get("start")):
-            number_rows = len(rows)
+        number_rows = len(rows)
+        start = 0
+        end = number_rows
+        paginate = "limit" in configuration or (
+            "pagination" in configuration and configuration["pagination"].get("start")
+        )
+        if paginate:
             start = int(configuration.get("pagination", {}).get("start", 0))
             if not start:
                 start = 0
             if int(start) >= number_rows:
                 start = number_rows - 1
-            end = len(rows)
             if configuration.get("limit") and configuration.get("limit") > 0 and start + int(configuration["limit"]) <= number_rows:
                 end = start + int(configuration["limit"])
+        # if we only need the first page of results then there's no need to sort everything
+        if sorts and not is_sorted:
+            rows = _sort_rows(rows, sorts, count=end if end < number_rows else None)
+        if paginate:
             if end < number_rows and type(next_page_data) == dict:
                 next_page_data["start"] = start + configuration["limit"]
             rows = rows[start:end]
-        return rows
+        return self.output_rows(rows)
+
+    def _filtered_rows(self, wheres, sorts=None):
+        """
+        Returns the (non-deleted) rows that match the where conditions, and whether or not they are already sorted.
+
+        If any of the conditions can be answered by a hash index, then we start from the smallest set of candidates
+        that the indexes give us and only check the remaining conditions against those rows.  Otherwise, if there is
+        a sort index for the requested sorts, we check the rows in that order so that they don't need sorting.
+        """
+        [candidates, remaining_wheres] = self._plan(wheres)
+        # a sort index only helps (and only counts towards building one) when we have to scan the whole table
+        sort_index = self._sort_index(sorts) if sorts and candidates is None else None
+        is_sorted = False
+        if candidates is not None:
+            rows = [self._rows[row_index] for row_index in sorted(candidates)]
+        elif sort_index is not None:
+            rows = [self._rows[row_index] for (key, row_index) in sort_index]
+            is_sorted = True
+        else:
+            rows = filter(None, self._rows)
+        for where in remaining_wheres:
+            rows = filter(self._where_as_filter(where), rows)
+        return [list(rows), is_sorted]
+
+    def _sort_index(self, sorts):
+        """
+        Returns the sort index for the given sorts, or None if there isn't one (yet).
+
+        A sort index is a list of (sort key, row index) tuples for every row, kept in order as rows are created,
+        updated, and deleted.  They are created automatically for sorts that get used frequently.
+        """
+        sort_spec = tuple((sort["column"], sort["direction"].lower() == "asc") for sort in sorts)
+        if sort_spec in self._sort_indexes:
+            return self._sort_indexes[sort_spec][1]
+        if self.auto_index_threshold is None:
+            return None
+        if [column_name for (column_name, ascending) in sort_spec if column_name not in self._column_names]:
+            return None
+        self._sort_counts[sort_spec] = self._sort_counts.get(sort_spec, 0) + 1
+        if self._sort_counts[sort_spec] < self.auto_index_threshold:
+            return None
+        key = _sort_key(sorts)
+        index = self._build_sort_index(key, self._rows)
+        if index is None:
+            self._sort_counts[sort_spec] = 0
+            return None
+        self._sort_indexes[sort_spec] = (key, index)
+        return index
+
+    def _build_sort_index(self, key, rows):
+        """
+        Returns a sort index for the rows, or None if their values can't all be compared with each other.
+        """
+        try:
+            # the row index breaks ties, which keeps the sort stable
+            return sorted((key(row), row_index) for (row_index, row) in enumerate(rows) if row is not None)
+        except TypeError:
+            return None
+
+    def _plan(self, wheres):
+        best_candidates = None
+        best_wheres = []
+        # range conditions on the same column are answered together, so that e.g. `created_at>=X` and
+        # `created_at<Y` become a single lookup in the range index
+        range_wheres = {}
+        for where in wheres:
+            if where["operator"].lower() in self._range_operators:
+                range_wheres.setdefault(where["column"], []).append(where)
+                continue
+            candidates = self._index_candidates(where)
+            if candidates is None:
+                continue
+            if best_candidates is None or len(candidates) < len(best_candidates):
+                best_candidates = candidates
+                best_wheres = [where]
+        for column_name, column_wheres in range_wheres.items():
+            candidates = self._range_candidates(column_name, column_wheres)
+            if candidates is None:
+                continue
+            if best_candidates is None or len(candidates) < len(best_candidates):
+                best_candidates = candidates
+                best_wheres = column_wheres
+        if best_candidates is None:
+            return [None, wheres]
+        used_wheres = set(id(where) for where in best_wheres)
+        return [best_candidates, [where for where in wheres if id(where) not in used_wheres]]
+
+    def _range_candidates(self, column_name, wheres):
+        """
+        Returns the row indexes that match all the range conditions for a column, or None if there's no range index
+        """
+        self._count_range_filter(column_name)
+        index = self._range_indexes.get(column_name)
+        if index is None or index["unsortable"]:
+            return None
+
+        key_type = None
+        for where in wheres:
+            key = self._range_key(where["values"][0])
+            # nothing matches a NULL, and a number can't match a string (or vice-versa)
+            if key is None or (key_type is not None and type(key) != key_type):
+                return set()
+            if key_type is None:
+                key_type = type(key)
+                entries = index["sorted"].get(key_type, [])
+                [low, high] = [0, len(entries)]
+            operator = where["operator"]
+            if operator == ">":
+                low = max(low, bisect.bisect_right(entries, (key, math.inf)))
+            elif operator == ">=":
+                low = max(low, bisect.bisect_left(entries, (key,)))
+            elif operator == "<":
+                high = min(high, bisect.bisect_left(entries, (key,)))
+            else:
+                high = min(high, bisect.bisect_right(entries, (key, math.inf)))
+        return set(row_index for (key, row_index) in entries[low:high])
+
+    def _index_candidates(self, where):
+        """
+        Returns the row indexes that match the condition according to a hash index, or None if we can't use one
+        """
+        operator = where["operator"].lower()
+        if operator not in ["=", "in"]:
+            return None
+        column_name = where["column"]
+        self._count_filter(column_name)
+        index = self._indexes.get(column_name)
+        if index is None:
+            return None
+
+        candidates = set()
+        for value in where["values"][:1] if operator == "=" else where["values"]:
+            candidates.update(index.get(str(value), ()))
+        return candidates
+
+    def _count_range_filter(self, column_name):
+        if self.auto_index_threshold is None or column_name not in self._column_names:
+            return
+        if column_name in self._range_indexes:
+            return
+        self._range_filter_counts[column_name] = self._range_filter_counts.get(column_name, 0) + 1
+        if self._range_filter_counts[column_name] >= self.auto_index_threshold:
+            self.create_range_index(column_name)
+
+    def _count_filter(self, column_name):
+        if self.auto_index_threshold is None or column_name in self._indexes or column_name not in self._column_names:
+            return
+        self._filter_counts[column_name] = self._filter_counts.get(column_name, 0) + 1
+        if self._filter_counts[column_name] >= self.auto_index_threshold:
+            self.create_index(column_name)
 
     def _where_as_filter(self, where):
         column = where["column"]
@@ -192,9 +739,54 @@ class MemoryTable:
         return self._operator_lambda_builders[where["operator"].lower()](column, values, self.null)
 
 
+class _SnapshotUnpickler(pickle.Unpickler):
+    """
+    Loads the data in a snapshot, while refusing anything that isn't plain data.
+
+    A regular pickle can import and call anything, so a tampered snapshot could otherwise run arbitrary code.
+    """
+
+    # plain data, the types that range indexes are grouped by, and the wrapper used in descending sort keys
+    _allowed_globals = {
+        *[
+            ("builtins", name)
+            for name in [
+                "bool",
+                "bytearray",
+                "bytes",
+                "complex",
+                "dict",
+                "float",
+                "frozenset",
+                "int",
+                "list",
+                "set",
+                "str",
+                "tuple",
+            ]
+        ],
+        *[("datetime", name) for name in ["date", "datetime", "time", "timedelta", "timezone"]],
+        ("decimal", "Decimal"),
+        (__name__, "_Descending"),
+    }
+
+    def find_class(self, module, name):
+        if (module, name) not in self._allowed_globals:
+            raise pickle.UnpicklingError(f"'{module}.{name}' is not allowed in a snapshot")
+        return super().find_class(module, name)
+
+
 class MemoryBackend(Backend):
     _tables = None
+    _unchecked_tables = None
     _silent_on_missing_tables = False
+    _compact_rows = False
+
+    # snapshots start with a header that identifies the file, and holds the format version, the checksum (CRC32) of
+    # the data, and its length.
+    _snapshot_magic = b"CSMEMSNP"
+    _snapshot_version = 1
+    _snapshot_header = struct.Struct("<8sHIQ")
 
     _allowed_configs = [
         "table_name",
@@ -214,11 +806,21 @@ class MemoryBackend(Backend):
 
     def __init__(self):
         self._tables = {}
+        self._unchecked_tables = set()
         self._silent_on_missing_tables = True
 
     def silent_on_missing_tables(self, silent=True):
         self._silent_on_missing_tables = silent
 
+    def compact_rows(self, compact=True):
+        """
+        Store the rows of new tables as tuples rather than dictionaries.
+
+        This uses much less memory for large tables, at the cost of somewhat slower queries.  It only affects
+        tables created after it is called.
+        """
+        self._compact_rows = compact
+
     def configure(self):
         pass
 
@@ -227,9 +829,97 @@ class MemoryBackend(Backend):
         Accepts either a model or a model class and creates a "table" for it
         """
         model = self.cheez_model(model)
-        if model.table_name() in self._tables:
+        table_name = model.table_name()
+        if table_name in self._tables:
+            self._check_restored_table(table_name, model)
+            return
+        self._tables[model.table_name()] = MemoryTable(model, compact_rows=self._compact_rows)
+
+    def _check_restored_table(self, table_name, model):
+        # tables restored from a snapshot are checked against their model the first time that it is used
+        if table_name not in self._unchecked_tables:
             return
-        self._tables[model.table_name()] = MemoryTable(model)
+        self._tables[table_name].check_columns(self.cheez_model(model))
+        self._unchecked_tables.discard(table_name)
+
+    def snapshot(self, path):
+        """
+        Saves every table (rows, ids, and indexes) to the given file, so that they can be loaded with `restore()`.
+
+        The snapshot is written to a temporary file and then moved into place, so an existing snapshot is never left
+        half-written.
+        """
+        payload = pickle.dumps(
+            {"tables": {table_name: table.snapshot() for (table_name, table) in self._tables.items()}},
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        header = self._snapshot_header.pack(
+            self._snapshot_magic, self._snapshot_version, zlib.crc32(payload), len(payload)
+        )
+        temporary_file = tempfile.NamedTemporaryFile(dir=os.path.dirname(os.path.abspath(path)), delete=False)
+        try:
+            with temporary_file:
+                temporary_file.write(header)
+                temporary_file.write(payload)
+            os.replace(temporary_file.name, path)
+        finally:
+            if os.path.exists(temporary_file.name):
+                os.remove(temporary_file.name)
+
+    def restore(self, path):
+        """
+        Replaces all tables with the ones saved in a snapshot by `snapshot()`.
+
+        The file is memory mapped so that the checksum and the unpickler can read it without first copying it into
+        memory, but this is not a lazily mapped format: every row and index is still unpickled into regular python
+        objects before this returns, so restoring takes time (and memory) in proportion to the size of the snapshot.
+        It is still much faster than re-creating the records one at a time, which is what it is meant to replace.
+        `benchmarks/snapshot_restore.py` measures both.
+
+        The format version and checksum are verified before anything is loaded, and only plain data is loaded from
+        the snapshot (never code).  The checksum only catches corruption though, so only restore snapshots from a
+        source that you trust.  Each restored table is checked against its model the first time the model is used,
+        and a ValueError is raised if their columns don't match.
+        """
+        # loading a large snapshot creates millions of objects, which would otherwise set off the garbage collector
+        # over and over again (and it wouldn't find anything to collect)
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with open(path, "rb") as fp:
+                if os.fstat(fp.fileno()).st_size < self._snapshot_header.size:
+                    raise ValueError(f"Cannot restore from '{path}' because it is not a MemoryBackend snapshot")
+                with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    snapshot = self._load_snapshot(data, path)
+            tables = {
+                table_name: MemoryTable.from_snapshot(table_snapshot)
+                for (table_name, table_snapshot) in snapshot["tables"].items()
+            }
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        self._tables = tables
+        self._unchecked_tables = set(tables.keys())
+
+    def _load_snapshot(self, data, path):
+        (magic, version, checksum, length) = self._snapshot_header.unpack_from(data)
+        if magic != self._snapshot_magic:
+            raise ValueError(f"Cannot restore from '{path}' because it is not a MemoryBackend snapshot")
+        if version != self._snapshot_version:
+            raise ValueError(
+                f"Cannot restore from '{path}' because it has snapshot format version {version}, "
+                + f"but only version {self._snapshot_version} is supported"
+            )
+        with memoryview(data) as view:
+            with view[self._snapshot_header.size :] as payload:
+                if len(payload) != length or zlib.crc32(payload) != checksum:
+                    raise ValueError(f"Cannot restore from '{path}' because the snapshot is corrupt")
+        # the mmap is itself file-like, so the unpickler can read straight from it rather than from a copy
+        data.seek(self._snapshot_header.size)
+        try:
+            return _SnapshotUnpickler(data).load()
+        except pickle.UnpicklingError as e:
+            raise ValueError(f"Cannot restore from '{path}' because the snapshot is invalid: {e}")
 
     def update(self, id, data, model):
         self.create_table(model)
@@ -243,6 +933,41 @@ class MemoryBackend(Backend):
         self.create_table(model)
         return self._tables[model.table_name()].delete(id)
 
+    def create_index(self, model, column_name):
+        """
+        Creates a hash index on the given column of the model's table, to speed up `=` and `IN` conditions
+
+        Columns that are filtered on frequently are also indexed automatically (see MemoryTable.auto_index_threshold)
+        """
+        self.create_table(model)
+        self._tables[self.cheez_model(model).table_name()].create_index(column_name)
+
+    def create_range_index(self, model, column_name):
+        """
+        Creates a sorted index on the given column of the model's table, to speed up range conditions (`<`, `>=`, etc)
+
+        Columns that are filtered on frequently are also indexed automatically (see MemoryTable.auto_index_threshold)
+        """
+        self.create_table(model)
+        self._tables[self.cheez_model(model).table_name()].create_range_index(column_name)
+
+    def bulk_create(self, rows, model):
+        self.create_table(model)
+        table = self._tables[model.table_name()]
+        return [table.create(data) for data in rows]
+
+    def bulk_update(self, updates, model):
+        self.create_table(model)
+        table = self._tables[model.table_name()]
+        return [table.update(id, data) for (id, data) in updates]
+
+    def bulk_delete(self, ids, model):
+        self.create_table(model)
+        table = self._tables[model.table_name()]
+        for id in ids:
+            table.delete(id)
+        return True
+
     def count(self, configuration, model):
         if configuration["table_name"] not in self._tables:
             if self._silent_on_missing_tables:
@@ -252,6 +977,8 @@ class MemoryBackend(Backend):
                 f"Attempt to count records in non-existent table '{configuration['table_name']} via MemoryBackend"
             )
 
+        self._check_restored_table(configuration["table_name"], model)
+
         # this is easy if we have no joins, so just return early so I don't have to think about it
         if "joins" not in configuration or not configuration["joins"]:
             wheres = configuration["wheres"] if "wheres" in configuration else []
@@ -260,7 +987,7 @@ class MemoryBackend(Backend):
         # we can ignore left joins when counting
         configuration = {**configuration}
         configuration["joins"] = [join for join in configuration["joins"] if join["type"] != "LEFT"]
-        return len(self.rows_with_joins(configuration))
+        return len(self._distinct_rows(self.rows_with_joins(configuration), configuration["table_name"]))
 
     def records(self, configuration, model, next_page_data=None):
         table_name = configuration["table_name"]
@@ -271,6 +998,10 @@ class MemoryBackend(Backend):
             raise ValueError(
                 f"Attempt to fetch records from non-existent table '{configuration['table_name']} via MemoryBackend"
             )
+        self._check_restored_table(table_name, model)
+
+        if self.keyset_pagination:
+            return self._keyset_records(configuration, model, next_page_data)
 
         # this is easy if we have no joins, so just return early so I don't have to think about it
         if "joins" not in configuration or not configuration["joins"]:
@@ -281,22 +1012,49 @@ class MemoryBackend(Backend):
 
         # currently we don't do much with selects, so just limit results down to the data from the original
         # table.
-        rows = [row[table_name] for row in rows]
+        rows = self._distinct_rows(rows, table_name)
 
-        if "sorts" in configuration and configuration["sorts"]:
-            rows = sorted(rows, key=cmp_to_key(lambda row_a, row_b: _sort(row_a, row_b, configuration["sorts"])))
-        if "start" in configuration.get("pagination", {}) or "limit" in configuration:
-            number_rows = len(rows)
+        paginate = "start" in configuration.get("pagination", {}) or "limit" in configuration
+        number_rows = len(rows)
+        start = 0
+        end = number_rows
+        if paginate:
             start = configuration.get("pagination", {}).get("start", 0)
             if start >= number_rows:
                 start = number_rows - 1
-            end = len(rows)
             if configuration.get("limit") and start + configuration.get("limit") <= number_rows:
                 end = start + configuration.get("limit")
+        if "sorts" in configuration and configuration["sorts"]:
+            rows = _sort_rows(rows, configuration["sorts"], count=end if end < number_rows else None)
+        if paginate:
             rows = rows[start:end]
             if end < number_rows and type(next_page_data) == dict:
                 next_page_data["start"] = start + configuration["limit"]
-        return rows
+        return self._tables[table_name].output_rows(rows)
+
+    def _keyset_records(self, configuration, model, next_page_data):
+        table_name = configuration["table_name"]
+        sorts = self.keyset_sorts(configuration.get("sorts") or [], table_name, model.id_column_name)
+        unpaginated = {key: value for (key, value) in configuration.items() if key not in ["pagination", "limit"]}
+        unpaginated["sorts"] = sorts
+        if unpaginated.get("joins"):
+            rows = self._distinct_rows(self.rows_with_joins(unpaginated), table_name)
+        else:
+            rows = self._tables[table_name].rows(unpaginated, unpaginated.get("wheres", []), filter_only=True)
+
+        after = configuration.get("pagination", {}).get("after")
+        if after:
+            key = _sort_key(sorts)
+            after_key = key(dict(zip([sort["column"] for sort in sorts], self.keyset_values(after, sorts))))
+            rows = [row for row in rows if key(row) > after_key]
+        # we only need one extra row to know if there is another page
+        limit = configuration.get("limit")
+        rows = _sort_rows(rows, sorts, count=limit + 1 if limit else None)
+        if limit and len(rows) > limit:
+            rows = rows[:limit]
+            if type(next_page_data) == dict:
+                next_page_data["after"] = self.keyset_token(rows[-1], sorts)
+        return self._tables[table_name].output_rows(rows)
 
     def rows_with_joins(self, configuration):
         joins = configuration["joins"]
@@ -320,42 +1078,63 @@ class MemoryBackend(Backend):
         rows = [{left_table: row} for row in main_rows]
         joined_tables = [left_table]
 
-        # and now work through our joins.  The tricky part is order - we need to manage the joins in the
-        # proper order, but they may not be in the correcet order in our join list.  I still don't feel like building
-        # a full graph, so cheat and be dumb: loop through them all and join in the ones we can, skipping the ones
-        # we can't.  If we get to the end and there are still joins left in the queue, then repeat, and eventually
-        # complain (since the joins may not be a valid object graph)
-        for i in range(10):
-            for index, join in enumerate(joins):
-                left_table = join["left_table"]
-                alias = join["alias"]
-                right_table = join["right_table"]
-                table_name_for_join = alias if alias else right_table
-                if left_table not in joined_tables:
-                    continue
-
-                join_rows = self._tables[right_table].rows(
-                    configuration, self._wheres_for_table(table_name_for_join, wheres, joined_tables), filter_only=True
-                )
-
-                rows = self.join_rows(rows, join_rows, join, joined_tables)
+        # and now work through our joins, which may not be in the order we need to apply them in
+        for join in self._ordered_joins(left_table, joins):
+            alias = join["alias"]
+            right_table = join["right_table"]
+            table_name_for_join = alias if alias else right_table
+            join_rows = self._tables[right_table].rows(
+                configuration, self._wheres_for_table(table_name_for_join, wheres, joined_tables), filter_only=True
+            )
+            rows = self.join_rows(rows, join_rows, join, joined_tables)
+            joined_tables.append(table_name_for_join)
 
-                # done with this one!
-                del joins[index]
-                joined_tables.append(table_name_for_join)
+        return rows
 
-            # are we done yet?
-            if not joins:
-                break
+    def _ordered_joins(self, left_table, joins):
+        """
+        Returns the joins sorted so that every join comes after the join for the table that it depends on.
 
-        if joins:
+        The joins form a tree with the main table at the root (each join hangs off of its `left_table`), so we just
+        walk the tree outwards from the main table.  Joins that we can't reach were joined on a table that is never
+        joined itself, which means the query is invalid.
+        """
+        dependents = {}
+        for join in joins:
+            dependents.setdefault(join["left_table"], []).append(join)
+
+        ordered_joins = []
+        tables_to_check = [left_table]
+        while tables_to_check:
+            for join in dependents.pop(tables_to_check.pop(0), []):
+                ordered_joins.append(join)
+                tables_to_check.append(join["alias"] if join["alias"] else join["right_table"])
+
+        if len(ordered_joins) < len(joins):
             raise ValueError(
                 "Unable to fulfill joins for query - perhaps a necessary join is missing? "
                 + "One way to get this error is if you tried to join on another table which hasn't been "
                 + "joined itself.  e.g.: SELECT * FROM users JOIN type ON type.id=categories.type_id"
             )
+        return ordered_joins
 
-        return rows
+    def _distinct_rows(self, rows, table_name):
+        """
+        Returns the rows for the given table out of the joined rows, without duplicates.
+
+        A one-to-many join gives us one joined row per match, but we only return records from the main table, so
+        (like a `SELECT DISTINCT table.*`) each record should only come back once.
+        """
+        seen = set()
+        distinct_rows = []
+        for row in rows:
+            table_row = row[table_name]
+            if table_row is not None:
+                if id(table_row) in seen:
+                    continue
+                seen.add(id(table_row))
+            distinct_rows.append(table_row)
+        return distinct_rows
 
     def all_rows(self, table_name):
         if table_name not in self._tables:
@@ -363,7 +1142,8 @@ class MemoryBackend(Backend):
                 return []
 
             raise ValueError(f"Cannot return rows for unknown table '{table_name}'")
-        return self._tables[table_name]._rows
+        table = self._tables[table_name]
+        return table.output_rows(table._rows)
 
     def _check_query_configuration(self, configuration):
         for key in configuration.keys():
@@ -416,61 +1196,78 @@ class MemoryBackend(Backend):
         """
         join_table_name = join_config["alias"] if join_config["alias"] else join_config["right_table"]
         join_type = join_config["type"]
-
-        # loop through each entry in rows, find a matching table in join_rows, and take action depending on join type
-        rows = [*rows]
-        matched_right_row_indexes = []
         left_table = join_config["left_table"]
         left_column = join_config["left_column"]
-        for row_index, row in enumerate(rows):
-            matching_row = None
+
+        # for now we are assuming the operator for the matching is `=`.  This is mainly because
+        # our join parsing doesn't bother checking for the matching operator, because it is `=` in
+        # 99% of cases.  We can always adjust down the line.  That means we can hash the joined rows on
+        # the right column once, and then find the matches for each row with a simple lookup.
+        join_index = self._join_index(join_rows, join_config["right_column"])
+
+        # loop through each entry in rows, find the matching rows in join_rows, and take action depending on join type
+        joined_rows = []
+        matched_join_indexes = set()
+        for row in rows:
             if left_table not in row:
                 raise ValueError("Attempted to check join data from unjoined table, which should not happen...")
-            left_value = (
-                row[left_table][left_column]
-                if (row[left_table] is not None and left_column in row[left_table])
-                else None
-            )
-            for join_index, join in enumerate(join_rows):
-                right_value = join[join_config["right_column"]] if join_config["right_column"] in join else None
-                # for now we are assuming the operator for the matching is `=`.  This is mainly because
-                # our join parsing doesn't bother checking for the matching operator, because it is `=` in
-                # 99% of cases.  We can always adjust down the line.
-                if (right_value is None and left_value is None) or (right_value == left_value):
-                    matching_row = join
-                    matched_right_row_indexes.append(right_value)
-                    break
-
-            # next action depends on the join type and match success
-            # for left and outer joins we always preserve records in the main table, so just plop in our match
-            # (even if it is None)
-            if join_type == "LEFT" or join_type == "OUTER":
-                rows[row_index][join_table_name] = matching_row
-
-            # for inner and right joins we delete the row if we don't have a match
-            elif join_type == "INNER" or join_type == "RIGHT":
-                if matching_row is not None:
-                    rows[row_index][join_table_name] = matching_row
-                else:
-                    # we can't immediately delete the row because we're looping over the array it is in,
-                    # so just mark it as None and remove it later
-                    rows[row_index] = None
-
-        rows = [row for row in rows if row is not None]
+            left_value = row[left_table].get(left_column) if row[left_table] is not None else None
+            matching_indexes = self._join_matches(join_index, join_rows, join_config["right_column"], left_value)
+
+            # every match gets its own row, just like in SQL
+            for matching_index in matching_indexes:
+                joined_rows.append({**row, join_table_name: join_rows[matching_index]})
+            matched_join_indexes.update(matching_indexes)
+
+            # for left and outer joins we always preserve records in the main table, even if there is no match.
+            # For inner and right joins we drop them.
+            if not matching_indexes and (join_type == "LEFT" or join_type == "OUTER"):
+                joined_rows.append({**row, join_table_name: None})
 
         # now for outer/right rows we add on any unmatched rows
-        if (join_type == "OUTER" or join_type == "RIGHT") and len(matched_right_row_indexes) < len(join_rows):
-            for join_index in set(enumerate(join_rows)) - set(matched_right_row_indexes):
-                rows.append(
+        if (join_type == "OUTER" or join_type == "RIGHT") and len(matched_join_indexes) < len(join_rows):
+            for join_row_index, join_row in enumerate(join_rows):
+                if join_row_index in matched_join_indexes:
+                    continue
+                joined_rows.append(
                     {
-                        join_table_name: join_rows[join_index],
+                        join_table_name: join_row,
                         **{table_name: None for table_name in joined_tables},
                     }
                 )
 
-        return rows
+        return joined_rows
+
+    def _join_index(self, join_rows, right_column):
+        """
+        Returns a dictionary mapping values in the right column to the indexes of the join rows that have them.
+
+        Values that can't be hashed (lists, dictionaries, etc...) can't go in the dictionary, so the indexes of
+        those rows are returned in a separate list and checked one at a time.
+        """
+        index = {}
+        unhashable = []
+        for join_row_index, join_row in enumerate(join_rows):
+            try:
+                index.setdefault(join_row.get(right_column), []).append(join_row_index)
+            except TypeError:
+                unhashable.append(join_row_index)
+        return (index, unhashable)
+
+    def _join_matches(self, join_index, join_rows, right_column, left_value):
+        (index, unhashable) = join_index
+        try:
+            return index.get(left_value, [])
+        except TypeError:
+            return [
+                join_row_index
+                for join_row_index in unhashable
+                if join_rows[join_row_index].get(right_column) == left_value
+            ]
 
     def validate_pagination_kwargs(self, kwargs: Dict[str, Any], case_mapping: Callable) -> str:
+        if self.keyset_pagination:
+            return self.validate_keyset_pagination_kwargs(kwargs, case_mapping)
         extra_keys = set(kwargs.keys()) - set(self.allowed_pagination_keys())
         if len(extra_keys):
             key_name = case_mapping("start")
@@ -487,15 +1284,21 @@ class MemoryBackend(Backend):
         return ""
 
     def allowed_pagination_keys(self) -> List[str]:
-        return ["start"]
+        return ["after"] if self.keyset_pagination else ["start"]
 
     def documentation_pagination_next_page_response(self, case_mapping: Callable) -> List[Any]:
+        if self.keyset_pagination:
+            return self.documentation_keyset_pagination_next_page_response(case_mapping)
         return [AutoDocInteger(case_mapping("start"), example=0)]
 
     def documentation_pagination_next_page_example(self, case_mapping: Callable) -> Dict[str, Any]:
+        if self.keyset_pagination:
+            return self.documentation_keyset_pagination_next_page_example(case_mapping)
         return {case_mapping("start"): 0}
 
     def documentation_pagination_parameters(self, case_mapping: Callable) -> List[Tuple[Any]]:
+        if self.keyset_pagination:
+            return self.documentation_keyset_pagination_parameters(case_mapping)
         return [
             (
                 AutoDocInteger(case_mapping("start"), example=0),
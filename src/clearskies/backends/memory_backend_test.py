@@ -1,9 +1,15 @@
+import os
+import pickle
+import tempfile
 import unittest
-from .memory_backend import MemoryBackend
+import zlib
+from .memory_backend import MemoryBackend, CompactRow
 from types import SimpleNamespace
 
 
 class MemoryBackendTest(unittest.TestCase):
+    compact_rows = False
+
     def setUp(self):
         self.user_model = SimpleNamespace(
             table_name=lambda: "users", columns_configuration=lambda: {"name": "", "email": ""}, id_column_name="id"
@@ -12,6 +18,7 @@ class MemoryBackendTest(unittest.TestCase):
             table_name=lambda: "reviews", columns_configuration=lambda: {"review": "", "email": ""}, id_column_name="id"
         )
         self.memory_backend = MemoryBackend()
+        self.memory_backend.compact_rows(self.compact_rows)
         self.memory_backend.create_table(self.user_model)
         self.memory_backend.create_table(self.reviews_model)
 
@@ -303,3 +310,460 @@ class MemoryBackendTest(unittest.TestCase):
             ],
             results,
         )
+
+    def test_join_one_to_many(self):
+        comments_model = SimpleNamespace(
+            table_name=lambda: "comments",
+            columns_configuration=lambda: {"review_id": "", "text": ""},
+            id_column_name="id",
+        )
+        self.memory_backend.create_table(comments_model)
+        self.memory_backend.create({"id": "1", "name": "Zeb", "email": "a@example.com"}, self.user_model)
+        self.memory_backend.create({"id": "2", "name": "A", "email": "b@example.com"}, self.user_model)
+        self.memory_backend.create({"id": "1", "review": "hey", "email": "a@example.com"}, self.reviews_model)
+        self.memory_backend.create({"id": "2", "review": "sup", "email": "a@example.com"}, self.reviews_model)
+        self.memory_backend.create({"id": "3", "review": "okay", "email": "b@example.com"}, self.reviews_model)
+        self.memory_backend.create({"id": "1", "review_id": "2", "text": "agreed"}, comments_model)
+        joins = [
+            # deliberately out of order: comments can only be joined after reviews
+            {
+                "alias": "",
+                "type": "INNER",
+                "table": "comments",
+                "left_table": "reviews",
+                "left_column": "id",
+                "right_table": "comments",
+                "right_column": "review_id",
+                "raw": "JOIN comments ON comments.review_id=reviews.id",
+            },
+            {
+                "alias": "",
+                "type": "INNER",
+                "table": "reviews",
+                "left_table": "users",
+                "left_column": "email",
+                "right_table": "reviews",
+                "right_column": "email",
+                "raw": "JOIN reviews ON reviews.email=users.email",
+            },
+        ]
+        configuration = {"table_name": "users", "wheres": [], "joins": joins}
+
+        # the comment belongs to the second review of the first user, so we have to check every match
+        rows = self.memory_backend.rows_with_joins(configuration)
+        self.assertEqual(
+            [("1", "2", "1")], [(row["users"]["id"], row["reviews"]["id"], row["comments"]["id"]) for row in rows]
+        )
+        self.assertEqual(2, len(joins))
+
+        # without the comments each user is returned once, even though the first user has two reviews
+        configuration = {"table_name": "users", "wheres": [], "joins": joins[1:]}
+        self.assertEqual(3, len(self.memory_backend.rows_with_joins(configuration)))
+        self.assertEqual(["1", "2"], [row["id"] for row in self.memory_backend.records(configuration, self.user_model)])
+        self.assertEqual(2, self.memory_backend.count(configuration, self.user_model))
+
+    def test_right_join(self):
+        self.memory_backend.create({"id": "1", "name": "Zeb", "email": "a@example.com"}, self.user_model)
+        self.memory_backend.create({"id": "1", "review": "hey", "email": "a@example.com"}, self.reviews_model)
+        self.memory_backend.create({"id": "2", "review": "sup", "email": "b@example.com"}, self.reviews_model)
+        rows = self.memory_backend.rows_with_joins(
+            {
+                "table_name": "users",
+                "wheres": [],
+                "joins": [
+                    {
+                        "alias": "",
+                        "type": "RIGHT",
+                        "table": "reviews",
+                        "left_table": "users",
+                        "left_column": "email",
+                        "right_table": "reviews",
+                        "right_column": "email",
+                        "raw": "RIGHT JOIN reviews ON reviews.email=users.email",
+                    },
+                ],
+            }
+        )
+        self.assertEqual(
+            [("1", "1"), (None, "2")],
+            [(row["users"]["id"] if row["users"] else None, row["reviews"]["id"]) for row in rows],
+        )
+
+    def test_join_on_missing_table(self):
+        with self.assertRaises(ValueError) as context:
+            self.memory_backend.rows_with_joins(
+                {
+                    "table_name": "users",
+                    "wheres": [],
+                    "joins": [
+                        {
+                            "alias": "",
+                            "type": "INNER",
+                            "table": "reviews",
+                            "left_table": "categories",
+                            "left_column": "id",
+                            "right_table": "reviews",
+                            "right_column": "category_id",
+                            "raw": "JOIN reviews ON reviews.category_id=categories.id",
+                        },
+                    ],
+                }
+            )
+        self.assertIn("Unable to fulfill joins for query", str(context.exception))
+
+    def test_keyset_pagination(self):
+        self.memory_backend.keyset_pagination = True
+        self.memory_backend.create({"id": "1-2-3-4", "name": "Zeb", "email": "a@example.com"}, self.user_model)
+        self.memory_backend.create({"id": "1-2-3-5", "name": "A", "email": "b@example.com"}, self.user_model)
+        self.memory_backend.create({"id": "1-2-3-6", "name": "Zeb", "email": "c@example.com"}, self.user_model)
+        configuration = {
+            "table_name": "users",
+            "sorts": [{"column": "name", "direction": "DESC"}],
+            "limit": 2,
+        }
+        next_page_data = {}
+        records = self.memory_backend.records(configuration, self.user_model, next_page_data=next_page_data)
+        self.assertEqual(["1-2-3-4", "1-2-3-6"], [record["id"] for record in records])
+        self.assertEqual(["after"], list(next_page_data.keys()))
+
+        # a new record sorted onto the first page doesn't shift the second page
+        self.memory_backend.create({"id": "1-2-3-3", "name": "Zeb", "email": "d@example.com"}, self.user_model)
+        next_next_page_data = {}
+        records = self.memory_backend.records(
+            {**configuration, "pagination": next_page_data}, self.user_model, next_page_data=next_next_page_data
+        )
+        self.assertEqual(["1-2-3-5"], [record["id"] for record in records])
+        self.assertEqual({}, next_next_page_data)
+
+        with self.assertRaises(ValueError) as context:
+            self.memory_backend.records(
+                {**configuration, "sorts": [{"column": "email", "direction": "ASC"}], "pagination": next_page_data},
+                self.user_model,
+            )
+        self.assertIn("does not match the current sort", str(context.exception))
+        # the token can also be checked against the sort up front, to report it as bad input
+        self.assertEqual(
+            "",
+            self.memory_backend.validate_pagination_sorts(next_page_data, configuration["sorts"], "users", "id", str),
+        )
+        self.assertIn(
+            "'after' does not match the current sort",
+            self.memory_backend.validate_pagination_sorts(
+                next_page_data, [{"column": "email", "direction": "ASC"}], "users", "id", str
+            ),
+        )
+        self.assertEqual(["after"], self.memory_backend.allowed_pagination_keys())
+        self.assertEqual("", self.memory_backend.validate_pagination_kwargs(next_page_data, str))
+        self.assertIn(
+            "is not a valid pagination token", self.memory_backend.validate_pagination_kwargs({"after": "5"}, str)
+        )
+
+    def test_indexes(self):
+        self.memory_backend.create({"id": "1-2-3-4", "name": "Zeb", "email": "a@example.com"}, self.user_model)
+        self.memory_backend.create({"id": "1-2-3-5", "name": "Zeb", "email": "b@example.com"}, self.user_model)
+        self.memory_backend.create({"id": "1-2-3-6", "name": "A", "email": "c@example.com"}, self.user_model)
+        self.memory_backend.create_index(self.user_model, "name")
+        users = self.memory_backend._tables["users"]
+        self.assertEqual({"Zeb": {0, 1}, "A": {2}}, users._indexes["name"])
+
+        self.memory_backend.update("1-2-3-5", {"name": "B"}, self.user_model)
+        self.memory_backend.delete("1-2-3-6", self.user_model)
+        self.assertEqual({"Zeb": {0}, "B": {1}}, users._indexes["name"])
+
+        records = self.memory_backend.records(
+            {
+                "table_name": "users",
+                "wheres": [
+                    {"column": "email", "operator": "!=", "values": ["c@example.com"]},
+                    {"column": "name", "operator": "in", "values": ["B", "Zeb", "A"]},
+                    {"column": "id", "operator": "=", "values": ["1-2-3-5"]},
+                ],
+            },
+            self.user_model,
+        )
+        self.assertEqual([{"id": "1-2-3-5", "name": "B", "email": "b@example.com"}], records)
+        self.assertEqual(
+            [{"id": "1-2-3-4", "name": "Zeb", "email": "a@example.com"}],
+            self.memory_backend.records(
+                {"table_name": "users", "wheres": [{"column": "name", "operator": "=", "values": ["Zeb"]}]},
+                self.user_model,
+            ),
+        )
+
+        # frequently filtered columns get an index automatically
+        for i in range(3):
+            self.memory_backend.records(
+                {"table_name": "users", "wheres": [{"column": "email", "operator": "=", "values": ["a@example.com"]}]},
+                self.user_model,
+            )
+        self.assertEqual({"a@example.com": {0}, "b@example.com": {1}}, users._indexes["email"])
+
+    def _user_ids(self, configuration, next_page_data=None):
+        return [record["id"] for record in self.memory_backend.records(configuration, self.user_model, next_page_data)]
+
+    def test_sorts(self):
+        names = ["c", None, "a", "b", "a", None, "c", "b", "a", "d"]
+        for index, name in enumerate(names):
+            self.memory_backend.create(
+                {"id": index + 1, "name": name, "email": f"{index}@example.com"}, self.user_model
+            )
+        sorts = [{"column": "name", "direction": "DESC"}, {"column": "email", "direction": "ASC"}]
+        configuration = {"table_name": "users", "sorts": sorts}
+
+        # NULLs come first in ascending order and last in descending order
+        self.assertEqual([10, 1, 7, 4, 8, 3, 5, 9, 2, 6], self._user_ids(configuration))
+        self.assertEqual(
+            [2, 6], self._user_ids({**configuration, "sorts": [{"column": "name", "direction": "ASC"}], "limit": 2})
+        )
+        next_page_data = {}
+        self.assertEqual([10, 1], self._user_ids({**configuration, "limit": 2}, next_page_data))
+        self.assertEqual({"start": 2}, next_page_data)
+        self.assertEqual([7, 4, 8], self._user_ids({**configuration, "pagination": {"start": 2}, "limit": 3}))
+
+        # the sort was used three times, so it now has a sort index that is kept up to date
+        users = self.memory_backend._tables["users"]
+        self.assertIn((("name", False), ("email", True)), users._sort_indexes)
+        self.memory_backend.create({"id": 11, "name": "c", "email": "91@example.com"}, self.user_model)
+        self.memory_backend.update(10, {"name": None}, self.user_model)
+        self.memory_backend.delete(4, self.user_model)
+        self.assertEqual([1, 7, 11, 8, 3, 5, 9, 2, 6, 10], self._user_ids(configuration))
+        self.assertEqual([11, 8], self._user_ids({**configuration, "pagination": {"start": 2}, "limit": 2}))
+
+    def test_sorts_with_hash_index(self):
+        for index, name in enumerate(["b", "a", "b", "c"]):
+            self.memory_backend.create(
+                {"id": index + 1, "name": name, "email": f"{index}@example.com"}, self.user_model
+            )
+        self.memory_backend.create_index(self.user_model, "name")
+        configuration = {
+            "table_name": "users",
+            "wheres": [{"column": "name", "operator": "=", "values": ["b"]}],
+            "sorts": [{"column": "email", "direction": "DESC"}],
+        }
+
+        # the hash index narrows down the rows, so the sort index would go unused and is never counted or built
+        for i in range(5):
+            self.assertEqual([3, 1], self._user_ids(configuration))
+        users = self.memory_backend._tables["users"]
+        self.assertEqual({}, users._sort_indexes)
+        self.assertEqual({}, users._sort_counts)
+
+    def test_mixed_types_with_indexes(self):
+        for id in range(1, 4):
+            self.memory_backend.create({"id": id, "name": id * 10, "email": f"{id}@example.com"}, self.user_model)
+        self.memory_backend.create_range_index(self.user_model, "name")
+        configuration = {"table_name": "users", "sorts": [{"column": "name", "direction": "ASC"}]}
+        for i in range(3):
+            self.assertEqual([1, 2, 3], self._user_ids(configuration))
+        users = self.memory_backend._tables["users"]
+        self.assertIn((("name", True),), users._sort_indexes)
+
+        # numbers and strings can't be compared, so the sort index is dropped, but the rows are still saved
+        self.memory_backend.create({"id": 4, "name": "abc", "email": "4@example.com"}, self.user_model)
+        self.memory_backend.create({"id": 5, "name": None, "email": "5@example.com"}, self.user_model)
+        self.memory_backend.update(1, {"name": "xyz"}, self.user_model)
+        self.assertEqual({}, users._sort_indexes)
+        self.assertEqual(5, self.memory_backend.count({"table_name": "users"}, self.user_model))
+        self.assertEqual([4], self._user_ids({"table_name": "users", "wheres": [self._name_where("=", "abc")]}))
+        self.assertEqual([2, 3], self._user_ids({"table_name": "users", "wheres": [self._name_where(">", "5")]}))
+
+        # and once the data can be sorted again, so can the index
+        self.memory_backend.delete(1, self.user_model)
+        self.memory_backend.delete(4, self.user_model)
+        for i in range(3):
+            self.assertEqual([5, 2, 3], self._user_ids(configuration))
+        self.assertIn((("name", True),), users._sort_indexes)
+
+    def test_compaction(self):
+        for id in range(1, 5):
+            self.memory_backend.create({"id": id, "name": f"user {id}", "email": ""}, self.user_model)
+        self.memory_backend.create_index(self.user_model, "name")
+        users = self.memory_backend._tables["users"]
+
+        self.memory_backend.delete(1, self.user_model)
+        self.assertEqual(4, len(users._rows))
+        self.assertEqual(3, self.memory_backend.count({"table_name": "users"}, self.user_model))
+
+        # once half the rows are deleted, they get cleared out
+        self.memory_backend.delete(2, self.user_model)
+        self.assertEqual(2, len(users._rows))
+        self.assertEqual({3: 0, 4: 1}, users._id_index)
+        self.assertEqual({"user 3": {0}, "user 4": {1}}, users._indexes["name"])
+        self.assertEqual(2, self.memory_backend.count({"table_name": "users"}, self.user_model))
+
+        self.memory_backend.update(4, {"name": "Conor"}, self.user_model)
+        self.assertEqual(
+            [{"id": 4, "name": "Conor", "email": ""}],
+            self.memory_backend.records(
+                {"table_name": "users", "wheres": [{"column": "name", "operator": "=", "values": ["Conor"]}]},
+                self.user_model,
+            ),
+        )
+        self.assertTrue(self.memory_backend.delete(2, self.user_model))
+
+    def _name_where(self, operator, value):
+        return {"column": "name", "operator": operator, "values": [value]}
+
+    def _name_ids(self, wheres):
+        return self._user_ids({"table_name": "users", "wheres": wheres})
+
+    def test_range_indexes(self):
+        names = ["10", "2", None, "2.5", "30", "abc", "nan"]
+        for index, name in enumerate(names):
+            self.memory_backend.create({"id": index + 1, "name": name, "email": ""}, self.user_model)
+        queries = [
+            [self._name_where(">", "2")],
+            [self._name_where(">=", "2")],
+            [self._name_where("<", "10")],
+            [self._name_where("<=", "10.0")],
+            [self._name_where(">=", "2.5"), self._name_where("<", "30")],
+            [self._name_where(">", "30"), self._name_where("<", "2")],
+            [self._name_where(">", "ab")],
+            [self._name_where(">", "2"), self._name_where("<", "zzz")],
+        ]
+        expected = [[1, 4, 5], [1, 2, 4, 5], [2, 4], [1, 2, 4], [1, 4], [], [6], []]
+
+        # the same results come back from a scan and from the range index
+        self.assertEqual(expected, [self._name_ids(query) for query in queries])
+        self.memory_backend.create_range_index(self.user_model, "name")
+        users = self.memory_backend._tables["users"]
+        self.assertEqual([(2.0, 1), (2.5, 3), (10.0, 0), (30.0, 4)], users._range_indexes["name"]["sorted"][float])
+        self.assertEqual(expected, [self._name_ids(query) for query in queries])
+
+        self.memory_backend.update(5, {"name": "5"}, self.user_model)
+        self.memory_backend.delete(1, self.user_model)
+        self.memory_backend.create({"id": 8, "name": "3"}, self.user_model)
+        self.assertEqual([5, 8], self._name_ids([self._name_where(">", "2.5")]))
+        self.assertEqual([(2.0, 1), (2.5, 3), (3.0, 7), (5.0, 4)], users._range_indexes["name"]["sorted"][float])
+
+    def test_range_nulls(self):
+        for index, name in enumerate(["1", None, "3", None]):
+            self.memory_backend.create({"id": index + 1, "name": name, "email": ""}, self.user_model)
+        queries = [[self._name_where(operator, "2")] for operator in ["<", "<=", ">", ">="]]
+        expected = [[1], [1], [3], [3]]
+
+        # NULLs never match a comparison, with or without a range index
+        self.assertEqual(expected, [self._name_ids(query) for query in queries])
+        self.memory_backend.create_range_index(self.user_model, "name")
+        self.assertEqual(expected, [self._name_ids(query) for query in queries])
+
+    def test_snapshot(self):
+        for id in range(1, 5):
+            self.memory_backend.create({"name": f"user {id}", "email": f"{5-id}@example.com"}, self.user_model)
+        self.memory_backend.create({"review": "hey", "email": "1@example.com"}, self.reviews_model)
+        self.memory_backend.delete(2, self.user_model)
+        self.memory_backend.create_index(self.user_model, "name")
+        self.memory_backend.create_range_index(self.user_model, "id")
+        configuration = {
+            "table_name": "users",
+            "wheres": [{"column": "id", "operator": ">", "values": ["1"]}],
+            "sorts": [{"column": "email", "direction": "DESC"}],
+        }
+        for i in range(3):
+            records = self.memory_backend.records(configuration, self.user_model)
+        users = self.memory_backend._tables["users"]
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "snapshot")
+            self.memory_backend.snapshot(path)
+            restored = MemoryBackend()
+            restored.restore(path)
+
+            # a snapshot that has been tampered with is rejected
+            with open(path, "rb") as fp:
+                contents = fp.read()
+            with open(path, "wb") as fp:
+                fp.write(contents[:-1] + bytes([contents[-1] ^ 1]))
+            with self.assertRaises(ValueError) as context:
+                MemoryBackend().restore(path)
+            self.assertEqual(f"Cannot restore from '{path}' because the snapshot is corrupt", str(context.exception))
+            with open(path, "wb") as fp:
+                fp.write(contents[:8] + b"\x02\x00" + contents[10:])
+            with self.assertRaises(ValueError) as context:
+                MemoryBackend().restore(path)
+            self.assertIn("has snapshot format version 2", str(context.exception))
+            with open(path, "wb") as fp:
+                fp.write(b"[]" * 20)
+            with self.assertRaises(ValueError) as context:
+                MemoryBackend().restore(path)
+            self.assertEqual(
+                f"Cannot restore from '{path}' because it is not a MemoryBackend snapshot", str(context.exception)
+            )
+
+        restored_users = restored._tables["users"]
+        self.assertEqual(["reviews", "users"], sorted(restored._tables.keys()))
+        self.assertEqual(records, restored.records(configuration, self.user_model))
+        self.assertEqual([3, 4], [record["id"] for record in records])
+        self.assertEqual(users._indexes, restored_users._indexes)
+        self.assertEqual(users._range_indexes, restored_users._range_indexes)
+        self.assertEqual(list(users._sort_indexes.keys()), list(restored_users._sort_indexes.keys()))
+        self.assertEqual(users._id_index, restored_users._id_index)
+
+        # and the restored tables (and their indexes) keep working
+        restored.create({"name": "user 5", "email": "0@example.com"}, self.user_model)
+        restored.update(3, {"email": "5@example.com"}, self.user_model)
+        self.assertEqual([3, 4, 5], [record["id"] for record in restored.records(configuration, self.user_model)])
+
+    def test_snapshot_only_loads_data(self):
+        class RunsCode:
+            def __reduce__(self):
+                return (os.getpid, ())
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "snapshot")
+            payload = pickle.dumps({"tables": {"users": RunsCode()}})
+            with open(path, "wb") as fp:
+                fp.write(MemoryBackend._snapshot_header.pack(b"CSMEMSNP", 1, zlib.crc32(payload), len(payload)))
+                fp.write(payload)
+            with self.assertRaises(ValueError) as context:
+                MemoryBackend().restore(path)
+        self.assertIn(f"Cannot restore from '{path}' because the snapshot is invalid", str(context.exception))
+        self.assertIn("getpid' is not allowed in a snapshot", str(context.exception))
+
+    def test_snapshot_checks_columns(self):
+        self.memory_backend.create({"name": "user 1", "email": "1@example.com"}, self.user_model)
+        user_model = SimpleNamespace(
+            table_name=lambda: "users",
+            columns_configuration=lambda: {"name": "", "email": "", "age": ""},
+            id_column_name="id",
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "snapshot")
+            self.memory_backend.snapshot(path)
+            restored = MemoryBackend()
+            restored.restore(path)
+
+        with self.assertRaises(ValueError) as context:
+            restored.records({"table_name": "users"}, user_model)
+        self.assertEqual(
+            "The columns of table 'users' (email, id, name) do not match the columns of its model (age, email, id, name)",
+            str(context.exception),
+        )
+        with self.assertRaises(ValueError) as context:
+            restored.create({"name": "user 2", "age": 5}, user_model)
+        self.assertIn("do not match the columns of its model", str(context.exception))
+        self.assertEqual(1, restored.count({"table_name": "users"}, self.user_model))
+
+    def test_snapshot_cleans_up(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # the snapshot can't be moved on top of a directory
+            os.mkdir(os.path.join(directory, "snapshot"))
+            with self.assertRaises(OSError):
+                self.memory_backend.snapshot(os.path.join(directory, "snapshot"))
+            self.assertEqual(["snapshot"], os.listdir(directory))
+
+
+class CompactMemoryBackendTest(MemoryBackendTest):
+    compact_rows = True
+
+    def test_compact_rows(self):
+        self.memory_backend.create({"id": "1-2-3-4", "name": "Conor", "email": "c@example.com"}, self.user_model)
+        users = self.memory_backend._tables["users"]
+        self.assertIsInstance(users._rows[0], CompactRow)
+
+        updated = self.memory_backend.update("1-2-3-4", {"name": "Ronoc"}, self.user_model)
+        records = self.memory_backend.records({"table_name": "users"}, self.user_model)
+        self.assertEqual({"id": "1-2-3-4", "name": "Ronoc", "email": "c@example.com"}, updated)
+        self.assertEqual([updated], records)
+        self.assertEqual(dict, type(updated))
+        self.assertEqual(dict, type(records[0]))
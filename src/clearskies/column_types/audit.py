@@ -50,6 +50,7 @@ class Audit(has_many.HasMany):
         "parent_class_name",
         "parent_id_column_name",
         "where",
+        "preload",
     ]
 
     def __init__(self, di):
@@ -119,6 +120,9 @@ class Audit(has_many.HasMany):
     def provide(self, data, column_name):
         return super().provide(data, column_name).where("class=" + self.config("parent_class_name"))
 
+    def _child_models_for_preload(self):
+        return super()._child_models_for_preload().where("class=" + self.config("parent_class_name"))
+
     def save_finished(self, model):
         super().save_finished(model)
         old_data = model._previous_data
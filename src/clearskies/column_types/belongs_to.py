@@ -142,6 +142,39 @@ class BelongsTo(String):
             return self.parent_models.where(f"{parent_id_column_name}={parent_id}").first()
         return self.parent_models.empty_model()
 
+    def provide_for_page(self, data, column_name, page):
+        # if the parent data was joined in or we don't have a parent, then we have nothing to batch
+        alias = self.join_table_alias()
+        parent_id_column_name = self.parent_models.get_id_column_name()
+        parent_id = data.get(self.name)
+        if f"{alias}_{parent_id_column_name}" in data or not parent_id:
+            return self.provide(data, column_name)
+
+        # otherwise, the first time anyone asks, load the parents for every record in the page with a single query,
+        # and then hand them out as needed.
+        if self.name not in page["preloaded"]:
+            page["preloaded"][self.name] = self._load_parents_for_rows(page["rows"])
+        parent = page["preloaded"][self.name].get(str(parent_id))
+        if parent is not None:
+            return parent
+
+        # not all backends compare ids the same way, so fall back on a direct lookup if we missed it.
+        return self.provide(data, column_name)
+
+    def _load_parents_for_rows(self, rows):
+        parent_ids = []
+        for row in rows:
+            parent_id = row.get(self.name)
+            if parent_id and parent_id not in parent_ids:
+                parent_ids.append(parent_id)
+        if not parent_ids:
+            return {}
+
+        parent_models = self.parent_models
+        parent_id_column_name = parent_models.get_id_column_name()
+        parents = parent_models.where_in(parent_id_column_name, parent_ids)
+        return {str(parent.get(parent_id_column_name)): parent for parent in parents}
+
     def join_table_alias(self):
         return self.parent_models.table_name() + "_" + self.name
 
@@ -188,7 +221,7 @@ class BelongsTo(String):
         if parent.id_column_name not in self.config("readable_parent_columns"):
             json[parent.id_column_name] = list(columns[parent.id_column_name].to_json(parent).values())[0]
         for column_name in self.config("readable_parent_columns"):
-            json = {**json, **columns[column_name].to_json(parent)}
+            json.update(columns[column_name].to_json(parent))
         id_less_name = self.config("model_column_name")
         return {
             **super().to_json(model),
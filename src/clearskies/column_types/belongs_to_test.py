@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import MagicMock, call
+from unittest.mock import MagicMock, call, patch
 from collections import OrderedDict
 from .belongs_to import BelongsTo
 from .string import String
@@ -21,6 +21,19 @@ class TestModel(Model):
         )
 
 
+class ChildModel(Model):
+    def __init__(self, memory_backend, columns):
+        super().__init__(memory_backend, columns)
+
+    def columns_configuration(self):
+        return OrderedDict(
+            [
+                ("name", {"class": String}),
+                ("test_model_id", {"class": BelongsTo, "parent_models_class": TestModel}),
+            ]
+        )
+
+
 class BelongsToTest(unittest.TestCase):
     def setUp(self):
         self.di = StandardDependencies(
@@ -76,3 +89,46 @@ class BelongsToTest(unittest.TestCase):
         user = self.belongs_to.provide({"user_id": "2"}, "user_id")
         self.assertEqual("2", user.id)
         self.assertEqual("hey", user.name)
+
+    def test_provide_for_page(self):
+        self.models.create({"id": "1", "name": "parent 1"})
+        self.models.create({"id": "2", "name": "parent 2"})
+        children = self.di.build(ChildModel)
+        children.create({"name": "child 1", "test_model_id": "1"})
+        children.create({"name": "child 2", "test_model_id": "2"})
+        children.create({"name": "child 3", "test_model_id": "1"})
+        children.create({"name": "child 4", "test_model_id": "3"})
+
+        memory_backend = self.di.build("memory_backend", cache=True)
+        with patch.object(memory_backend, "records", wraps=memory_backend.records) as records:
+            parent_names = [child.test_model.name for child in children]
+            # one query for the children, one for all the parents, and a direct lookup for the missing parent
+            self.assertEqual(3, records.call_count)
+
+        self.assertEqual(["parent 1", "parent 2", "parent 1", None], parent_names)
+
+    def test_provide_for_page_comma_id(self):
+        self.models.create({"id": "1", "name": "parent 1"})
+        self.models.create({"id": "a,b", "name": "parent a,b"})
+        children = self.di.build(ChildModel)
+        children.create({"name": "child 1", "test_model_id": "a,b"})
+        children.create({"name": "child 2", "test_model_id": "1"})
+
+        memory_backend = self.di.build("memory_backend", cache=True)
+        with patch.object(memory_backend, "records", wraps=memory_backend.records) as records:
+            parent_names = [child.test_model.name for child in children]
+            # one query for the children, one for the parents in the IN list, and one for the id with a comma
+            self.assertEqual(3, records.call_count)
+            parent_lookups = [call_args[0][0]["wheres"] for call_args in records.call_args_list[1:]]
+
+        self.assertEqual(["parent a,b", "parent 1"], parent_names)
+        self.assertEqual(
+            [
+                [{"column": "id", "operator": "IN", "values": ["1"]}],
+                [{"column": "id", "operator": "=", "values": ["a,b"]}],
+            ],
+            [
+                [{key: where[key] for key in ["column", "operator", "values"]} for where in wheres]
+                for wheres in parent_lookups
+            ],
+        )
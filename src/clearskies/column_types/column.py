@@ -181,6 +181,15 @@ class Column(ABC):
         """
         return value
 
+    def from_backend_many(self, values):
+        """
+        Takes a list of database representations and returns a list of python representations
+
+        This is used to convert the column for a whole page of results at once.  By default it just calls
+        from_backend for each value, but columns with expensive conversions can override it.
+        """
+        return [self.from_backend(value) for value in values]
+
     def to_backend(self, data):
         """
         Makes any changes needed to save the data to the backend.
@@ -196,6 +205,19 @@ class Column(ABC):
         """
         return {self.name: model.get(self.name, silent=True)}
 
+    def json_value_getter(self):
+        """
+        Returns a function that takes a model and returns the JSON value for this column
+
+        Handlers use this to serialize many models quickly: the function should return the same thing as
+        `to_json(model)[self.name]`.  If to_json returns anything other than just the column name then this
+        returns None, and the handler will call to_json instead.
+        """
+        if type(self).to_json is not Column.to_json:
+            return None
+        name = self.name
+        return lambda model: model.get(name, silent=True)
+
     def input_errors(self, model, data):
         error = self.check_input(model, data)
         if error:
@@ -303,6 +325,17 @@ class Column(ABC):
         """
         pass
 
+    def provide_for_page(self, data, column_name, page):
+        """
+        Like self.provide, but called when the model came out of a query with other models.
+
+        `page` is a dictionary shared by all the models returned by the same query.  `page["rows"]` holds the raw
+        data for every record in the page, and `page["preloaded"]` is a cache that columns can use to store
+        related records after loading them for the whole page in one go.  The default behavior is to ignore
+        the page and call self.provide.
+        """
+        return self.provide(data, column_name)
+
     def execute_actions(self, actions, model):
         for action in actions:
             if type(action) == binding_config.BindingConfig:
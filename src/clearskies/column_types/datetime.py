@@ -1,6 +1,5 @@
 from .column import Column
 from datetime import datetime, timezone
-import dateparser
 from ..autodoc.schema import DateTime as AutoDocDateTime
 
 
@@ -31,11 +30,42 @@ class DateTime(Column):
         if not value or value == self.config("default_date"):
             date = None
         elif type(value) == str:
-            date = dateparser.parse(value)
+            date = self._parse_date(value)
         else:
             date = value
         return date.replace(tzinfo=self._timezone) if date else None
 
+    def from_backend_many(self, values):
+        # rows very often share the same dates, so only convert each distinct string once
+        converted = {}
+        dates = []
+        for value in values:
+            if type(value) != str:
+                dates.append(self.from_backend(value))
+                continue
+            if value not in converted:
+                converted[value] = self.from_backend(value)
+            dates.append(converted[value])
+        return dates
+
+    def _parse_date(self, value):
+        """
+        Parses a date string from the backend.
+
+        dateparser is very flexible but also very slow, so first try the date formats that the backend is
+        most likely to give us: ISO 8601 and the configured date format.
+        """
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+        try:
+            return datetime.strptime(value, self.config("date_format"))
+        except ValueError:
+            import dateparser
+
+            return dateparser.parse(value)
+
     def to_backend(self, data):
         if not self.name in data or type(data[self.name]) == str or data[self.name] == None:
             return data
@@ -47,7 +77,20 @@ class DateTime(Column):
         datetime = model.get(self.name, silent=True)
         return {self.name: datetime.isoformat() if datetime else None}
 
+    def json_value_getter(self):
+        if type(self).to_json is not DateTime.to_json:
+            return None
+        name = self.name
+
+        def getter(model):
+            datetime = model.get(name, silent=True)
+            return datetime.isoformat() if datetime else None
+
+        return getter
+
     def build_condition(self, value, operator=None, column_prefix=""):
+        import dateparser
+
         date = dateparser.parse(value).astimezone(self._timezone).strftime(self.config("date_format"))
         if not operator:
             operator = "="
@@ -60,6 +103,8 @@ class DateTime(Column):
         return operator in ["=", "<", ">", "<=", ">="]
 
     def input_error_for_value(self, value, operator=None):
+        import dateparser
+
         value = dateparser.parse(value)
         if not value:
             return "given value did not appear to be a valid date"
@@ -71,6 +116,8 @@ class DateTime(Column):
         """
         Compares two values to see if they are the same
         """
+        import dateparser
+
         # in this function we deal with data directly out of the backend, so our date is likely
         # to be string-ified and we want to look for default (e.g. null) values in string form.
         if type(value_1) == str and "0000-00-00" in value_1:
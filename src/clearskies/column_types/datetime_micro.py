@@ -1,6 +1,5 @@
 from .datetime import DateTime
 from datetime import datetime, timezone
-import dateparser
 from ..autodoc.schema import DateTime as AutoDocDateTime
 
 
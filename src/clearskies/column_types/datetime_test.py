@@ -1,7 +1,7 @@
 import unittest
 from .datetime import DateTime
 from datetime import datetime, timezone
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 
 class DateTimeTest(unittest.TestCase):
@@ -18,6 +18,18 @@ class DateTimeTest(unittest.TestCase):
         self.assertEqual(45, date.second)
         self.assertEqual(timezone.utc, date.tzinfo)
 
+    def test_from_backend_many(self):
+        datetime_column = DateTime("di", timezone.utc)
+        datetime_column.configure("created", {}, int)
+        with patch("dateparser.parse", return_value=datetime(2021, 1, 7)) as parse:
+            dates = datetime_column.from_backend_many(
+                ["2020-11-28 12:30:45", "2020-11-28T12:30:45+00:00", "2020-11-28 12:30:45", "Jan 7 2021", None]
+            )
+            parse.assert_called_once_with("Jan 7 2021")
+        expected = datetime(2020, 11, 28, 12, 30, 45, tzinfo=timezone.utc)
+        self.assertEqual([expected, expected, expected, datetime(2021, 1, 7, tzinfo=timezone.utc), None], dates)
+        self.assertIs(dates[0], dates[2])
+
     def test_to_backend(self):
         date = DateTime("di", timezone.utc)
         date.configure("created", {}, int)
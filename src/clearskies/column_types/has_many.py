@@ -16,6 +16,10 @@ class HasMany(Column):
 
     It assumes that the foreign id in the child table is `[parent_model_class_name]_id` in all lower case.
     e.g., if the parent model class is named Status, then it assumes an id in the child class called `status_id`.
+
+    Set `preload` to True to fetch the children for every parent in a page of results (e.g. in a list or search
+    endpoint) with a single query, instead of running a separate query for each parent.  This only applies if
+    all of the `where` conditions are strings, since callables are evaluated separately for each parent.
     """
 
     required_configs = [
@@ -29,6 +33,7 @@ class HasMany(Column):
         "readable_child_columns",
         "parent_id_column_name",
         "where",
+        "preload",
     ]
 
     def __init__(self, di):
@@ -90,6 +95,9 @@ class HasMany(Column):
                         + "column does not exist in the model class."
                     )
 
+        if "preload" in configuration and type(configuration["preload"]) != bool:
+            raise ValueError(f"{error_prefix} 'preload' must be a boolean")
+
         wheres = configuration.get("where")
         if wheres:
             if not isinstance(wheres, list):
@@ -139,21 +147,62 @@ class HasMany(Column):
                 children = children.where(where)
         return children
 
+    def provide_for_page(self, data, column_name, page):
+        child_rows = self._preloaded_child_rows(data, page)
+        if child_rows is None:
+            return self.provide(data, column_name)
+        return self.provide(data, column_name).preloaded(child_rows)
+
+    def _preloaded_child_rows(self, data, page):
+        """
+        Returns the raw child records for the given parent, loading the children for the whole page if needed.
+
+        Returns None if preloading is not possible, in which case the children should be fetched normally.
+        """
+        id_column_name = self.config("parent_id_column_name")
+        if not self.config("preload", silent=True) or not data.get(id_column_name):
+            return None
+        for where in self.config("where"):
+            if callable(where):
+                return None
+
+        if self.name not in page["preloaded"]:
+            page["preloaded"][self.name] = self._load_child_rows_for_page(page["rows"])
+        return page["preloaded"][self.name].get(str(data[id_column_name]), [])
+
+    def _load_child_rows_for_page(self, rows):
+        id_column_name = self.config("parent_id_column_name")
+        parent_ids = []
+        for row in rows:
+            parent_id = row.get(id_column_name)
+            if parent_id and parent_id not in parent_ids:
+                parent_ids.append(parent_id)
+        if not parent_ids:
+            return {}
+
+        foreign_column_name = self.config("foreign_column_name")
+        # this follows the pagination (if the backend pages its results) so that no parent loses any children
+        children = self._child_models_for_preload().where_in(foreign_column_name, parent_ids)
+        child_rows = {}
+        for child in children:
+            child_rows.setdefault(str(child.data.get(foreign_column_name)), []).append(child.data)
+        return child_rows
+
+    def _child_models_for_preload(self):
+        """Returns the child models with all the usual conditions applied, except for the parent id"""
+        children = self.child_models
+        for where in self.config("where"):
+            children = children.where(where)
+        return children
+
     def to_json(self, model):
         children = []
         columns = self.get_child_columns()
         for child in model.__getattr__(self.name):
             json = OrderedDict()
-            child_id_column_name = child.id_column_name
-            json = {
-                **json,
-                **columns[child_id_column_name].to_json(child),
-            }
+            json.update(columns[child.id_column_name].to_json(child))
             for column_name in self.config("readable_child_columns"):
-                json = {
-                    **json,
-                    **columns[column_name].to_json(child),
-                }
+                json.update(columns[column_name].to_json(child))
             children.append(json)
         return {self.name: children}
 
@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 from .has_many import HasMany
 from ..models import Models
 from ..model import Model
@@ -135,6 +136,46 @@ class HasManyTest(unittest.TestCase):
             self.has_many_users.to_json(self.pending),
         )
 
+    def test_preload(self):
+        has_many = HasMany(self.di)
+        has_many.configure("users", {"child_models_class": Users, "preload": True}, Status)
+        page = {"rows": [self.pending.data, self.approved.data], "preloaded": {}}
+        memory_backend = self.di.build("memory_backend", cache=True)
+        with patch.object(memory_backend, "records", wraps=memory_backend.records) as records:
+            pending_users = has_many.provide_for_page(self.pending.data, "users", page)
+            approved_users = has_many.provide_for_page(self.approved.data, "users", page)
+            self.assertEqual(["John", "Jane"], [user.first_name for user in pending_users])
+            self.assertEqual(["Janet"], [user.first_name for user in approved_users])
+            self.assertEqual(2, len(pending_users))
+            self.assertEqual(1, records.call_count)
+
+            # further filtering goes back to the backend
+            self.assertEqual(["Jane"], [user.first_name for user in pending_users.where("first_name=Jane")])
+            self.assertEqual(2, records.call_count)
+
+    def test_preload_comma_ids_and_pages(self):
+        memory_backend = self.di.build("memory_backend", cache=True)
+        memory_backend.create({"id": "a,b", "name": "comma"}, self.statuses.model_class())
+        self.users.create({"status_id": "a,b", "first_name": "Jim", "last_name": "Doe"})
+        has_many = HasMany(self.di)
+        has_many.configure("users", {"child_models_class": Users, "preload": True}, Status)
+        comma = self.statuses.find("id=a,b")
+        page = {"rows": [self.pending.data, comma.data], "preloaded": {}}
+
+        # a backend that only returns one record at a time
+        records = memory_backend.records
+
+        def paged_records(configuration, model, next_page_data=None):
+            return records({**configuration, "limit": 1}, model, next_page_data=next_page_data)
+
+        with patch.object(memory_backend, "records", side_effect=paged_records) as paged:
+            pending_users = has_many.provide_for_page(self.pending.data, "users", page)
+            comma_users = has_many.provide_for_page(comma.data, "users", page)
+            self.assertEqual(["John", "Jane"], [user.first_name for user in pending_users])
+            self.assertEqual(["Jim"], [user.first_name for user in comma_users])
+            # two pages for the IN list, and one for the id with a comma
+            self.assertEqual(3, paged.call_count)
+
     def test_auto_foreign_column(self):
         has_many = HasMany(self.di)
         has_many.configure("users", {"child_models_class": Users}, Status)
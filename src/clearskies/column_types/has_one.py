@@ -27,20 +27,25 @@ class HasOne(HasMany):
             return self.child_models.empty_model()
         return self.child_models.find(f"{foreign_column_name}={data[id_column_name]}")
 
+    def provide_for_page(self, data, column_name, page):
+        child_rows = self._preloaded_child_rows(data, page)
+        if child_rows is None:
+            return self.provide(data, column_name)
+        if not child_rows:
+            return self.child_models.empty_model()
+        return self.child_models.model(child_rows[0])
+
+    def _child_models_for_preload(self):
+        # unlike has many, has one doesn't apply any additional conditions
+        return self.child_models
+
     def to_json(self, model):
         json = OrderedDict()
         columns = self.get_child_columns()
         child = model.__getattr__(self.name)
-        child_id_column_name = child.id_column_name
-        json = {
-            **json,
-            **columns[child_id_column_name].to_json(child),
-        }
+        json.update(columns[child.id_column_name].to_json(child))
         for column_name in self.config("readable_child_columns"):
-            json = {
-                **json,
-                **columns[column_name].to_json(child),
-            }
+            json.update(columns[column_name].to_json(child))
         return {self.name: json}
 
     def documentation(self, name=None, example=None, value=None):
@@ -23,3 +23,9 @@ class JSON(Column):
 
     def to_json(self, model):
         return {self.name: model.get(self.name, silent=True)}
+
+    def json_value_getter(self):
+        if type(self).to_json is not JSON.to_json:
+            return None
+        name = self.name
+        return lambda model: model.get(name, silent=True)
@@ -148,12 +148,18 @@ class ManyToMany(String):
     def input_error_for_value(self, value, operator=None):
         if type(value) != list:
             return f"{self.name} should be a list of ids"
-        related_models = self.related_models
-        related_id_column_name = self.config("related_id_column_name")
         for id_to_check in value:
             if type(id_to_check) != str:
                 return f"Invalid selection for {self.name}: all values must be strings"
-            if not len(related_models.where(f"{related_id_column_name}={id_to_check}")):
+        if not value:
+            return ""
+
+        # check all the ids with one query
+        related_id_column_name = self.config("related_id_column_name")
+        matching_related = self.related_models.where_in(related_id_column_name, value)
+        existing_ids = set([str(related.get(related_id_column_name)) for related in matching_related])
+        for id_to_check in value:
+            if id_to_check not in existing_ids:
                 return f"Invalid selection for {self.name}: record {id_to_check} does not exist"
         return ""
 
@@ -173,6 +179,79 @@ class ManyToMany(String):
             return [model for model in related_models]
         return [model.__getattr__(related_id_column_name) for model in related_models]
 
+    def provide_for_page(self, data, column_name, page):
+        own_id = data.get(self.config("own_id_column_name"))
+        if not own_id:
+            return self.provide(data, column_name)
+
+        related_models = self._related_for_page(page).get(str(own_id), [])
+        if column_name == self.name:
+            return [*related_models]
+        related_id_column_name = self.config("related_id_column_name")
+        return [model.__getattr__(related_id_column_name) for model in related_models]
+
+    def _pivots_for_page(self, page):
+        """
+        Returns the pivot models for every record in the page, grouped by the id of the record they belong to.
+
+        The pivot records are loaded with a single query the first time this is called for a given page.
+        """
+        cache_key = (self.name, "pivots")
+        if cache_key in page["preloaded"]:
+            return page["preloaded"][cache_key]
+
+        own_column_name_in_pivot = self.config("own_column_name_in_pivot")
+        own_id_column_name = self.config("own_id_column_name")
+        own_ids = []
+        for row in page["rows"]:
+            own_id = row.get(own_id_column_name)
+            if own_id and own_id not in own_ids:
+                own_ids.append(own_id)
+
+        pivots = {}
+        if own_ids:
+            for pivot in self.pivot_models.where_in(own_column_name_in_pivot, own_ids):
+                pivots.setdefault(str(pivot.data.get(own_column_name_in_pivot)), []).append(pivot)
+        page["preloaded"][cache_key] = pivots
+        return pivots
+
+    def _related_for_page(self, page):
+        """
+        Returns the related models for every record in the page, grouped by the id of the record they belong to.
+
+        This takes two queries per page: one for the pivot table and one for the related table.
+        """
+        cache_key = (self.name, "related")
+        if cache_key in page["preloaded"]:
+            return page["preloaded"][cache_key]
+
+        foreign_column_name_in_pivot = self.config("foreign_column_name_in_pivot")
+        related_id_column_name = self.config("related_id_column_name")
+        pivots = self._pivots_for_page(page)
+        related_ids = []
+        for own_pivots in pivots.values():
+            for pivot in own_pivots:
+                related_id = pivot.data.get(foreign_column_name_in_pivot)
+                if related_id and related_id not in related_ids:
+                    related_ids.append(related_id)
+
+        # keep track of the order that the backend returned the related records in, so we can return them the same
+        # way that self.provide would.
+        related_by_id = OrderedDict()
+        if related_ids:
+            for related in self.related_models.where_in(related_id_column_name, related_ids):
+                related_by_id[str(related.get(related_id_column_name))] = related
+        related_order = {related_id: index for (index, related_id) in enumerate(related_by_id.keys())}
+
+        grouped_related = {}
+        for own_id, own_pivots in pivots.items():
+            own_related_ids = [str(pivot.data.get(foreign_column_name_in_pivot)) for pivot in own_pivots]
+            own_related_ids = [related_id for related_id in own_related_ids if related_id in related_by_id]
+            own_related_ids.sort(key=lambda related_id: related_order[related_id])
+            grouped_related[own_id] = [related_by_id[related_id] for related_id in own_related_ids]
+        page["preloaded"][cache_key] = grouped_related
+        return grouped_related
+
     def to_backend(self, data):
         # we can't persist our mapping data to the database directly, so remove anything here
         # and take care of things in post_save
@@ -198,9 +277,7 @@ class ManyToMany(String):
         if to_delete:
             pivot_models = self.pivot_models
             foreign_column_name = self.config("foreign_column_name_in_pivot")
-            for model_to_delete in pivot_models.where(
-                f"{foreign_column_name} IN ({','.join(map(str, to_delete))})"
-            ):
+            for model_to_delete in pivot_models.where_in(foreign_column_name, to_delete):
                 model_to_delete.delete()
         if to_create:
             pivot_models = self.pivot_models
@@ -254,7 +331,7 @@ class ManyToMany(String):
             for column_name in self.config("readable_related_columns"):
                 column_data = columns[column_name].to_json(related)
                 if type(column_data) == dict:
-                    json = {**json, **column_data}
+                    json.update(column_data)
                 else:
                     json[column_name] = column_data
             records.append(json)
@@ -0,0 +1,84 @@
+import unittest
+from unittest.mock import patch
+from ..model import Model
+from .string import String
+from .many_to_many import ManyToMany
+from collections import OrderedDict
+from ..di import StandardDependencies
+
+
+class Tags(Model):
+    def __init__(self, memory_backend, columns):
+        super().__init__(memory_backend, columns)
+
+    def columns_configuration(self):
+        return OrderedDict(
+            [
+                ("name", {"class": String}),
+            ]
+        )
+
+
+class PostTags(Model):
+    def __init__(self, memory_backend, columns):
+        super().__init__(memory_backend, columns)
+
+    def columns_configuration(self):
+        return OrderedDict(
+            [
+                ("post_id", {"class": String}),
+                ("tag_id", {"class": String}),
+            ]
+        )
+
+
+class Posts(Model):
+    def __init__(self, memory_backend, columns):
+        super().__init__(memory_backend, columns)
+
+    def columns_configuration(self):
+        return OrderedDict(
+            [
+                (
+                    "tags",
+                    {
+                        "class": ManyToMany,
+                        "pivot_models_class": PostTags,
+                        "related_models_class": Tags,
+                        "foreign_column_name_in_pivot": "tag_id",
+                        "own_column_name_in_pivot": "post_id",
+                    },
+                ),
+                ("title", {"class": String}),
+            ]
+        )
+
+
+class ManyToManyTest(unittest.TestCase):
+    def setUp(self):
+        self.di = StandardDependencies()
+        self.posts = self.di.build(Posts)
+        self.tags = self.di.build(Tags)
+        self.post_tags = self.di.build(PostTags)
+        self.memory_backend = self.di.build("memory_backend", cache=True)
+        self.news = self.tags.create({"name": "news"})
+        # ids can be anything, including strings that have commas in them
+        self.memory_backend.create({"id": "a,b", "name": "comma"}, self.tags.model_class())
+
+    def test_comma_ids(self):
+        first = self.posts.create({"title": "first", "tags": [self.news.id, "a,b"]})
+        second = self.posts.create({"title": "second", "tags": ["a,b"]})
+        self.assertEqual(
+            {(first.id, self.news.id), (first.id, "a,b"), (second.id, "a,b")},
+            {(pivot.post_id, pivot.tag_id) for pivot in self.post_tags},
+        )
+
+        with patch.object(self.memory_backend, "records", wraps=self.memory_backend.records) as records:
+            tag_ids = [post.tags_ids for post in self.posts]
+            # the posts, the pivots, the tags in the IN list, and the tag with a comma in its id
+            self.assertEqual(4, records.call_count)
+        self.assertEqual([[self.news.id, "a,b"], ["a,b"]], tag_ids)
+
+        # removing the tag removes its pivot record
+        first.save({"tags": [self.news.id]})
+        self.assertEqual([self.news.id], [pivot.tag_id for pivot in self.post_tags.where(f"post_id={first.id}")])
@@ -135,9 +135,7 @@ class ManyToManyWithData(ManyToMany):
         if to_delete:
             pivot_models = self.pivot_models
             foreign_column_name = self.config("foreign_column_name_in_pivot")
-            for model_to_delete in pivot_models.where(
-                f"{foreign_column_name} IN (" + ",".join(map(str, to_delete)) + ")"
-            ):
+            for model_to_delete in pivot_models.where_in(foreign_column_name, to_delete):
                 model_to_delete.delete()
 
         return data
@@ -160,3 +158,12 @@ class ManyToManyWithData(ManyToMany):
         own_column_name_in_pivot = self.config("own_column_name_in_pivot")
         my_id = data[self.config("own_id_column_name")]
         return [model for model in self.pivot_models.where(f"{own_column_name_in_pivot}={my_id}")]
+
+    def provide_for_page(self, data, column_name, page):
+        if column_name != f"{self.name}_pivots":
+            return super().provide_for_page(data, column_name, page)
+
+        my_id = data.get(self.config("own_id_column_name"))
+        if not my_id:
+            return self.provide(data, column_name)
+        return [*self._pivots_for_page(page).get(str(my_id), [])]
@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 from .has_many import HasMany
 from ..models import Models
 from ..model import Model
@@ -192,3 +193,44 @@ class HasManyTest(unittest.TestCase):
             ],
             pivot_records,
         )
+
+    def test_provide_for_page(self):
+        self.jane.save({"statuses": [{"status_id": self.pending.id, "blah": "okay"}]})
+
+        memory_backend = self.di.build("memory_backend", cache=True)
+        with patch.object(memory_backend, "records", wraps=memory_backend.records) as records:
+            users = list(self.users)
+            self.assertEqual([[self.approved.id], [self.pending.id]], [user.statuses_ids for user in users])
+            self.assertEqual([["approved"], ["pending"]], [[status.name for status in user.statuses] for user in users])
+            self.assertEqual(
+                [["i am john"], ["okay"]], [[pivot.blah for pivot in user.statuses_pivots] for user in users]
+            )
+            # one query each for the users, the pivots, and the statuses
+            self.assertEqual(3, records.call_count)
+
+    def test_input_error_for_value(self):
+        memory_backend = self.di.build("memory_backend", cache=True)
+        memory_backend.create({"id": "a,b", "name": "comma"}, self.statuses.model_class())
+        statuses = self.users.columns()["statuses"]
+        self.assertEqual("", statuses.input_error_for_value([str(self.pending.id), "a,b"]))
+        self.assertEqual(
+            "Invalid selection for statuses: record a does not exist",
+            statuses.input_error_for_value([str(self.pending.id), "a"]),
+        )
+        self.assertEqual(
+            "Invalid selection for statuses: all values must be strings", statuses.input_error_for_value([5])
+        )
+
+    def test_comma_ids(self):
+        memory_backend = self.di.build("memory_backend", cache=True)
+        memory_backend.create({"id": "a,b", "name": "comma"}, self.statuses.model_class())
+        self.jane.save({"statuses": [{"status_id": "a,b", "blah": "comma"}]})
+        jane = self.users.find(f"id={self.jane.id}")
+        self.assertEqual(["a,b"], jane.statuses_ids)
+        self.assertEqual(["a,b"], [user.statuses_ids for user in self.users][1])
+
+        # removing the status removes its pivot record
+        jane.save({"statuses": [{"status_id": self.pending.id, "blah": "okay"}]})
+        self.assertEqual(
+            [self.pending.id], [pivot.status_id for pivot in self.users_statuses.where(f"user_id={self.jane.id}")]
+        )
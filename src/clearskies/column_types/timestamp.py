@@ -1,7 +1,6 @@
 import time
 from .datetime import DateTime
 from datetime import datetime, timezone
-import dateparser
 from ..autodoc.schema import DateTime as AutoDocDateTime
 
 
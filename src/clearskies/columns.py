@@ -7,6 +7,46 @@ from .binding_config import BindingConfig
 class Columns:
     def __init__(self, di):
         self.di = di
+        self._compiled = {}
+        self._compiled_version = None
+
+    def compiled(self, model, overrides=None):
+        """
+        Returns the configured columns for the model's class (and overrides), building them only once.
+
+        The same column objects are shared by every model of the class, so they must be treated as read-only.  The
+        cache is cleared automatically when the DI bindings change, and `clear_compiled()` clears it explicitly
+        (e.g. for tests that change column definitions on the fly).
+        """
+        version = getattr(self.di, "_bindings_version", None)
+        if version != self._compiled_version:
+            self._compiled = {}
+            self._compiled_version = version
+
+        # overrides are keyed on identity and kept in the cache along with the columns, so the id can't be reused
+        key = (model.__class__, id(overrides) if overrides is not None else None)
+        if key not in self._compiled:
+            columns = self.configure(model.all_columns(), model.__class__, overrides=overrides)
+            self._compiled[key] = (overrides, columns, {})
+        return self._compiled[key][1]
+
+    def compiled_providers(self, model):
+        """
+        Returns the (initially empty) lookup table of column name to providing column for the model's class.
+
+        It is shared by every model of the class and cleared along with the compiled columns.
+        """
+        self.compiled(model)
+        return self._compiled[(model.__class__, None)][2]
+
+    def clear_compiled(self, model_class=None):
+        """
+        Clears the cache of compiled columns, either for one model class or for all of them.
+        """
+        if model_class is None:
+            self._compiled = {}
+            return
+        self._compiled = {key: value for (key, value) in self._compiled.items() if key[0] != model_class}
 
     def configure(self, definitions, model_class, overrides=None):
         columns = OrderedDict()
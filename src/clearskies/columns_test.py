@@ -90,3 +90,28 @@ class ColumnsTest(unittest.TestCase):
         self.assertEqual(5, first_name_requirements[0].maximum_length)
         self.assertEqual(2, first_name_requirements[2].minimum_length)
         self.assertEqual(25, last_name_requirements[0].maximum_length)
+
+    def test_compiled(self):
+        class User(Model):
+            def __init__(self, memory_backend, columns):
+                super().__init__(memory_backend, columns)
+
+            def columns_configuration(self):
+                return {"name": {"class": String}}
+
+        first = User("backend", self.columns)
+        second = User("backend", self.columns)
+        self.assertIs(first.columns(), second.columns())
+        self.assertEqual(["id", "name"], list(first.columns().keys()))
+
+        overrides = {"age": {"class": Integer}}
+        self.assertIs(first.columns(overrides=overrides), second.columns(overrides=overrides))
+        self.assertEqual(["id", "name", "age"], list(first.columns(overrides=overrides).keys()))
+
+        # changing the bindings invalidates the cache
+        self.di.bind("something", "else")
+        self.assertIsNot(first.columns(), User("backend", self.columns).columns())
+
+        compiled = User("backend", self.columns).columns()
+        self.columns.clear_compiled(User)
+        self.assertIsNot(compiled, User("backend", self.columns).columns())
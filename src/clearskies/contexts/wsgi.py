@@ -1,3 +1,6 @@
+import contextvars
+import inspect
+from ..backends import ConnectionPool
 from ..input_outputs import WSGI as WSGIInputOutput
 from .build_context import build_context
 from .context import Context
@@ -11,8 +14,35 @@ class WSGI(Context):
         if self.handler is None:
             raise ValueError("Cannot execute WSGI context without first configuring it")
 
+        # each request runs in its own context (and DI request scope), so that concurrent requests
+        # don't see each other's input_output, authorization data, etc...
+        request_context = contextvars.copy_context()
+        streaming = False
+        try:
+            response = request_context.run(self._handle, env, start_response)
+            streaming = inspect.isgenerator(response)
+            return self._stream(response, request_context) if streaming else response
+        finally:
+            # hand any pooled database connections back, so the next request (on any thread) can use them
+            if not streaming:
+                ConnectionPool.release_all()
+
+    def _handle(self, env, start_response):
+        self.di.start_request_scope()
         return self.handler(WSGIInputOutput(env, start_response))
 
+    def _stream(self, response, request_context):
+        # streaming responses keep using the request (and the database) while the server iterates over them
+        try:
+            while True:
+                try:
+                    chunk = request_context.run(next, response)
+                except StopIteration:
+                    return
+                yield chunk
+        finally:
+            ConnectionPool.release_all()
+
 
 def wsgi(
     application,
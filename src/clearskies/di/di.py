@@ -1,29 +1,42 @@
 from ..binding_config import BindingConfig
 from .additional_config_auto_import import AdditionalConfigAutoImport
+import contextvars
 import inspect
 import re
 import sys
 import os
+import threading
+import weakref
 from ..functional import string
 
 
 class DI:
     _bindings = None
-    _building = None
+    _building_local = None
+    _request_scope = None
     _classes = None
     _prepared = None
     _added_modules = None
     _additional_configs = None
     _class_mocks = None
+    _class_plans = None
+    _call_plans = None
+
+    # bumped whenever bindings change, so that anything built from the DI and cached elsewhere knows to rebuild
+    _bindings_version = 0
 
     def __init__(self, classes=None, modules=None, bindings=None, additional_configs=None):
         self._bindings = {}
         self._prepared = {}
         self._classes = {}
-        self._building = {}
+        self._building_local = threading.local()
+        self._request_scope = contextvars.ContextVar(f"di_request_scope_{id(self)}", default=None)
         self._added_modules = {}
         self._additional_configs = []
         self._class_mocks = {}
+        self._class_plans = weakref.WeakKeyDictionary()
+        self._call_plans = weakref.WeakKeyDictionary()
+        self._bindings_version = 0
         if classes is not None:
             self.add_classes(classes)
         if modules is not None:
@@ -34,6 +47,63 @@ class DI:
         if additional_configs is not None:
             self.add_additional_configs(additional_configs)
 
+    @property
+    def _building(self):
+        # what we're in the middle of building is tracked per-thread, since other threads may be building
+        # the same things at the same time.
+        if not hasattr(self._building_local, "building"):
+            self._building_local.building = {}
+        return self._building_local.building
+
+    def start_request_scope(self):
+        """
+        Starts a new request scope for the current context.
+
+        While a request scope is active, values bound with `bind` (like `input_output`) are only visible to the
+        current context, as is anything cached while building something that depends on them.  Everything else is
+        still cached in (and shared via) the DI container itself.  This is what lets one DI container serve
+        concurrent requests, and is meant to be called from inside `contextvars.copy_context().run(...)`, so that
+        the request scope goes away along with the context:
+
+        ```
+        def handle(input_output):
+            di.start_request_scope()
+            return handler(input_output)
+
+        contextvars.copy_context().run(handle, input_output)
+        ```
+        """
+        self._request_scope.set({"prepared": {}, "uses": 0})
+
+    def _get_prepared(self, name):
+        """
+        Returns a tuple with (True, value) if something with the given name has been prepared, or (False, None)
+        """
+        request_scope = self._request_scope.get()
+        if request_scope is not None and name in request_scope["prepared"]:
+            request_scope["uses"] += 1
+            return (True, request_scope["prepared"][name])
+        if name in self._prepared:
+            return (True, self._prepared[name])
+        return (False, None)
+
+    def _request_scope_uses(self):
+        request_scope = self._request_scope.get()
+        return request_scope["uses"] if request_scope is not None else 0
+
+    def _set_prepared(self, name, value, request_scope_uses):
+        """
+        Caches a built value.
+
+        If anything from the request scope was used while building it (e.g. the request scope uses went up
+        from the given value), then it is cached in the request scope, rather than shared.
+        """
+        request_scope = self._request_scope.get()
+        if request_scope is not None and request_scope["uses"] > request_scope_uses:
+            request_scope["prepared"][name] = value
+        else:
+            self._prepared[name] = value
+
     def add_classes(self, classes):
         if inspect.isclass(classes):
             classes = [classes]
@@ -113,9 +183,18 @@ class DI:
         if key in self._building:
             raise KeyError(f"Attempt to set binding for '{key}' while '{key}' was already being built")
 
+        # inside of a request scope, concrete values are only bound for the current request
+        request_scope = self._request_scope.get()
+        if request_scope is not None and not inspect.isclass(value) and not isinstance(value, BindingConfig):
+            request_scope["prepared"][key] = value
+            return
+
+        self._bindings_version += 1
+
         # classes and binding configs are placed in self._bindings, but any other prepared value goes straight
         # into self._prepared
         if inspect.isclass(value) or isinstance(value, BindingConfig):
+            self._clear_plans()
             self._bindings[key] = value
             if key in self._prepared:
                 del self._prepared[key]
@@ -158,19 +237,22 @@ class DI:
         if name == "di":
             return self
 
-        if name in self._prepared and cache:
-            return self._prepared[name]
+        if cache:
+            (is_prepared, prepared) = self._get_prepared(name)
+            if is_prepared:
+                return prepared
 
+        request_scope_uses = self._request_scope_uses()
         if name in self._bindings:
             built_value = self.build(self._bindings[name], context=context)
             if cache:
-                self._prepared[name] = built_value
+                self._set_prepared(name, built_value, request_scope_uses)
             return built_value
 
         if name in self._classes:
             built_value = self.build_class(self._classes[name]["class"], context=context)
             if cache:
-                self._prepared[name] = built_value
+                self._set_prepared(name, built_value, request_scope_uses)
             return built_value
 
         # additional configs are meant to override ones that come before, with most recent ones
@@ -181,21 +263,22 @@ class DI:
                 continue
             built_value = additional_config.build(name, self, context=context)
             if cache and self.call_function(additional_config.can_cache, name=name, context=context):
-                self._prepared[name] = built_value
+                self._set_prepared(name, built_value, request_scope_uses)
             return built_value
 
         if hasattr(self, f"provide_{name}"):
             built_value = self.call_function(getattr(self, f"provide_{name}"))
             if cache:
-                self._prepared[name] = built_value
+                self._set_prepared(name, built_value, request_scope_uses)
             return built_value
 
         # why twice?  When a "concrete" value is bound directly to a DI name, it is just
         # put directly in the cache.  Therefore, if cache=False, we won't find it (which is a bug).
         # Therefore, if we get to the very bottom, haven't found anything, but it is in the
         # cache: well, it's time to use the cache.
-        if name in self._prepared:
-            return self._prepared[name]
+        (is_prepared, prepared) = self._get_prepared(name)
+        if is_prepared:
+            return prepared
 
         context_note = f" for {context}" if context else ""
         raise ValueError(
@@ -219,6 +302,67 @@ class DI:
             )
 
         self._class_mocks[name] = replacement
+        self._bindings_version += 1
+        self._clear_plans()
+
+    def _clear_plans(self):
+        self._class_plans = weakref.WeakKeyDictionary()
+        self._call_plans = weakref.WeakKeyDictionary()
+
+    def _class_plan(self, class_to_build):
+        """
+        Returns a dictionary with the name and constructor arguments of a class, which is cached for speed.
+        """
+        try:
+            return self._class_plans[class_to_build]
+        except KeyError:
+            pass
+        init_args = inspect.getfullargspec(class_to_build)
+        plan = {
+            "name": string.camel_case_to_snake_case(class_to_build.__name__),
+            # ignore the first argument because that is just `self`
+            "build_arguments": init_args.args[1:],
+            "has_kwargs": init_args.defaults is not None,
+        }
+        self._class_plans[class_to_build] = plan
+        return plan
+
+    def _call_plan(self, callable_to_execute):
+        """
+        Returns a dictionary with the argument and keyword argument names for a callable, which is cached for speed.
+        """
+        # we need to decide if we've been passed a bound method, because then we need to ignore the
+        # first argument (aka `self`).  The simplest way to do this is to check for the `__self__` attr,
+        # but this will be fooled by methods with decorators.  There doesn't seem to be a good solution to this
+        # that works in all cases: https://stackoverflow.com/a/50074581/1921979
+        is_bound = hasattr(callable_to_execute, "__self__")
+        # bound methods are created fresh every time they are accessed, so cache by the underlying function
+        key = getattr(callable_to_execute, "__func__", callable_to_execute)
+        try:
+            plans = self._call_plans.get(key)
+        except TypeError:
+            # some callables can't be weakly referenced (or hashed), so we just don't cache those
+            return self._make_call_plan(callable_to_execute, is_bound)
+        if plans is None:
+            plans = {}
+            self._call_plans[key] = plans
+        if is_bound not in plans:
+            plans[is_bound] = self._make_call_plan(callable_to_execute, is_bound)
+        return plans[is_bound]
+
+    def _make_call_plan(self, callable_to_execute, is_bound):
+        args_data = inspect.getfullargspec(callable_to_execute)
+        call_arguments = args_data.args[1:] if is_bound else args_data.args
+
+        # separate out args and kwargs.  kwargs for the function are only allowed to come out of the kwargs
+        # we were passed.  If the function has a kwarg that we don't have, then ignore it.
+        # args come out of dependencies or the kwargs passed to us.  If an arg is missing, then throw an error.
+        nargs = len(call_arguments)
+        nkwargs = len(args_data.defaults) if args_data.defaults else 0
+        return {
+            "arg_names": call_arguments[: nargs - nkwargs],
+            "kwarg_names": call_arguments[nargs - nkwargs :],
+        }
 
     def build_class(self, class_to_build, context=None, name=None, cache=False):
         """
@@ -227,24 +371,26 @@ class DI:
         The class constructor cannot accept any kwargs.   See self._disallow_kwargs for more details
         """
         if name is None:
-            name = string.camel_case_to_snake_case(class_to_build.__name__)
-        if name in self._prepared and cache:
-            return self._prepared[name]
+            name = self._class_plan(class_to_build)["name"]
+        if cache:
+            (is_prepared, prepared) = self._get_prepared(name)
+            if is_prepared:
+                return prepared
 
         if name in self._class_mocks:
             class_to_build = self._class_mocks[name]
 
-        init_args = inspect.getfullargspec(class_to_build)
-        if init_args.defaults is not None:
+        plan = self._class_plan(class_to_build)
+        if plan["has_kwargs"]:
             self._disallow_kwargs(f"build class '{class_to_build.__name__}'")
 
-        # ignore the first argument because that is just `self`
-        build_arguments = init_args.args[1:]
+        build_arguments = plan["build_arguments"]
         if not build_arguments:
             built_value = class_to_build()
             if cache:
                 self._prepared[name] = built_value
             return built_value
+        request_scope_uses = self._request_scope_uses()
 
         # self._building will help us keep track of what we're already building, and what we are building it for.
         # This is partly to give better error messages, but mainly to detect cyclical dependency trees.
@@ -271,7 +417,7 @@ class DI:
 
         built_value = class_to_build(*args)
         if cache:
-            self._prepared[name] = built_value
+            self._set_prepared(name, built_value, request_scope_uses)
         return built_value
 
     def call_function(self, callable_to_execute, **kwargs):
@@ -280,23 +426,9 @@ class DI:
 
         Any kwargs passed to call_function will populate the equivalent dependencies
         """
-        args_data = inspect.getfullargspec(callable_to_execute)
-
-        # we need to decide if we've been passed a bound method, because then we need to ignore the
-        # first argument (aka `self`).  The simplest way to do this is to check for the `__self__` attr,
-        # but this will be fooled by methods with decorators.  There doesn't seem to be a good solution to this
-        # that works in all cases: https://stackoverflow.com/a/50074581/1921979
-        call_arguments = args_data.args
-        if hasattr(callable_to_execute, "__self__"):
-            call_arguments = call_arguments[1:]
-
-        # separate out args and kwargs.  kwargs for the function are only allowed to come out of the kwargs
-        # we were passed.  If the function has a kwarg that we don't have, then ignore it.
-        # args come out of dependencies or the kwargs passed to us.  If an arg is missing, then throw an error.
-        nargs = len(call_arguments)
-        nkwargs = len(args_data.defaults) if args_data.defaults else 0
-        arg_names = call_arguments[: nargs - nkwargs]
-        kwarg_names = call_arguments[nargs - nkwargs :]
+        plan = self._call_plan(callable_to_execute)
+        arg_names = plan["arg_names"]
+        kwarg_names = plan["kwarg_names"]
 
         callable_args = [
             kwargs[arg]
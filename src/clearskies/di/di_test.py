@@ -1,3 +1,5 @@
+import contextvars
+import inspect
 import unittest
 from unittest.mock import MagicMock, call
 from .di import DI
@@ -49,6 +51,12 @@ class AnotherClass:
         self.more_classes = more_classes
 
 
+class UsesRequest:
+    def __init__(self, request_name, some_class):
+        self.request_name = request_name
+        self.some_class = some_class
+
+
 class MoreAdditionalConfig(AdditionalConfig):
     def provide_really_awesome_stuff(self, some_class):
         return MoreStuff(some_class, "hey")
@@ -94,3 +102,38 @@ class ModelTest(unittest.TestCase):
             + "is a dependency of both 'WillBeCircular' and itself",
             str(context.exception),
         )
+
+    def test_request_scope(self):
+        self.di.add_classes([UsesRequest])
+        shared = self.di.build("some_class", cache=True)
+
+        def request(name):
+            self.di.start_request_scope()
+            self.di.bind("request_name", name)
+            uses_request = self.di.build("uses_request", cache=True)
+            self.assertIs(uses_request, self.di.build("uses_request", cache=True))
+            self.assertIs(shared, self.di.build("some_class", cache=True))
+            return uses_request
+
+        first = contextvars.copy_context().run(request, "first")
+        second = contextvars.copy_context().run(request, "second")
+        self.assertEqual("first", first.request_name)
+        self.assertEqual("second", second.request_name)
+        self.assertNotIn("request_name", self.di._prepared)
+        self.assertNotIn("uses_request", self.di._prepared)
+
+    def test_build_plans_are_cached(self):
+        get_age = lambda some_class, age=2: age
+        with unittest.mock.patch("inspect.getfullargspec", wraps=inspect.getfullargspec) as getfullargspec:
+            for i in range(3):
+                self.di.build(AnotherClass)
+                self.assertEqual(5, self.di.call_function(get_age, age=5))
+                self.assertEqual([2, SomeClass], self.di.call_function(self.di.provide_blahblah))
+                if not i:
+                    first_round_calls = getfullargspec.call_count
+            self.assertEqual(first_round_calls, getfullargspec.call_count)
+
+            # but they are rebuilt when the bindings change
+            self.di.mock_class("more_classes", SomeClass)
+            self.di.build(AnotherClass)
+            self.assertGreater(getfullargspec.call_count, first_round_calls)
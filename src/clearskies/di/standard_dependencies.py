@@ -1,7 +1,7 @@
 from .di import DI
 from ..columns import Columns
 from ..environment import Environment
-from ..backends import CursorBackend, JsonBackend, MemoryBackend, SecretsBackend
+from ..backends import ConnectionPool, CursorBackend, JsonBackend, MemoryBackend, PooledCursor, SecretsBackend
 from .. import autodoc
 import os
 import uuid
@@ -79,6 +79,23 @@ class StandardDependencies(DI):
             cursorclass=pymysql.cursors.DictCursor,
         )
 
+    def provide_streaming_connection(self, connection_details):
+        # a separate connection with an unbuffered cursor, so that large result sets can be streamed from the
+        # database without blocking the main connection.
+        import pymysql
+
+        return pymysql.connect(
+            user=connection_details["username"],
+            password=connection_details["password"],
+            host=connection_details["host"],
+            database=connection_details["database"],
+            port=connection_details.get("port", 3306),
+            ssl_ca=connection_details.get("ssl_ca", None),
+            autocommit=True,
+            connect_timeout=2,
+            cursorclass=pymysql.cursors.SSDictCursor,
+        )
+
     def provide_connection_details(self, environment):
         return {
             "username": environment.get("db_username"),
@@ -90,8 +107,20 @@ class StandardDependencies(DI):
     def provide_cursor(self, connection):
         return connection.cursor()
 
-    def provide_cursor_backend(self, cursor):
-        return CursorBackend(cursor)
+    def provide_connection_pool(self):
+        # every connection in the pool is a fresh (uncached) connection from provide_connection
+        return ConnectionPool(lambda: self.build("connection", cache=False))
+
+    def provide_pooled_cursor(self, connection_pool):
+        return PooledCursor(connection_pool)
+
+    def provide_streaming_connection_pool(self):
+        # each stream checks out its own (unbuffered) connection.  The pool doesn't open any connections until one
+        # is needed, so there's no cost if nothing is streamed.
+        return ConnectionPool(lambda: self.build("streaming_connection", cache=False))
+
+    def provide_cursor_backend(self, cursor, streaming_connection_pool):
+        return CursorBackend(cursor, streaming_connection_pool=streaming_connection_pool)
 
     def provide_memory_backend(self):
         return MemoryBackend()
@@ -1,6 +1,5 @@
 from abc import ABC, abstractmethod
 from . import exceptions
-from collections import OrderedDict
 import inspect
 import re
 from ..autodoc.schema import Integer as AutoDocInteger
@@ -8,6 +7,7 @@ from ..autodoc.schema import String as AutoDocString
 from ..autodoc.schema import Object as AutoDocObject
 from ..autodoc.response import Response as AutoDocResponse
 from ..functional import string
+from .json_serializer import JsonSerializer
 from typing import List, Dict
 
 
@@ -15,6 +15,7 @@ class Base(ABC):
     _configuration = None
     _configuration_defaults = {}
     _as_json_map = None
+    _json_serializer = None
     _global_configuration_defaults = {
         "base_url": "",
         "response_headers": None,
@@ -49,6 +50,8 @@ class Base(ABC):
 
         self._check_configuration(configuration)
         self._configuration = self._finalize_configuration(self.apply_default_configuration(configuration))
+        self._as_json_map = None
+        self._json_serializer = None
 
     def _check_configuration(self, configuration):
         if not "authentication" in configuration:
@@ -251,31 +254,38 @@ class Base(ABC):
         # pagination isn't always relevant so if it is completely empty then leave it that way
         if not pagination:
             return pagination
+        next_page = pagination.get("next_page", {})
         return {
             self.auto_case_internal_column_name("number_results"): pagination.get("number_results", 0),
             self.auto_case_internal_column_name("limit"): pagination.get("limit", 0),
-            self.auto_case_internal_column_name("next_page"): {
-                self.auto_case_internal_column_name(key): value
-                for (key, value) in pagination.get("next_page", {}).items()
-            },
+            # when streaming, the next page data is a function that can only be called after the data is sent
+            self.auto_case_internal_column_name("next_page"): (
+                (lambda: self._normalize_next_page(next_page()))
+                if callable(next_page)
+                else self._normalize_next_page(next_page)
+            ),
         }
 
+    def _normalize_next_page(self, next_page):
+        return {self.auto_case_internal_column_name(key): value for (key, value) in next_page.items()}
+
     def _model_as_json(self, model, input_output):
         if self.configuration("output_map"):
             return self._di.call_function(self.configuration("output_map"), model=model)
 
-        if self._as_json_map is None:
-            self._as_json_map = self._build_as_json_map(model)
-
-        json = OrderedDict()
-        for output_name, column in self._as_json_map.items():
-            column_data = column.to_json(model)
-            if len(column_data) == 1:
-                json[output_name] = list(column_data.values())[0]
-            else:
-                for key, value in column_data.items():
-                    json[self.auto_case_column_name(key, True)] = value
-        return json
+        return self.json_serializer(model)(model)
+
+    def json_serializer(self, model):
+        """
+        Returns the serializer that converts models into their JSON representation for this handler
+
+        The serializer is built once (from the first model it is asked for) and then reused for every other model.
+        """
+        if self._json_serializer is None:
+            if self._as_json_map is None:
+                self._as_json_map = self._build_as_json_map(model)
+            self._json_serializer = JsonSerializer(self._as_json_map, self.auto_case_column_name)
+        return self._json_serializer
 
     def _build_as_json_map(self, model):
         conversion_map = {}
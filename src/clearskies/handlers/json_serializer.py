@@ -0,0 +1,46 @@
+from collections import OrderedDict
+
+
+class JsonSerializer:
+    """
+    Converts models into the JSON representation returned by handlers.
+
+    Everything that doesn't depend on the model (which columns to output, in what order, and under what names) is
+    worked out once when the serializer is built, so that serializing each model is as cheap as possible.  Columns
+    that only output their own value are read with a getter from `column.json_value_getter()`, while everything else
+    (relationships, custom columns) goes through `column.to_json(model)`.
+    """
+
+    def __init__(self, as_json_map, auto_case_column_name):
+        self._fields = [
+            (output_name, column.json_value_getter(), column) for (output_name, column) in as_json_map.items()
+        ]
+        self._auto_case_column_name = auto_case_column_name
+        self._external_names = {}
+
+    def __call__(self, model):
+        return OrderedDict(self.items(model))
+
+    def items(self, model):
+        """
+        Yields the (key, value) pairs for the JSON representation of the model, in order.
+
+        This is mainly useful for streaming responses, where the output is encoded as it is generated.
+        """
+        for output_name, getter, column in self._fields:
+            if getter is not None:
+                yield (output_name, getter(model))
+                continue
+
+            column_data = column.to_json(model)
+            if len(column_data) == 1:
+                yield (output_name, next(iter(column_data.values())))
+                continue
+
+            for key, value in column_data.items():
+                yield (self._external_name(key), value)
+
+    def _external_name(self, key):
+        if key not in self._external_names:
+            self._external_names[key] = self._auto_case_column_name(key, True)
+        return self._external_names[key]
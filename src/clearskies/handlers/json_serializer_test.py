@@ -0,0 +1,41 @@
+import unittest
+from unittest.mock import MagicMock
+from collections import OrderedDict
+from datetime import datetime, timezone
+from .json_serializer import JsonSerializer
+from ..column_types import Column, String, DateTime
+
+
+class Relationship(Column):
+    def to_json(self, model):
+        return {"parent_id": 5, "parent": {"id": 5}}
+
+
+class JsonSerializerTest(unittest.TestCase):
+    def build_column(self, column_class, name):
+        column = column_class("di") if column_class != DateTime else DateTime("di", timezone.utc)
+        column.configure(name, {}, int)
+        return column
+
+    def test_serialize(self):
+        name = self.build_column(String, "name")
+        created_at = self.build_column(DateTime, "created_at")
+        parent_id = self.build_column(Relationship, "parent_id")
+        auto_case = MagicMock(side_effect=lambda key, internal_to_external: key.replace("_id", "Id"))
+        serializer = JsonSerializer(
+            OrderedDict([("name", name), ("createdAt", created_at), ("parentId", parent_id)]), auto_case
+        )
+
+        data = {"name": "bob", "created_at": datetime(2021, 1, 7, 22, 45, 13, tzinfo=timezone.utc)}
+        model = type("", (), {"get": lambda self, key, silent=False: data.get(key)})()
+        for i in range(2):
+            json = serializer(model)
+            self.assertEqual(["name", "createdAt", "parentId", "parent"], list(json.keys()))
+            self.assertEqual("bob", json["name"])
+            self.assertEqual("2021-01-07T22:45:13+00:00", json["createdAt"])
+            self.assertEqual(5, json["parentId"])
+            self.assertEqual({"id": 5}, json["parent"])
+
+        # external names are only worked out once
+        self.assertEqual(2, auto_case.call_count)
+        self.assertEqual(list(json.items()), list(serializer.items(model)))
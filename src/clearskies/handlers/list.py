@@ -27,6 +27,7 @@ class List(Base):
         "default_sort_direction": "asc",
         "default_limit": 100,
         "max_limit": 200,
+        "stream_batch_size": None,
     }
 
     def __init__(self, di):
@@ -78,6 +79,24 @@ class List(Base):
                 self.configuration("default_sort_direction"),
                 primary_table=models.table_name(),
             )
+        # pagination data may only be usable with a specific sort, which we don't know until now
+        if pagination_data:
+            error = models.validate_pagination_sorts(pagination_data, self.auto_case_internal_column_name)
+            if error:
+                return self.error(input_output, error, 400)
+
+        stream_batch_size = self.configuration("stream_batch_size")
+        if stream_batch_size and getattr(input_output, "supports_streaming", False):
+            # the rows are fetched and serialized as the response is written out, and the next page data
+            # is only known after that, which works out because pagination comes after the data in the response
+            models = models.stream(stream_batch_size)
+            return self.success(
+                input_output,
+                (self._model_as_json(model, input_output) for model in models),
+                number_results=len(models),
+                limit=limit,
+                next_page=models.next_page_data,
+            )
 
         return self.success(
             input_output,
@@ -235,6 +254,10 @@ class List(Base):
         # if "default_sort_column" not in configuration:
             # raise ValueError(f"{error_prefix} missing required configuration 'default_sort_column'")
 
+        stream_batch_size = configuration.get("stream_batch_size")
+        if stream_batch_size is not None and (type(stream_batch_size) != int or stream_batch_size < 1):
+            raise ValueError(f"{error_prefix} 'stream_batch_size' should be a positive integer or None")
+
         # sortable_columns, wheres, and joins should all be iterables
         for config_name, contents in {
             "sortable_columns": "column names",
@@ -5,7 +5,11 @@ from ..di import StandardDependencies
 from ..authentication import Public, SecretBearer, Authorization
 from ..model import Model
 from ..contexts import test
+from ..input_outputs import WSGI
 from collections import OrderedDict
+from unittest.mock import MagicMock
+from io import BytesIO
+import json
 
 
 class User(Model):
@@ -63,6 +67,38 @@ class ListTest(unittest.TestCase):
         self.assertEqual({"id": "8", "name": "ronoc", "email": "cmancone4@example.com", "age": 25}, response_data[3])
         self.assertEqual({"id": "12", "name": "ronoc", "email": "cmancone5@example.com", "age": 35}, response_data[4])
 
+    def test_stream(self):
+        list = test(
+            {
+                "handler_class": List,
+                "handler_config": {
+                    "model_class": User,
+                    "readable_columns": ["id", "name"],
+                    "searchable_columns": ["name"],
+                    "default_sort_column": "email",
+                    "default_limit": 2,
+                    "stream_batch_size": 1,
+                    "authentication": Public(),
+                },
+            }
+        )
+        users = list.build(User)
+        for id, name in [["1", "ronoc"], ["2", "conor"], ["5", "conor"]]:
+            users.create({"id": id, "name": name, "email": f"cmancone{id}@example.com"})
+        start_response = MagicMock()
+        response = list(input_output=WSGI({"REQUEST_METHOD": "GET", "wsgi.input": BytesIO(b"")}, start_response))
+        self.assertEqual(
+            {
+                "status": "success",
+                "error": "",
+                "data": [{"id": "1", "name": "ronoc"}, {"id": "2", "name": "conor"}],
+                "pagination": {"number_results": 3, "limit": 2, "next_page": {"start": 2}},
+                "input_errors": {},
+            },
+            json.loads(b"".join(response)),
+        )
+        start_response.assert_called_once()
+
     def test_user_input(self):
         response = self.list(query_parameters={"sort": "name", "direction": "desc"})
         json_response = response[0]
@@ -76,6 +112,23 @@ class ListTest(unittest.TestCase):
         self.assertEqual({"id": "2", "name": "conor", "email": "cmancone2@example.com", "age": 8}, response_data[3])
         self.assertEqual({"id": "5", "name": "conor", "email": "cmancone3@example.com", "age": 15}, response_data[4])
 
+    def test_keyset_pagination_sort(self):
+        self.list.di.build("memory_backend", cache=True).keyset_pagination = True
+        response = self.list(query_parameters={"limit": 2})
+        self.assertEqual(200, response[1])
+        next_page = response[0]["pagination"]["next_page"]
+        self.assertEqual(["after"], list(next_page.keys()))
+
+        response = self.list(query_parameters={"limit": 2, **next_page})
+        self.assertEqual(200, response[1])
+        self.assertEqual(["5", "8"], [user["id"] for user in response[0]["data"]])
+
+        # a token from a different sort is bad input, not a server error
+        response = self.list(query_parameters={"limit": 2, "sort": "name", "direction": "desc", **next_page})
+        self.assertEqual(400, response[1])
+        self.assertEqual("client_error", response[0]["status"])
+        self.assertIn("'after' does not match the current sort", response[0]["error"])
+
     def test_configure(self):
         list = test(
             {
@@ -0,0 +1,58 @@
+class RouteTree:
+    """
+    Finds the route that matches a request without checking every route one at a time.
+
+    The routes are stored in a tree keyed by their path segments (path parameters like `{id}` match any segment).
+    To route a request we walk down the tree following the segments of the requested path, and collect the routes
+    that we pass along the way: these are the only routes whose path is a prefix of the requested path, and so the
+    only ones that can possibly match.  They are then checked in the order that they were configured, so the
+    first matching route still wins, exactly as if every route was checked.  Routes that can match any path (like
+    nested SimpleRouting handlers) live at the root of the tree, and so are always checked.
+    """
+
+    def __init__(self, routes):
+        self._root = self._node()
+        for index, route in enumerate(routes):
+            node = self._root
+            for segment in route.route_segments():
+                if segment is None:
+                    if node["parameter"] is None:
+                        node["parameter"] = self._node()
+                    node = node["parameter"]
+                else:
+                    if segment not in node["static"]:
+                        node["static"][segment] = self._node()
+                    node = node["static"][segment]
+            node["routes"].append((index, route))
+
+    def _node(self):
+        return {"static": {}, "parameter": None, "routes": []}
+
+    def match(self, full_path, request_method, is_cors=False):
+        """
+        Returns a tuple with the matching route and its route data, or (None, None) if no route matches.
+        """
+        requested_parts = full_path.strip("/").split("/")
+        candidates = []
+        nodes = [self._root]
+        for segment in requested_parts:
+            next_nodes = []
+            for node in nodes:
+                candidates.extend(node["routes"])
+                if segment in node["static"]:
+                    next_nodes.append(node["static"][segment])
+                if node["parameter"] is not None:
+                    next_nodes.append(node["parameter"])
+            nodes = next_nodes
+            if not nodes:
+                break
+        for node in nodes:
+            candidates.extend(node["routes"])
+
+        if len(candidates) > 1:
+            candidates.sort(key=lambda candidate: candidate[0])
+        for index, route in candidates:
+            route_data = route.matches(full_path, request_method, is_cors=is_cors, requested_parts=requested_parts)
+            if route_data is not None:
+                return (route, route_data)
+        return (None, None)
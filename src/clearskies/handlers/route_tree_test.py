@@ -0,0 +1,51 @@
+import unittest
+from .route_tree import RouteTree
+from .simple_routing_route import SimpleRoutingRoute
+from .callable import Callable
+from ..authentication import public
+from ..di import StandardDependencies
+
+
+class RouteTreeTest(unittest.TestCase):
+    def test_matches_like_a_linear_scan(self):
+        di = StandardDependencies()
+        routes = []
+        for path, methods, options in [
+            ("/users/{user_id}/orders/{order_id}", "GET", {}),
+            ("/users/{user_id}", "GET", {}),
+            ("/users/me", None, {}),
+            ("/users", "POST", {"has_sub_paths": False}),
+            ("/files/{path}", None, {"path_parameter_with_slashes": ["path"]}),
+            ("/users", None, {}),
+            ("/", "DELETE", {}),
+        ]:
+            route = SimpleRoutingRoute(di)
+            route.configure(
+                Callable,
+                {"callable": lambda: "hey", "authentication": public()},
+                path=path,
+                methods=methods,
+                **options,
+            )
+            routes.append(route)
+        tree = RouteTree(routes)
+
+        for full_path in ["users/5", "/users/me/", "users", "users/5/orders/10", "users5", "files/a/b%20c", "", "x/y"]:
+            for request_method in ["GET", "POST", "DELETE"]:
+                for is_cors in [True, False]:
+                    expected = (None, None)
+                    for route in routes:
+                        route_data = route.matches(full_path, request_method, is_cors=is_cors)
+                        if route_data is not None:
+                            expected = (route, route_data)
+                            break
+                    self.assertEqual(
+                        expected,
+                        tree.match(full_path, request_method, is_cors=is_cors),
+                        f"Mismatch for [{request_method}] {full_path} (cors: {is_cors})",
+                    )
+
+        self.assertEqual((routes[1], {"user_id": "5"}), tree.match("users/5", "GET"))
+        self.assertEqual((routes[2], {}), tree.match("users/me", "POST"))
+        self.assertEqual((routes[4], {"path": "a/b c"}), tree.match("files/a/b%20c", "GET"))
+        self.assertEqual((None, None), tree.match("x/y", "GET"))
@@ -1,6 +1,7 @@
 from .base import Base
 from abc import abstractmethod
 from .simple_routing_route import SimpleRoutingRoute
+from .route_tree import RouteTree
 from . import callable as callable_handler
 from ..functional import string
 from .. import autodoc
@@ -8,6 +9,7 @@ from .. import autodoc
 
 class SimpleRouting(Base):
     _routes = None
+    _route_tree = None
 
     _configuration_defaults = {
         "base_url": "",
@@ -17,6 +19,7 @@ class SimpleRouting(Base):
         "schema_configuration": {},
         "schema_format": autodoc.formats.oai3_json.OAI3JSON,
         "schema_authentication": None,
+        "lazy_routes": False,
     }
 
     def __init__(self, di):
@@ -33,11 +36,8 @@ class SimpleRouting(Base):
         return super().top_level_authentication_and_authorization(input_output)
 
     def can_handle(self, full_path, request_method, is_cors=False):
-        for route in self._routes:
-            route_data = route.matches(full_path, request_method, is_cors=is_cors)
-            if route_data is not None:
-                return route_data
-        return None
+        (route, route_data) = self._route_tree.match(full_path, request_method, is_cors=is_cors)
+        return route_data
 
     def handle(self, input_output):
         request_method = input_output.get_request_method()
@@ -48,28 +48,22 @@ class SimpleRouting(Base):
         if request_method == "OPTIONS":
             return self.cors(input_output)
 
-        for route in self._routes:
-            route_data = route.matches(full_path, request_method)
-            if route_data is None:
-                continue
-            input_output.add_routing_data(route_data)
-
-            return route(input_output)
+        (route, route_data) = self._route_tree.match(full_path, request_method)
+        if route is None:
+            return self.error(input_output, "Page not found", 404)
 
-        return self.error(input_output, "Page not found", 404)
+        input_output.add_routing_data(route_data)
+        return route(input_output)
 
     def cors(self, input_output):
         if not self._cors_header:
             return self.error(input_output, "not found", 404)
         request_method = input_output.get_request_method()
         full_path = input_output.get_full_path().strip("/")
-        for route in self._routes:
-            route_data = route.matches(full_path, request_method, is_cors=True)
-            if route_data is None:
-                continue
-
-            return route.cors(input_output)
-        return self.error(input_output, "Page not found", 404)
+        (route, route_data) = self._route_tree.match(full_path, request_method, is_cors=True)
+        if route is None:
+            return self.error(input_output, "Page not found", 404)
+        return route.cors(input_output)
 
     def _check_configuration(self, configuration):
         super()._check_configuration(configuration)
@@ -95,6 +89,7 @@ class SimpleRouting(Base):
             authentication=configuration.get("authentication"),
             response_headers=configuration.get("response_headers"),
             security_headers=configuration.get("security_headers"),
+            lazy=configuration.get("lazy_routes", False),
         )
 
     def _finalize_configuration(self, configuration):
@@ -108,7 +103,17 @@ class SimpleRouting(Base):
             configuration["schema_authentication"] = self._di.build(configuration["schema_authentication"])
         return configuration
 
-    def _build_routes(self, routes, base_url, authentication=None, response_headers=None, security_headers=None):
+    def _build_routes(
+        self, routes, base_url, authentication=None, response_headers=None, security_headers=None, lazy=False
+    ):
+        """
+        Builds the routes.
+
+        If lazy is True then the handler for each route isn't built (or configured) until a request first matches
+        it.  This makes start up much quicker for applications with many routes, which matters in serverless
+        environments with frequent cold starts, at the cost of only finding configuration errors for a handler
+        when it is first used.  Call `build_handlers()` from your tests (or at deploy time) to still check them.
+        """
         self._routes = []
         if base_url is None:
             base_url = ""
@@ -170,8 +175,19 @@ class SimpleRouting(Base):
                 response_headers=response_headers,
                 security_headers=security_headers,
                 has_sub_paths=route_config.get("has_sub_paths", True),
+                lazy=lazy,
             )
             self._routes.append(route)
+        self._route_tree = RouteTree(self._routes)
+
+    def build_handlers(self):
+        """
+        Builds (and so validates the configuration of) the handlers for every route, including nested routers.
+        """
+        for route in self._routes:
+            handler = route.handler
+            if isinstance(handler, SimpleRouting):
+                handler.build_handlers()
 
     def documentation(self):
         docs = []
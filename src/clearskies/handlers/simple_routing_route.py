@@ -1,4 +1,5 @@
 import logging
+import threading
 import urllib.parse
 import re
 import json
@@ -12,6 +13,9 @@ logger = logging.getLogger(__name__)
 class SimpleRoutingRoute:
     _di = None
     _handler = None
+    _handler_class = None
+    _handler_config = None
+    _handler_lock = None
     _methods = None
     _path = None
     _path_parts = None
@@ -36,6 +40,7 @@ class SimpleRoutingRoute:
         path_parameter_with_slashes=None,
         bindings=None,
         has_sub_paths=True,
+        lazy=False,
     ):
         if authentication is not None and not handler_config.get("authentication"):
             handler_config["authentication"] = authentication
@@ -66,9 +71,32 @@ class SimpleRoutingRoute:
         if "security_headers" in handler_config:
             security_headers = [*security_headers, *handler_config["security_headers"]]
         sub_handler_config["security_headers"] = security_headers
-        self._handler = self._di.build(handler_class, cache=False)
-        self._handler.configure(sub_handler_config)
         self._routes_to_simple_routing = issubclass(handler_class, simple_routing.SimpleRouting)
+        if lazy and self._routes_to_simple_routing and "lazy_routes" not in sub_handler_config:
+            sub_handler_config["lazy_routes"] = True
+        self._handler = None
+        self._handler_class = handler_class
+        self._handler_config = sub_handler_config
+        self._handler_lock = threading.Lock()
+        if not lazy:
+            self._build_handler()
+
+    @property
+    def handler(self):
+        """
+        Returns the handler for this route, building it first if the route was configured lazily
+        """
+        if self._handler is None:
+            self._build_handler()
+        return self._handler
+
+    def _build_handler(self):
+        with self._handler_lock:
+            if self._handler is not None:
+                return
+            handler = self._di.build(self._handler_class, cache=False)
+            handler.configure(self._handler_config)
+            self._handler = handler
 
     def _extract_resource_paths(self, path_parts):
         resource_paths = {}
@@ -90,35 +118,35 @@ class SimpleRoutingRoute:
             resource_paths[index] = match.group(1)
         return resource_paths
 
-    def matches(self, full_path, request_method, is_cors=False):
+    def matches(self, full_path, request_method, is_cors=False, requested_parts=None):
         """Returns None if the route doesn't match, or a dictionary with route data for a match.
 
         You can't just match true/false against the return value, because of the route matches
         but has no route data, it returns an empty dictionary.  Check explicitly for None
         to understand if there was no route match at all.
+
+        requested_parts is the full path split into its segments.  It's optional, but the router passes it in
+        so that the path isn't split again for every route it checks.
         """
         # if we're routing to a simple router then defer to it
-        incoming = f"Incoming request: [{request_method}] {full_path}.  Check against route with url '{self._path}'.  Results: "
-        if not self._methods:
-            incoming += " configured for any method except OPTIONS"
-        elif isinstance(self._methods, str):
-            incoming += f" with method '{self._methods}'"
-        else:
-            incoming += " with any of the following methods: " + ", ".join(self._methods)
         if self._routes_to_simple_routing:
-            return self._handler.can_handle(full_path, request_method, is_cors=is_cors)
+            return self.handler.can_handle(full_path, request_method, is_cors=is_cors)
         # If we're routing for CORS then ignore the request method (since it won't match)
         if not is_cors and self._methods is not None and request_method not in self._methods:
-            logger.debug(
-                f"{incoming} Skipped because this route is not specifically configured for CORS, and this is an OPTIONS request."
+            self._debug(
+                full_path,
+                request_method,
+                "Skipped because this route is not specifically configured for CORS, and this is an OPTIONS request.",
             )
             return None
         if self._resource_paths:
-            results = self._resource_path_match(full_path, self._path_parts, self._resource_paths)
+            results = self._resource_path_match(
+                full_path, self._path_parts, self._resource_paths, requested_parts=requested_parts
+            )
             if not results:
-                logger.debug(f"{incoming} Not a match.")
+                self._debug(full_path, request_method, "Not a match.")
             else:
-                logger.debug(f"{incoming} Matched and extracted route data: " + json.dumps(results))
+                self._debug(full_path, request_method, "Matched and extracted route data: ", route_data=results)
             return results
         if self._path is not None:
             full_path = full_path.strip("/")
@@ -126,25 +154,55 @@ class SimpleRoutingRoute:
             my_path_length = len(my_path)
             full_path_length = len(full_path)
             if my_path_length > full_path_length:
-                logger.debug(f"{incoming} Not a match. I'm too long to bother checking.")
+                self._debug(full_path, request_method, "Not a match. I'm too long to bother checking.")
                 return None
             if full_path[:my_path_length] != my_path:
-                logger.debug(f"{incoming} Not a match.  Our prefixes just don't match.")
+                self._debug(full_path, request_method, "Not a match.  Our prefixes just don't match.")
                 return None
             if not self._has_sub_paths and full_path_length > my_path_length:
-                logger.debug(f"{incoming} Not a match.  It's a partial match but I'm not allowed to do that.")
+                self._debug(
+                    full_path, request_method, "Not a match.  It's a partial match but I'm not allowed to do that."
+                )
                 return None
             # make sure we don't get confused by partial matches.  `user` should match `user/` and `user/5`,
             # but it shouldn't match `users/`
             if full_path_length > my_path_length and full_path[my_path_length] != "/" and my_path != "":
-                logger.debug(f"{incoming} Not a match.  I only partially matched the URL but not as a sub-directory.")
+                self._debug(
+                    full_path,
+                    request_method,
+                    "Not a match.  I only partially matched the URL but not as a sub-directory.",
+                )
                 return None
-        logger.debug(f"{incoming} Match!")
+        self._debug(full_path, request_method, "Match!")
         return {}
 
-    def _resource_path_match(self, requested_path, path_parts, resource_paths):
+    def _debug(self, full_path, request_method, result, route_data=None):
+        # routes are checked for every request, so only build the message if someone is listening
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        incoming = f"Incoming request: [{request_method}] {full_path}.  Check against route with url '{self._path}'.  Results: "
+        if not self._methods:
+            incoming += " configured for any method except OPTIONS"
+        else:
+            incoming += " with any of the following methods: " + ", ".join(self._methods)
+        logger.debug(f"{incoming} {result}" + (json.dumps(route_data) if route_data is not None else ""))
+
+    def route_segments(self):
+        """
+        Returns the segments of the path that this route matches, with None for path parameters.
+
+        The route only matches requests whose path starts with these segments (although that doesn't mean
+        it matches all of them).  Routes that might match any path (e.g. ones that route to another SimpleRouting
+        handler) return an empty list.
+        """
+        if self._routes_to_simple_routing or self._path is None or not self._path.strip("/"):
+            return []
+        return [None if index in self._resource_paths else part for (index, part) in enumerate(self._path_parts)]
+
+    def _resource_path_match(self, requested_path, path_parts, resource_paths, requested_parts=None):
         """Returns None if the route doesn't match, or a dictionary with route data for the match."""
-        requested_parts = requested_path.strip("/").split("/")
+        if requested_parts is None:
+            requested_parts = requested_path.strip("/").split("/")
         route_data = {}
         path_length = len(path_parts)
         # it's okay if the requested path is longer than the configured path, since there may
@@ -165,15 +223,15 @@ class SimpleRoutingRoute:
 
     def __call__(self, input_output):
         # including calling parameters that came from the route matching
-        return self._handler(input_output)
+        return self.handler(input_output)
 
     def cors(self, input_output):
         # including calling parameters that came from the route matching
-        return self._handler.cors(input_output)
+        return self.handler.cors(input_output)
 
     def documentation(self):
         docs = []
-        for doc in self._handler.documentation():
+        for doc in self.handler.documentation():
             if self._methods is not None:
                 doc.set_request_methods(self._methods)
 
@@ -191,7 +249,7 @@ class SimpleRoutingRoute:
         return docs
 
     def documentation_models(self):
-        return self._handler.documentation_models()
+        return self.handler.documentation_models()
 
     def documentation_security_schemes(self):
-        return self._handler.documentation_security_schemes()
+        return self.handler.documentation_security_schemes()
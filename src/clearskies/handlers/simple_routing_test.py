@@ -184,6 +184,45 @@ class SimpleRoutingTest(unittest.TestCase):
             result[0],
         )
 
+    def test_lazy_routes(self):
+        handler = SimpleRouting(self.di)
+        handler.configure(
+            {
+                "authentication": public(),
+                "lazy_routes": True,
+                "routes": [
+                    {
+                        "path": "/users/",
+                        "handler_class": List,
+                        "handler_config": {
+                            "model_class": User,
+                            "readable_columns": ["id", "name", "age"],
+                            "searchable_columns": ["name"],
+                            "default_sort_column": "name",
+                        },
+                    },
+                    {
+                        "path": "/broken/",
+                        "handler_class": List,
+                        "handler_config": {"model_class": User, "readable_columns": ["not_a_column"]},
+                    },
+                ],
+            }
+        )
+        self.assertEqual([None, None], [route._handler for route in handler._routes])
+
+        self.input_output.set_request_url("/users/")
+        self.input_output.set_request_method("GET")
+        result = handler(self.input_output)
+        self.assertEqual(200, result[1])
+        self.assertEqual(2, len(result[0]["data"]))
+        self.assertIsNotNone(handler._routes[0]._handler)
+        self.assertIsNone(handler._routes[1]._handler)
+
+        # configuration errors are found when the handlers are built
+        with self.assertRaises(ValueError):
+            handler.build_handlers()
+
     def test_routing_statuses(self):
         self.input_output.set_request_url("/statuses/")
         self.input_output.set_request_method("ANY")
@@ -0,0 +1,28 @@
+import os
+import subprocess
+import sys
+import unittest
+
+
+class InitTest(unittest.TestCase):
+    def test_lazy_imports(self):
+        # this has to run in a fresh interpreter, since clearskies is fully imported by the other tests
+        check = "; ".join(
+            [
+                "import sys",
+                "import clearskies",
+                "assert 'clearskies.column_types' not in sys.modules",
+                "from clearskies import Model, column_types",
+                "assert Model is sys.modules['clearskies.model'].Model",
+                "assert clearskies.column_types.String",
+                "assert 'dateparser' not in sys.modules",
+            ]
+        )
+        source_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, "-c", check], check=True, env={**os.environ, "PYTHONPATH": source_directory})
+
+    def test_unknown_attribute(self):
+        import clearskies
+
+        with self.assertRaises(AttributeError):
+            clearskies.not_a_thing
@@ -11,6 +11,10 @@ class InputOutput(ABC):
     _routing_data = None
     _authorization_data = None
 
+    # whether respond() accepts lazy values in the response (generators for lists and functions for values that
+    # can only be calculated after everything before them has been sent), and writes the response out as it goes.
+    supports_streaming = False
+
     @abstractmethod
     def respond(self, body, status_code=200):
         pass
@@ -1,9 +1,12 @@
 from .input_output import InputOutput
 import urllib, urllib.parse
+from collections.abc import Iterator
 import json
 
 
 class WSGI(InputOutput):
+    supports_streaming = True
+    stream_chunk_size = 65536
     _environment = None
     _start_response = None
     _request_headers = None
@@ -30,10 +33,55 @@ class WSGI(InputOutput):
             final_body = body
         elif type(body) == str:
             final_body = body.encode("utf-8")
+        elif self._is_lazy(body):
+            return self._stream_json(body)
         else:
             final_body = json.dumps(body).encode("utf-8")
         return [final_body]
 
+    def _is_lazy(self, value):
+        if isinstance(value, Iterator) or callable(value):
+            return True
+        if type(value) == dict:
+            return any(self._is_lazy(child) for child in value.values())
+        return False
+
+    def _stream_json(self, body):
+        """
+        Encodes the body as JSON and yields it in chunks of (roughly) stream_chunk_size bytes.
+
+        Iterators are encoded as lists, one item at a time, and functions are called (and their return value
+        encoded) when they are reached.  The output matches json.dumps.
+        """
+        chunk = []
+        chunk_size = 0
+        for part in self._iterencode(body):
+            chunk.append(part)
+            chunk_size += len(part)
+            if chunk_size >= self.stream_chunk_size:
+                yield "".join(chunk).encode("utf-8")
+                chunk = []
+                chunk_size = 0
+        if chunk:
+            yield "".join(chunk).encode("utf-8")
+
+    def _iterencode(self, value):
+        if callable(value):
+            yield from self._iterencode(value())
+        elif isinstance(value, Iterator):
+            yield "["
+            for index, item in enumerate(value):
+                yield (", " if index else "") + json.dumps(item)
+            yield "]"
+        elif type(value) == dict and self._is_lazy(value):
+            yield "{"
+            for index, (key, child) in enumerate(value.items()):
+                yield (", " if index else "") + json.dumps(key) + ": "
+                yield from self._iterencode(child)
+            yield "}"
+        else:
+            yield json.dumps(value)
+
     def has_body(self):
         return bool(self.get_body())
 
@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import MagicMock, call
 from .wsgi import WSGI
 from io import BytesIO
+import json
 
 
 class WSGITest(unittest.TestCase):
@@ -17,6 +18,34 @@ class WSGITest(unittest.TestCase):
             "200 Ok", [("JANE", "kay"), ("HEY", "sup"), ("CONTENT-TYPE", "application/json; charset=UTF-8")]
         )
 
+    def test_respond_streaming(self):
+        start_response = MagicMock()
+        wsgi = WSGI({}, start_response)
+        wsgi.stream_chunk_size = 10
+        next_page = {}
+
+        def rows():
+            yield {"id": 1}
+            yield {"id": 2}
+            next_page["start"] = 2
+
+        body = {"status": "success", "data": rows(), "pagination": {"next_page": lambda: next_page}, "empty": iter([])}
+        response = wsgi.respond(body, 200)
+        start_response.assert_called_with("200 Ok", [("CONTENT-TYPE", "application/json; charset=UTF-8")])
+        chunks = list(response)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(
+            json.dumps(
+                {
+                    "status": "success",
+                    "data": [{"id": 1}, {"id": 2}],
+                    "pagination": {"next_page": {"start": 2}},
+                    "empty": [],
+                }
+            ).encode("utf-8"),
+            b"".join(chunks),
+        )
+
     def test_environment(self):
         start_response = MagicMock()
         wsgi = WSGI(
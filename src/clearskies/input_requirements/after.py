@@ -1,6 +1,5 @@
 from .requirement import Requirement
 import datetime
-import dateparser
 
 
 class After(Requirement):
@@ -9,6 +8,8 @@ class After(Requirement):
         self.allow_equal = allow_equal
 
     def check(self, model, data):
+        import dateparser
+
         # we won't check anything for missing values (columns should be required if that is an issue)
         if not data.get(self.column_name):
             return ""
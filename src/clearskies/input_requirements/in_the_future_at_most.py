@@ -1,10 +1,11 @@
 from .time_delta import TimeDelta
 import datetime
-import dateparser
 
 
 class InTheFutureAtMost(TimeDelta):
     def check(self, model, data):
+        import dateparser
+
         if self.column_name not in data or not data[self.column_name]:
             return ""
         as_date = dateparser.parse(data[self.column_name])
@@ -13,18 +13,25 @@ except ModuleNotFoundError:
 
 class Model(Models):
     _configured_columns = None
+    _column_providers = None
     _data = None
     _previous_data = None
     _touched_columns = None
     _transformed = None
+    _page = None
     id_column_name = "id"
 
+    # Set this to False if the database never generates or changes column values during a save (no defaults,
+    # triggers, auto-updating timestamps, etc...).  Backends can then skip reading the record back after writing it.
+    read_after_write = True
+
     def __init__(self: Self, backend, columns):
         super().__init__(backend, columns)
         self._transformed = {}
         self._data = {}
         self._previous_data = None
         self._touched_columns = None
+        self._page = None
 
     def model_class(self: Self) -> type[Self]:
         """
@@ -55,14 +62,33 @@ class Model(Models):
         return default
 
     def columns(self: Self, overrides=None):
-        # no caching if we have overrides
+        # the columns are compiled once per model class (and overrides) and shared by every model instance
         if overrides is not None:
-            return self._columns.configure(self.all_columns(), self.__class__, overrides=overrides)
+            return self._columns.compiled(self, overrides=overrides)
 
         if self._configured_columns is None:
-            self._configured_columns = self._columns.configure(self.all_columns(), self.__class__)
+            self._configured_columns = self._columns.compiled(self)
         return self._configured_columns
 
+    def _column_provider(self: Self, column_name):
+        """
+        Returns the column that can provide the given name (or None if no column can)
+
+        The answers are kept in a lookup table that is shared by every model of the class, so we only have to ask
+        each column `can_provide` once per name.  Names that no column provides aren't remembered, since they can
+        be anything (and the lookup table would grow without limit).
+        """
+        if self._column_providers is None:
+            self._column_providers = self._columns.compiled_providers(self)
+        provider = self._column_providers.get(column_name)
+        if provider is not None:
+            return provider
+        for column in self.columns().values():
+            if column.can_provide(column_name):
+                self._column_providers[column_name] = column
+                return column
+        return None
+
     def supports_n_plus_one(self: Self):
         return self._backend.supports_n_plus_one
 
@@ -96,25 +122,48 @@ class Model(Models):
         columns = self.columns()
         value = None
         if (column_name not in data or data[column_name] is None) and check_providers:
-            for column in columns.values():
-                if column.can_provide(column_name):
+            column = self._column_provider(column_name)
+            if column is not None:
+                if self._page is not None and data is self._data:
+                    value = column.provide_for_page(data, column_name, self._page)
+                else:
                     value = column.provide(data, column_name)
-                    break
             if column_name not in data and value is None:
                 if not silent:
                     raise KeyError(f"Unknown column '{column_name}' requested from model '{self.__class__.__name__}'")
                 return None
+        elif column_name not in columns:
+            value = data[column_name]
+        elif cache and data is self._data and data[column_name] is not None and self._page_models():
+            self._page_column_from_backend(column_name, columns[column_name])
+            return self._transformed[column_name]
         else:
-            value = (
-                self._backend.column_from_backend(self.columns()[column_name], data[column_name])
-                if column_name in self.columns()
-                else data[column_name]
-            )
+            value = self._backend.column_from_backend(columns[column_name], data[column_name])
 
         if cache:
             self._transformed[column_name] = value
         return value
 
+    def _page_models(self: Self):
+        return self._page.get("models") if self._page is not None else None
+
+    def _page_column_from_backend(self: Self, column_name, column):
+        """
+        Converts the column from the backend for every model in our page at once, and caches the results
+        """
+        models = [
+            model
+            for model in self._page_models()
+            if column_name not in model._transformed and model._data.get(column_name) is not None
+        ]
+        values = [model._data[column_name] for model in models]
+        if hasattr(self._backend, "columns_from_backend"):
+            converted = self._backend.columns_from_backend(column, values)
+        else:
+            converted = [self._backend.column_from_backend(column, value) for value in values]
+        for model, value in zip(models, converted):
+            model._transformed[column_name] = value
+
     @property
     def exists(self: Self) -> bool:
         return True if (self.id_column_name in self._data and self._data[self.id_column_name]) else False
@@ -137,10 +186,25 @@ class Model(Models):
             raise ValueError("You have to pass in something to save!")
         save_columns = self.columns()
         if columns is not None:
+            # the columns are shared with other models, so make a copy before adding to them
+            save_columns = OrderedDict(save_columns)
             for column in columns.values():
                 save_columns[column.name] = column
 
         old_data = self.data
+        [data, to_save, temporary_data] = self._prepare_save(data, save_columns)
+        if self.exists:
+            new_data = self._backend.update(self._data[self.id_column_name], to_save, self)
+        else:
+            new_data = self._backend.create(to_save, self)
+        self._finish_save(data, new_data, temporary_data, old_data, save_columns)
+
+        return True
+
+    def _prepare_save(self: Self, data, save_columns):
+        """
+        Runs the pre-save hooks and returns the data, the data to send to the backend, and any temporary data
+        """
         data = self.columns_pre_save(data, save_columns)
         data = self.pre_save(data)
         if data is None:
@@ -148,10 +212,12 @@ class Model(Models):
 
         [to_save, temporary_data] = self.columns_to_backend(data, save_columns)
         to_save = self.to_backend(to_save, save_columns)
-        if self.exists:
-            new_data = self._backend.update(self._data[self.id_column_name], to_save, self)
-        else:
-            new_data = self._backend.create(to_save, self)
+        return [data, to_save, temporary_data]
+
+    def _finish_save(self: Self, data, new_data, temporary_data, old_data, save_columns):
+        """
+        Runs the post-save hooks and updates the model once the backend has saved the data
+        """
         id = self._backend.column_from_backend(save_columns[self.id_column_name], new_data[self.id_column_name])
 
         # if we had any temporary columns add them back in
@@ -171,8 +237,6 @@ class Model(Models):
         self.columns_save_finished(save_columns)
         self.save_finished()
 
-        return True
-
     def is_changing(self: Self, key, data) -> bool:
         """
         Returns True/False to denote if the given column is being modified by the active save operation
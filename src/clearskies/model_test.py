@@ -1,11 +1,13 @@
 import unittest
-from unittest.mock import MagicMock, call
+from unittest.mock import MagicMock, call, patch
 from .model import Model
+from .models import Models
 from .columns import Columns
 from .column_types import Column, String, DateTime, Integer
 from collections import namedtuple, OrderedDict
 from datetime import datetime, timezone
 from .di import StandardDependencies
+from .backends import MemoryBackend
 
 
 class ProvideTest(Column):
@@ -39,6 +41,27 @@ class User(Model):
         return data
 
 
+class Pet(Model):
+    def __init__(self, backend, columns):
+        super().__init__(backend, columns)
+
+    def columns_configuration(self):
+        return OrderedDict(
+            [
+                ("name", {"class": String}),
+                ("age", {"class": Integer}),
+            ]
+        )
+
+    def post_save(self, data, id):
+        self.post_save_data = data
+
+
+class Users(Models):
+    def model_class(self):
+        return User
+
+
 class ModelTest(unittest.TestCase):
     def setUp(self):
         self.di = StandardDependencies()
@@ -156,6 +179,37 @@ class ModelTest(unittest.TestCase):
         user.data = {"id": 5, "name": "hey"}
         self.assertEqual("hey blahblah", user.blahbblah)
 
+    def test_column_provide_lookup_is_shared(self):
+        user = User("cursor", self.columns)
+        user.data = {"id": 5, "name": "hey"}
+        provider = user.columns()["whatever"]
+        with patch.object(provider, "can_provide", wraps=provider.can_provide) as can_provide:
+            self.assertEqual("hey blahblah", user.blahbblah)
+            other_user = User("cursor", self.columns)
+            other_user.data = {"id": 6, "name": "sup"}
+            self.assertEqual("sup blahblah", other_user.blahbblah)
+            self.assertEqual(1, can_provide.call_count)
+
+    def test_column_provide_lookup_skips_unknown_names(self):
+        user = User("cursor", self.columns)
+        user.data = {"id": 5, "name": "hey"}
+        self.assertIsNone(user._column_provider("not_a_column"))
+        self.assertNotIn("not_a_column", user._column_providers)
+        self.assertEqual(user.columns()["whatever"], user._column_provider("blahbblah"))
+        self.assertIn("blahbblah", user._column_providers)
+
+    def test_page_columns_from_backend(self):
+        backend = MemoryBackend()
+        backend.create_table(User)
+        for i in range(1, 4):
+            backend.create_record_with_class(User, {"id": i, "name": f"user {i}", "birth_date": "2020-11-28 12:30:45"})
+        users = Users(backend, self.columns)
+        with patch.object(backend, "columns_from_backend", wraps=backend.columns_from_backend) as decode:
+            records = [user for user in users]
+            expected = datetime(2020, 11, 28, 12, 30, 45, tzinfo=timezone.utc)
+            self.assertEqual([expected, expected, expected], [user.birth_date for user in records])
+            self.assertEqual(1, decode.call_count)
+
     def test_get_simple(self):
         backend = type("", (), {"column_from_backend": lambda self, column, value: column.from_backend(value)})()
         user = User(backend, self.columns)
@@ -243,3 +297,51 @@ class ModelTest(unittest.TestCase):
         user.data = old_user
         user.save({"name": "Ronoc"})
         on_change.assert_not_called()
+
+    def test_bulk_save_and_delete(self):
+        self.di.bind("uuid", type("", (), {"uuid4": MagicMock(side_effect=["1", "2"])})())
+        backend = MemoryBackend()
+        pets = Pet(backend, Columns(self.di))
+        [conor, ronoc] = pets.bulk_create([{"name": "Conor", "age": "1"}, {"name": "Ronoc", "age": "2"}])
+        self.assertEqual(["1", "2"], [conor.id, ronoc.id])
+        self.assertEqual({"id": "2", "name": "Ronoc", "age": "2"}, ronoc.post_save_data)
+        self.assertTrue(ronoc.was_changed("name"))
+
+        [ronoc, conor] = pets.bulk_update([{"id": "2", "name": "Ronald"}, {"id": "1", "age": "5"}])
+        self.assertEqual("Ronald", ronoc.name)
+        self.assertEqual(5, conor.age)
+        self.assertTrue(ronoc.was_changed("name"))
+        self.assertFalse(conor.was_changed("name"))
+        self.assertEqual(["Conor", "Ronald"], [pet.name for pet in pets.sort_by("name", "asc")])
+
+        with self.assertRaises(ValueError) as context:
+            pets.bulk_update([{"id": "3", "name": "Nobody"}])
+        self.assertIn("with id '3' because it does not exist", str(context.exception))
+
+        pets.bulk_delete(["1", "2"])
+        self.assertEqual(0, len(pets))
+
+    def test_bulk_save_and_delete_lookups(self):
+        self.di.bind("uuid", type("", (), {"uuid4": MagicMock(side_effect=["a,b", "c"])})())
+        backend = MemoryBackend()
+        pets = Pet(backend, Columns(self.di))
+        pets.bulk_create([{"name": "Conor", "age": "1"}, {"name": "Ronoc", "age": "2"}])
+
+        # ids with commas are found, and any limit on the models doesn't hide records
+        limited_pets = pets.limit(1)
+        [conor, ronoc] = limited_pets.bulk_update([{"id": "a,b", "name": "Con"}, {"id": "c", "name": "Ron"}])
+        self.assertEqual(["Con", "Ron"], [conor.name, ronoc.name])
+
+        # every id has to match exactly one record
+        records = backend.records
+
+        def duplicated_records(configuration, model, next_page_data=None):
+            return [*records(configuration, model), *records(configuration, model)]
+
+        with patch.object(backend, "records", side_effect=duplicated_records):
+            with self.assertRaises(ValueError) as context:
+                pets.bulk_delete(["a,b", "c"])
+        self.assertEqual("Cannot delete records: found 4 records for 2 distinct ids", str(context.exception))
+
+        limited_pets.bulk_delete(["a,b"])
+        self.assertEqual(["Ron"], [pet.name for pet in pets])
@@ -28,6 +28,8 @@ class Models(ABC, ConditionParser):
     _table_name = None
     _id_column_name = None
     _query_configuration = None
+    _preloaded_records = None
+    _stream_batch_size = None
 
     def __init__(self, backend, columns):
         self._model_columns = None
@@ -36,6 +38,8 @@ class Models(ABC, ConditionParser):
         self.must_rexecute = True
         self._next_page_data = None
         self.must_recount = True
+        self._preloaded_records = None
+        self._stream_batch_size = None
 
         self.query_wheres = []
         self.query_sorts = []
@@ -54,6 +58,7 @@ class Models(ABC, ConditionParser):
     def clone(self: Self) -> Self:
         clone = self.blank()
         clone.query_configuration = self.query_configuration
+        clone._stream_batch_size = self._stream_batch_size
         return clone
 
     def blank(self: Self) -> Self:
@@ -270,6 +275,20 @@ class Models(ABC, ConditionParser):
         self._next_page_data = None
         return self
 
+    def stream(self: Self, batch_size: int = 100) -> Self:
+        return self.clone().stream_in_place(batch_size=batch_size)
+
+    def stream_in_place(self: Self, batch_size: int = 100) -> Self:
+        """
+        Switch to streaming mode: records are loaded from the backend in batches as the models are iterated over.
+
+        Use this when iterating over very large result sets (exports, etc...) so that the full set of records
+        is never held in memory at once.  Relationships are still preloaded, one batch at a time.  Pass
+        `batch_size=None` to turn streaming back off.
+        """
+        self._stream_batch_size = batch_size
+        return self
+
     def find(self: Self, where: str) -> Self:
         """Returns the first model where condition"""
         return self.clone().where(where).first()
@@ -282,23 +301,104 @@ class Models(ABC, ConditionParser):
 
     def __iter__(self: Self) -> Iterator[Self]:
         self._next_page_data = {}
+        if self._preloaded_records is not None and not self.must_rexecute:
+            return iter(self._models_for_page(self._preloaded_records))
+
+        if self._stream_batch_size:
+            raw_rows = self._backend.records_iterator(
+                self.query_configuration,
+                self.empty_model(),
+                next_page_data=self._next_page_data,
+                batch_size=self._stream_batch_size,
+            )
+            return self._stream_models(raw_rows, self._stream_batch_size)
+
         raw_rows = self._backend.records(
             self.query_configuration,
             self.empty_model(),
             next_page_data=self._next_page_data,
         )
-        models = iter([self.model(row) for row in raw_rows])
+        return iter(self._models_for_page(raw_rows))
+
+    def _stream_models(self: Self, raw_rows: Iterator[Dict[str, Any]], batch_size: int) -> Iterator[Self]:
+        batch = []
+        for row in raw_rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield from self._models_for_page(batch)
+                batch = []
+        if batch:
+            yield from self._models_for_page(batch)
+
+    def _models_for_page(self: Self, raw_rows: List[Dict[str, Any]]) -> List[Self]:
+        # every model built from the same page of results shares the page, which gives relationship columns
+        # a place to preload related records for all the rows at once (instead of one query per row)
+        page = {"rows": raw_rows, "preloaded": {}}
+        models = []
+        for row in raw_rows:
+            model = self.model(row)
+            model._page = page
+            models.append(model)
+        # this also lets the models convert a column from the backend for the whole page in one pass
+        page["models"] = models
         return models
 
-    def paginate_all(self: Self) -> List[Self]:
-        next_models = self.clone()
-        results = list(next_models.__iter__())
+    def preloaded(self: Self, records: List[Dict[str, Any]]) -> Self:
+        """
+        Returns a copy of the models object that returns the given records instead of querying the backend.
+
+        This is used by relationship columns that load the related records for many models at once.  Changing
+        the query in any way (adding a condition, sorting, etc...) discards the preloaded records, and the next
+        iteration will query the backend as normal.
+        """
+        clone = self.clone()
+        clone._preloaded_records = records
+        clone.must_rexecute = False
+        clone.count = len(records)
+        clone.must_recount = False
+        return clone
+
+    def paginate_all(self: Self) -> Iterator[Self]:
+        """
+        Iterates over every matching model, following the pagination until the backend runs out of pages.
+
+        Each page is streamed (see `stream()`) and the next page is only fetched once the current one has been
+        iterated over, so the full set of records is never held in memory at once.  Wrap it in `list()` if you
+        need all the models at once.
+        """
+        yield from (self.clone() if self._stream_batch_size else self.stream())._paginate()
+
+    def _paginate(self: Self) -> Iterator[Self]:
+        next_models = self
+        yield from next_models
         next_page_data = next_models.next_page_data()
         while next_page_data:
             next_models = next_models.clone().pagination(**next_page_data)
-            results.extend(next_models.__iter__())
+            yield from next_models
             next_page_data = next_models.next_page_data()
-        return results
+
+    def where_in(self: Self, column_name: str, values: List[Any]) -> List[Self]:
+        """
+        Returns all the models where the given column matches any of the values.
+
+        This is for loading records in bulk (e.g. the related records for a whole page of models), so any limit or
+        pagination on the models object is ignored and every page of results is loaded.  The values are checked
+        with a single `IN (...)` condition, but the condition parser splits that list on commas, so any values that
+        contain a comma are looked up one at a time instead.
+        """
+        values = [str(value) for value in values]
+        unbounded = self.clone()
+        unbounded.query_limit = None
+        unbounded.query_pagination = {}
+        conditions = []
+        values_for_list = [value for value in values if "," not in value]
+        if values_for_list:
+            conditions.append(f"{column_name} IN (" + ",".join(values_for_list) + ")")
+        conditions.extend([f"{column_name}={value}" for value in values if "," in value])
+        models = []
+        for condition in conditions:
+            models.extend(unbounded.where(condition)._paginate())
+        return models
 
     def model(self: Self, data) -> Self:
         model = self._build_model()
@@ -317,6 +417,106 @@ class Models(ABC, ConditionParser):
         empty.save(data)
         return empty
 
+    def bulk_create(self: Self, records: List[Dict[str, Any]]) -> List[Self]:
+        """
+        Creates a new record for each data dictionary and returns the new models, in the same order.
+
+        The save hooks of the model and its columns still run for every record, but the records themselves are
+        handed over to the backend all at once, so that it can write them with as few round trips as possible.
+        """
+        models = []
+        prepared = []
+        to_create = []
+        for data in records:
+            if not len(data):
+                raise ValueError("You have to pass in something to save!")
+            model = self.empty_model()
+            [data, to_save, temporary_data] = model._prepare_save(data, model.columns())
+            models.append(model)
+            prepared.append([data, temporary_data])
+            to_create.append(to_save)
+        if not models:
+            return []
+
+        new_records = self._backend.bulk_create(to_create, models[0])
+        for model, [data, temporary_data], new_data in zip(models, prepared, new_records):
+            model._finish_save(data, new_data, temporary_data, {}, model.columns())
+        return models
+
+    def bulk_update(self: Self, records: List[Dict[str, Any]]) -> List[Self]:
+        """
+        Updates many existing records at once and returns the updated models, in the same order.
+
+        Each data dictionary must include the id of the record to update.  The records are loaded with a single
+        query (respecting any conditions already applied to this models object), the save hooks run for each one,
+        and then the changes are handed over to the backend all at once.
+        """
+        id_column_name = self.get_id_column_name()
+        ids = []
+        for data in records:
+            if not data.get(id_column_name):
+                raise ValueError(f"Every record passed to bulk_update must include the id column, '{id_column_name}'")
+            ids.append(data[id_column_name])
+        existing = self._models_by_id(ids, "update")
+
+        models = []
+        prepared = []
+        to_update = []
+        for id, data in zip(ids, records):
+            data = {key: value for (key, value) in data.items() if key != id_column_name}
+            if not len(data):
+                raise ValueError("You have to pass in something to save!")
+            model = existing[str(id)]
+            old_data = model.data
+            [data, to_save, temporary_data] = model._prepare_save(data, model.columns())
+            models.append(model)
+            prepared.append([data, temporary_data, old_data])
+            to_update.append((old_data[id_column_name], to_save))
+        if not models:
+            return []
+
+        new_records = self._backend.bulk_update(to_update, models[0])
+        for model, [data, temporary_data, old_data], new_data in zip(models, prepared, new_records):
+            model._finish_save(data, new_data, temporary_data, old_data, model.columns())
+        return models
+
+    def bulk_delete(self: Self, ids: List[Any]) -> bool:
+        """
+        Deletes the records with the given ids.
+
+        The records are loaded with a single query (respecting any conditions already applied to this models
+        object), the delete hooks run for each one, and the backend deletes them all at once.
+        """
+        existing = self._models_by_id(ids, "delete")
+        models = [existing[str(id)] for id in ids]
+        if not models:
+            return True
+
+        for model in models:
+            model.columns_pre_delete(model.columns())
+            model.pre_delete()
+        self._backend.bulk_delete([model.data[model.id_column_name] for model in models], models[0])
+        for model in models:
+            model.columns_post_delete(model.columns())
+            model.post_delete()
+        return True
+
+    def _models_by_id(self: Self, ids: List[Any], action: str) -> Dict[str, Self]:
+        if not ids:
+            return {}
+        id_column_name = self.get_id_column_name()
+        matching = self.where_in(id_column_name, ids)
+        models = {str(model.get(id_column_name)): model for model in matching}
+        for id in ids:
+            if str(id) not in models:
+                raise ValueError(f"Cannot {action} record with {id_column_name} '{id}' because it does not exist")
+        number_ids = len(set(map(str, ids)))
+        if len(matching) != number_ids:
+            raise ValueError(
+                f"Cannot {action} records: found {len(matching)} records for {number_ids} distinct {id_column_name}s"
+            )
+        return models
+
     def first(self: Self) -> Self:
         iter = self.__iter__()
         try:
@@ -337,6 +537,15 @@ class Models(ABC, ConditionParser):
     def validate_pagination_kwargs(self, kwargs: Dict[str, Any], case_mapping: Callable) -> str:
         return self._backend.validate_pagination_kwargs(kwargs, case_mapping)
 
+    def validate_pagination_sorts(self, kwargs: Dict[str, Any], case_mapping: Callable) -> str:
+        """
+        Checks that the pagination data can be used with the current sorts (e.g. that a keyset pagination token was
+        created for the same sort).  Returns an error message, or an empty string if everything is fine.
+        """
+        return self._backend.validate_pagination_sorts(
+            kwargs, self.query_sorts, self.get_table_name(), self.get_id_column_name(), case_mapping
+        )
+
     def next_page_data(self: Self):
         return self._next_page_data
 
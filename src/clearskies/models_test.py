@@ -44,6 +44,7 @@ class TestModels(unittest.TestCase):
             {
                 "count": MagicMock(return_value=10),
                 "records": MagicMock(return_value=[{"id": 5, "my": "data"}]),
+                "records_iterator": MagicMock(return_value=iter([{"id": 5}, {"id": 6}, {"id": 7}])),
                 "validate_pagination_kwargs": MagicMock(return_value=""),
             },
         )()
@@ -237,3 +238,53 @@ class TestModels(unittest.TestCase):
         )
         self.assertEqual({"start": 5}, call_configuration["pagination"])
         self.assertEqual("users", call_configuration["table_name"])
+
+    def test_stream(self):
+        users = Users(self.backend, self.columns).where("age>5").stream(batch_size=2)
+        pages = [user._page for user in users]
+
+        self.backend.records.assert_not_called()
+        self.backend.records_iterator.assert_called_once()
+        self.assertEqual(2, self.backend.records_iterator.call_args[1]["batch_size"])
+        self.assertEqual(
+            [[{"id": 5}, {"id": 6}], [{"id": 5}, {"id": 6}], [{"id": 7}]], [page["rows"] for page in pages]
+        )
+
+        # streaming mode sticks around when the query is changed
+        self.assertEqual(2, users.where("age<10")._stream_batch_size)
+
+    def test_paginate_all(self):
+        def records_iterator(configuration, model, next_page_data=None, batch_size=100):
+            start = int(configuration["pagination"].get("start", 0))
+            yield from [{"id": id} for id in range(start + 1, min(start + 2, 3) + 1)]
+            if start + 2 < 3:
+                next_page_data["start"] = start + 2
+
+        self.backend.records_iterator = MagicMock(side_effect=records_iterator)
+        users = Users(self.backend, self.columns).limit(2).paginate_all()
+
+        # nothing is loaded until the models are iterated over, and then only one page at a time
+        self.backend.records_iterator.assert_not_called()
+        self.assertEqual(1, next(users).data["id"])
+        self.assertEqual(2, next(users).data["id"])
+        self.assertEqual(1, self.backend.records_iterator.call_count)
+        self.assertEqual([3], [user.data["id"] for user in users])
+        self.assertEqual(2, self.backend.records_iterator.call_count)
+        self.assertEqual({"start": 2}, self.backend.records_iterator.call_args[0][0]["pagination"])
+        self.backend.records.assert_not_called()
+
+    def test_where_in(self):
+        users = Users(self.backend, self.columns).limit(5).pagination(start=10)
+        self.assertEqual(2, len(users.where_in("age", [1, "2", "3,4"])))
+
+        configurations = [call_args[0][0] for call_args in self.backend.records.call_args_list]
+        self.assertEqual(
+            [("IN", ["1", "2"]), ("=", ["3,4"])],
+            [
+                (configuration["wheres"][0]["operator"], configuration["wheres"][0]["values"])
+                for configuration in configurations
+            ],
+        )
+        # every matching record is loaded, regardless of any limit or pagination
+        self.assertEqual([None, None], [configuration["limit"] for configuration in configurations])
+        self.assertEqual([{}, {}], [configuration["pagination"] for configuration in configurations])